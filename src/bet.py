@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from outcome import Outcome
 
 
-@dataclass
+@dataclass(slots=True)
 class Bet:
     """
     :class:`Bet` associates an amount and an :class:`Outcome`. In a future round of design, we can
@@ -22,14 +22,15 @@ class Bet:
 
     def winAmount(self) -> int:
         """
-        Uses the :class:`Outcome`’s **winAmount** to compute the amount won, given the amount of
-        this bet. Note that the amount bet must also be added in. A 1:1 outcome (e.g. a bet on Red)
-        pays the amount bet plus the amount won.
+        Uses the :class:`Outcome`’s **exactWinAmount** to compute the amount won, given the amount
+        of this bet. Note that the amount bet must also be added in. A 1:1 outcome (e.g. a bet on
+        Red) pays the amount bet plus the amount won. The arithmetic is all integer, so payouts
+        at rational odds such as 6:5 are exact.
 
         :return:  amount won
         :rtype: int
         """
-        return int(self.amount + self.outcome.winAmount(float(self.amount)))
+        return self.amount + self.outcome.exactWinAmount(self.amount)
 
     def loseAmount(self) -> int:
         """
@@ -1,3 +1,7 @@
+from functools import cached_property
+from outcome import Outcome
+
+
 class Bin(frozenset):
     """
     :class:`Bin` contains a collection of :class:`Outcome` instances which reflect the winning bets
@@ -7,8 +11,25 @@ class Bin(frozenset):
     “Dozen 1-12” , “Split 1-2” , “Split 1-4” , “Street 1-2-3” , “Corner 1-2-4-5”, “Five Bet”,
     “Line 1-2-3-4-5-6” , “00-0-1-2-3” , “Dozen 1”, “Low” and “Column 1”. These are collected into a
     single :class:`Bin`.
+
+    .. attribute:: mask
+
+        The bitwise or of the :attr:`Outcome.bit` values of every :class:`Outcome` in this
+        :class:`Bin`. It is computed on first use and cached, as a :class:`Bin` never changes;
+        **Wheel.precomputeMasks()** computes it up front for bins shared between threads.
     """
 
-    def __iter__(self):
-        for outcome in super().__iter__():
-            yield outcome
+    @cached_property
+    def mask(self) -> int:
+        """
+        Folds the bits of all the :class:`Outcome` instances in this :class:`Bin` into one
+        **int**.
+
+        :return: the outcome bitmask of this bin
+        :rtype: int
+        """
+        mask = 0
+        outcome: Outcome
+        for outcome in self:
+            mask |= outcome.bit
+        return mask
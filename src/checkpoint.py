@@ -0,0 +1,104 @@
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, Tuple, Union
+from running_statistics import SessionStatistics
+
+
+class Checkpoint:
+    """
+    :class:`Checkpoint` saves the progress of a long **Simulator.gatherCheckpointed()** run to a
+    file, so the run can resume after a crash or pre-emption instead of starting over.
+
+    A checkpoint holds the number of sessions completed, the **Simulator.snapshot()** taken after
+    the last of them, which includes the state of the :class:`Wheel`’s random number generator
+    and of any the :class:`Player` keeps, and the
+    :py:class:`~running_statistics.SessionStatistics` so far. A resumed run therefore plays
+    exactly the sessions the interrupted run would have played.
+
+    Each checkpoint also records the **Simulator.identity()** of its run, so a checkpoint left by
+    a different strategy, parameters or seed is refused rather than silently resumed.
+
+    Each checkpoint is written to a temporary file, flushed to disk and then renamed over the
+    previous one, so the file always holds a complete checkpoint even if the process dies while
+    writing.
+
+    .. attribute:: path
+
+       The :py:class:`~pathlib.Path` of the checkpoint file.
+
+    .. attribute:: interval
+
+       The number of sessions between checkpoints.
+    """
+
+    def __init__(self, path: Union[str, Path], interval: int = 10_000) -> None:
+        """
+        :param path: the checkpoint file.
+        :param interval: the number of sessions between checkpoints.
+        """
+
+        self.path = Path(path)
+        self.interval = interval
+
+    def save(
+        self,
+        identity: str,
+        index: int,
+        snapshot: Tuple[Tuple, Tuple],
+        statistics: SessionStatistics,
+    ) -> None:
+        """
+        Atomically replaces the checkpoint file.
+
+        :param identity: the **Simulator.identity()** of the run.
+        :param index: the number of sessions completed.
+        :param snapshot: a **Simulator.snapshot()** taken after those sessions.
+        :param statistics: the statistics of those sessions.
+        """
+
+        state = {
+            "identity": identity,
+            "index": index,
+            "snapshot": snapshot,
+            "statistics": statistics.asDict(),
+        }
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with temporary.open("wb") as file:
+            pickle.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+    def load(
+        self, identity: str
+    ) -> Optional[Tuple[int, Tuple[Tuple, Tuple], SessionStatistics]]:
+        """
+        Reads the checkpoint file.
+
+        :param identity: the **Simulator.identity()** of the run to resume.
+        :return: the number of sessions completed, the **Simulator.snapshot()** and the
+            statistics saved by **Checkpoint.save()**; or :samp:`None` if there is no checkpoint.
+        :rtype: tuple
+        :raises ValueError: if the checkpoint belongs to a different run.
+        """
+
+        try:
+            with self.path.open("rb") as file:
+                state = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        if state.get("identity") != identity:
+            raise ValueError(f"{self.path} is a checkpoint of a different run")
+        return (
+            state["index"],
+            state["snapshot"],
+            SessionStatistics.fromDict(state["statistics"]),
+        )
+
+    def discard(self) -> None:
+        """
+        Deletes the checkpoint file, if there is one.
+        """
+
+        self.path.unlink(missing_ok=True)
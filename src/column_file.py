@@ -0,0 +1,264 @@
+import json
+import mmap
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+MAGIC = b"\x93NUMPY\x01\x00"
+"""
+The start of every column file: the magic string and version 1.0 of the ``.npy`` format.
+"""
+
+HEADER = 128
+"""
+The length of the header of every column file, in bytes. It is fixed, so the header can be
+rewritten with the final number of rows once they are all written, and a multiple of 64, so
+the data which follows is aligned.
+"""
+
+METADATA = "metadata.json"
+"""
+The name of the file describing the columns and the run.
+"""
+
+
+KINDS = {
+    **dict.fromkeys("bhilq", "i"),
+    **dict.fromkeys("BHILQ", "u"),
+    **dict.fromkeys("fd", "f"),
+}
+"""
+The ``.npy`` kind of each **array** typecode a column may use: signed integers, unsigned
+integers and floating point numbers.
+"""
+
+
+def _descr(typecode: str) -> str:
+    """
+    :return: the ``.npy`` description of the values of an **array** typecode, such as
+        :samp:`"<i4"` for :samp:`"i"` on a little-endian machine.
+    :raises ValueError: if the typecode has no ``.npy`` equivalent.
+    """
+
+    if typecode not in KINDS:
+        raise ValueError(f"typecode {typecode!r} has no .npy equivalent")
+    kind = KINDS[typecode]
+    order = "<" if sys.byteorder == "little" else ">"
+    return f"{order}{kind}{array(typecode).itemsize}"
+
+
+def _header(typecode: str, rows: int) -> bytes:
+    """
+    :return: the **HEADER** bytes of a column of **rows** values.
+    """
+
+    text = f"{{'descr': '{_descr(typecode)}', 'fortran_order': False, 'shape': ({rows},), }}"
+    text = text.ljust(HEADER - len(MAGIC) - 3) + "\n"
+    return MAGIC + len(text).to_bytes(2, "little") + text.encode("latin-1")
+
+
+class ColumnWriter:
+    """
+    :class:`ColumnWriter` writes session results as columns of binary numbers, in a directory
+    holding one file per column and a :samp:`metadata.json` file.
+
+    Each column file is in the ``.npy`` format, so the columns load directly into NumPy, memory
+    mapped, with :samp:`numpy.load(path, mmap_mode="r")`, and :class:`ColumnReader` reads them
+    without NumPy. :samp:`metadata.json` names the columns and their **array** typecodes, gives
+    the number of rows, and holds the metadata of the run, such as its
+    **SimulationSpec.asDict()** and **SessionStatistics.report()**.
+
+    Rows are gathered in one **array** per column and appended to the files whenever **buffer**
+    rows have built up, so results stream to disk during a run with bounded memory. A writer
+    can be passed as the **results** of **SimulationSpec.run()**. Use the writer as a context
+    manager, or call **ColumnWriter.close()**, to complete the headers and write
+    :samp:`metadata.json`.
+
+    .. attribute:: directory
+
+       The :py:class:`~pathlib.Path` of the directory.
+
+    .. attribute:: columns
+
+       A **dict** mapping each column name to its **array** typecode, in row order.
+
+    .. attribute:: metadata
+
+       The metadata of the run; more can be added until the writer is closed.
+
+    .. attribute:: rows
+
+       The number of rows written so far.
+
+    .. attribute:: buffer
+
+       The number of rows gathered before they are appended to the files.
+    """
+
+    buffer = 1 << 16
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        columns: Dict[str, str],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        :param directory: the directory to write; it is created if need be, and any columns
+            already in it are replaced.
+        :param columns: the name and **array** typecode of each column, in row order.
+        :param metadata: the metadata of the run, which must be suitable for JSON.
+        :raises ValueError: if a typecode is not one of **KINDS**.
+        """
+
+        for typecode in columns.values():
+            _descr(typecode)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / METADATA).unlink(missing_ok=True)
+        self.columns = dict(columns)
+        self.metadata = dict(metadata or {})
+        self.rows = 0
+        self.pending: List["array[Any]"] = [
+            array(typecode) for typecode in self.columns.values()
+        ]
+        self.files = [
+            (self.directory / f"{name}.npy").open("wb") for name in self.columns
+        ]
+        for file, typecode in zip(self.files, self.columns.values()):
+            file.write(_header(typecode, 0))
+
+    def append(self, row: Sequence[Union[int, float]]) -> None:
+        """
+        Adds one row.
+
+        :param row: a value for each column, in the order of **columns**.
+        :raises ValueError: if the row does not have one value per column.
+        """
+
+        if len(row) != len(self.columns):
+            raise ValueError(f"a row needs {len(self.columns)} values, not {len(row)}")
+        for values, value in zip(self.pending, row):
+            values.append(value)
+        self.rows += 1
+        if len(self.pending[0]) >= self.buffer:
+            self.flush()
+
+    def extend(self, rows: Iterable[Sequence[Union[int, float]]]) -> None:
+        """
+        Adds many rows.
+
+        :param rows: the rows, each with a value for each column.
+        """
+
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        """
+        Appends the gathered rows to the files.
+        """
+
+        for file, values in zip(self.files, self.pending):
+            values.tofile(file)
+            del values[:]
+
+    def close(self) -> None:
+        """
+        Writes the remaining rows, the final headers and :samp:`metadata.json`.
+        """
+
+        if self.files[0].closed:
+            return
+        self.flush()
+        for file, typecode in zip(self.files, self.columns.values()):
+            file.seek(0)
+            file.write(_header(typecode, self.rows))
+            file.close()
+        with (self.directory / METADATA).open("w", encoding="utf-8") as description:
+            json.dump(
+                {"columns": self.columns, "rows": self.rows, "metadata": self.metadata},
+                description,
+                allow_nan=False,
+            )
+
+    def __enter__(self) -> "ColumnWriter":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.close()
+
+
+class ColumnReader:
+    """
+    :class:`ColumnReader` reads the columns written by a :class:`ColumnWriter` without copying
+    them: each column file is memory-mapped, and **ColumnReader.column()** is a
+    :py:class:`memoryview` of its numbers, which the operating system pages in only as they are
+    read. Opening a directory of any size costs only the reading of its metadata.
+
+    Release every view taken from the reader before closing it. The reader is a context manager.
+
+    .. attribute:: columns
+
+       A **dict** mapping each column name to its **array** typecode.
+
+    .. attribute:: rows
+
+       The number of rows.
+
+    .. attribute:: metadata
+
+       The metadata of the run.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        :param directory: a directory written by a :class:`ColumnWriter`.
+        :raises ValueError: if a column file is not the one :samp:`metadata.json` describes.
+        """
+
+        directory = Path(directory)
+        with (directory / METADATA).open(encoding="utf-8") as file:
+            description = json.load(file)
+        self.columns: Dict[str, str] = description["columns"]
+        self.rows: int = description["rows"]
+        self.metadata: Dict[str, Any] = description["metadata"]
+        self.maps: List[mmap.mmap] = []
+        self.views: Dict[str, memoryview] = {}
+        for name, typecode in self.columns.items():
+            with (directory / f"{name}.npy").open("rb") as file:
+                column = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.maps.append(column)
+            size = HEADER + self.rows * array(typecode).itemsize
+            if column[:HEADER] != _header(typecode, self.rows) or len(column) != size:
+                self.close()
+                raise ValueError(f"{name}.npy does not match {METADATA}")
+            self.views[name] = memoryview(column)[HEADER:].cast(typecode)
+
+    def column(self, name: str) -> memoryview:
+        """
+        :param name: the name of a column.
+        :return: the values of the column.
+        :rtype: :py:class:`memoryview`
+        """
+
+        return self.views[name]
+
+    def close(self) -> None:
+        """
+        Releases the maps of the column files.
+        """
+
+        for view in self.views.values():
+            view.release()
+        for column in self.maps:
+            column.close()
+        self.views = {}
+        self.maps = []
+
+    def __enter__(self) -> "ColumnReader":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.close()
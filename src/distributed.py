@@ -0,0 +1,308 @@
+import argparse
+import json
+import socket
+import socketserver
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from wheel import Wheel
+from simulation_spec import SimulationSpec, buildWheel
+from running_statistics import SessionStatistics
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    """
+    The TCP server of a :class:`Coordinator`, with one thread per connected worker.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int], coordinator: "Coordinator") -> None:
+        super().__init__(address, _Handler)
+        self.coordinator = coordinator
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """
+    Serves one worker connection: hands out a range of sessions for each message received, and
+    collects the statistics of the previous range. A range still held when the connection drops
+    or goes quiet for **Coordinator.lease** seconds is handed to another worker.
+    """
+
+    server: _Server
+
+    def handle(self) -> None:
+        coordinator = self.server.coordinator
+        self.connection.settimeout(coordinator.lease)
+        held: Optional[int] = None
+        try:
+            for line in self.rfile:
+                message = json.loads(line)
+                if held is not None and message.get("start") == held:
+                    statistics = SessionStatistics.fromDict(message["statistics"])
+                    coordinator.complete(held, statistics)
+                    held = None
+                reply: Dict[str, Any] = {"done": True}
+                lease = (
+                    coordinator.assign() if held is None else coordinator.rangeAt(held)
+                )
+                if lease is not None:
+                    held = lease[0]
+                    reply = {
+                        "spec": coordinator.spec.asDict(),
+                        "start": lease[0],
+                        "count": lease[1],
+                    }
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+                if held is None:
+                    break
+        except (OSError, ValueError):
+            pass
+        finally:
+            if held is not None:
+                coordinator.release(held)
+
+
+class Coordinator:
+    """
+    :class:`Coordinator` spreads the sessions of a :py:class:`~simulation_spec.SimulationSpec`
+    over :class:`Worker` processes on any number of machines, using plain TCP.
+
+    The sessions are cut into ranges of **chunk** sessions. Each worker connects, receives the
+    spec and a range, runs it, and sends back the range’s
+    :py:class:`~running_statistics.SessionStatistics` with its request for the next one. Every
+    session is seeded from its index by **SimulationSpec.sessionSeed()**, so a range gives the same
+    result on whichever worker runs it. If a worker disconnects or stays silent for **lease**
+    seconds while holding a range, the range is handed out again.
+
+    Messages are single lines of JSON. A worker sends :samp:`{}` first, then
+    :samp:`{"start": ..., "statistics": ...}` for each range it finishes. The coordinator answers
+    each with :samp:`{"spec": ..., "start": ..., "count": ...}`, or :samp:`{"done": true}` once
+    every range is finished.
+
+    .. attribute:: spec
+
+       The simulation to run.
+
+    .. attribute:: chunk
+
+       The number of sessions in each range.
+
+    .. attribute:: server
+
+       The listening server. Workers connect to its **server_address**.
+
+    .. attribute:: pending
+
+       The starts of the ranges waiting for a worker.
+
+    .. attribute:: results
+
+       A **dict** mapping the start of each finished range to its statistics.
+
+    .. attribute:: condition
+
+       Guards **pending** and **results**, and wakes waiting workers when they change.
+
+    .. attribute:: reissued
+
+       The number of ranges handed out again after their worker was lost.
+
+    .. attribute:: lease
+
+       The seconds a worker may hold a range without a word before it is considered dead.
+    """
+
+    lease = 600.0
+
+    def __init__(
+        self,
+        spec: SimulationSpec,
+        chunk: int = 1000,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+    ) -> None:
+        """
+        Starts listening, so workers can connect before **Coordinator.run()** is called.
+
+        :param spec: the simulation to run.
+        :param chunk: the number of sessions in each range.
+        :param address: the host and port to listen on; port 0 picks a free port.
+        """
+
+        self.spec = spec
+        self.chunk = chunk
+        self.server = _Server(address, self)
+        self.pending: Deque[int] = deque(range(0, spec.samples, chunk))
+        self.results: Dict[int, SessionStatistics] = {}
+        self.condition = threading.Condition()
+        self.reissued = 0
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """
+        The host and port workers should connect to.
+        """
+
+        host, port = self.server.server_address[:2]
+        return str(host), int(port)
+
+    def finished(self) -> bool:
+        """
+        :return: :samp:`True` once every range has its statistics.
+        :rtype: bool
+        """
+
+        return len(self.results) * self.chunk >= self.spec.samples
+
+    def assign(self) -> Optional[Tuple[int, int]]:
+        """
+        Takes the next range for a worker. When every range is handed out but some are not yet
+        finished, this waits, since a lost worker’s range may come back.
+
+        :return: the start and the number of sessions of the range, or :samp:`None` when all are
+            finished.
+        :rtype: tuple
+        """
+
+        with self.condition:
+            self.condition.wait_for(lambda: self.pending or self.finished())
+            if not self.pending:
+                return None
+            return self.rangeAt(self.pending.popleft())
+
+    def rangeAt(self, start: int) -> Tuple[int, int]:
+        """
+        :param start: the start of a range.
+        :return: the start and the number of sessions of the range.
+        :rtype: tuple
+        """
+
+        return start, min(self.chunk, self.spec.samples - start)
+
+    def complete(self, start: int, statistics: SessionStatistics) -> None:
+        """
+        Records the statistics of a finished range.
+
+        :param start: the start of the range.
+        :param statistics: the statistics of its sessions.
+        """
+
+        with self.condition:
+            self.results[start] = statistics
+            self.condition.notify_all()
+
+    def release(self, start: int) -> None:
+        """
+        Puts back the range of a lost worker, to be handed out again.
+
+        :param start: the start of the range.
+        """
+
+        with self.condition:
+            if start not in self.results:
+                self.pending.appendleft(start)
+                self.reissued += 1
+                self.condition.notify_all()
+
+    def run(self) -> SessionStatistics:
+        """
+        Serves workers until every range is finished, then stops listening.
+
+        :return: the statistics of every session, merged in the order of the ranges.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        """
+
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        with self.condition:
+            self.condition.wait_for(self.finished)
+        self.server.shutdown()
+        self.server.server_close()
+        thread.join()
+        total = SessionStatistics()
+        for start in sorted(self.results):
+            total.merge(self.results[start])
+        return total
+
+
+class Worker:
+    """
+    :class:`Worker` connects to a :class:`Coordinator` and runs ranges of sessions until there are
+    none left. It builds its :class:`Wheel` once, however many ranges it runs.
+
+    .. attribute:: address
+
+       The host and port of the coordinator.
+
+    .. attribute:: wheel
+
+       The built wheel shared by every range.
+    """
+
+    def __init__(self, address: Tuple[str, int]) -> None:
+        """
+        :param address: the host and port of the coordinator.
+        """
+
+        self.address = address
+        self.wheel: Wheel = buildWheel()
+
+    def run(self) -> int:
+        """
+        Runs ranges until the coordinator reports it is done or goes away.
+
+        :return: the number of ranges run
+        :rtype: int
+        """
+
+        ranges = 0
+        message: Dict[str, Any] = {}
+        with socket.create_connection(self.address) as connection:
+            with connection.makefile("rwb") as stream:
+                while True:
+                    stream.write(json.dumps(message).encode() + b"\n")
+                    stream.flush()
+                    line = stream.readline()
+                    if not line:
+                        return ranges
+                    reply = json.loads(line)
+                    if reply.get("done"):
+                        return ranges
+                    spec = SimulationSpec.fromDict(reply["spec"])
+                    statistics = spec.run(self.wheel, reply["start"], reply["count"])
+                    message = {
+                        "start": reply["start"],
+                        "statistics": statistics.asDict(),
+                    }
+                    ranges += 1
+
+
+def runWorker(host: str, port: int) -> int:
+    """
+    Runs a :class:`Worker`; a convenient target for a new process.
+
+    :param host: the host of the coordinator.
+    :param port: the port of the coordinator.
+    :return: the number of ranges run
+    :rtype: int
+    """
+
+    return Worker((host, port)).run()
+
+
+def main() -> None:  # pragma: no cover
+    """
+    Runs a :class:`Worker` against the coordinator named on the command line, as in
+    ``python distributed.py HOST PORT``.
+    """
+
+    parser = argparse.ArgumentParser(description="Run a roulette simulation worker.")
+    parser.add_argument("host", help="the host of the coordinator")
+    parser.add_argument("port", type=int, help="the port of the coordinator")
+    arguments = parser.parse_args()
+    print("ranges run:", runWorker(arguments.host, arguments.port))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,5 +1,7 @@
+from typing import Callable, Optional, Tuple
 from wheel import Wheel
 from table import Table
+from bin import Bin
 from players.player import Player
 
 
@@ -23,6 +25,11 @@ class Game:
 
        The :class:`Player` object which creates :class:`Bet` instances at the :class:`Table` object.
 
+    .. attribute:: bound
+
+       The :class:`Player` bound by **Game.bind()** followed by the bound methods
+       **Game.fastCycle()** calls for it, or :samp:`None` before the first binding.
+
     """
 
     def __init__(self, wheel: Wheel, table: Table) -> None:
@@ -35,6 +42,7 @@ class Game:
 
         self.wheel = wheel
         self.table = table
+        self.bound: Optional[Tuple] = None
 
     def cycle(self, player: Player) -> None:
         """
@@ -45,7 +53,8 @@ class Game:
 
         1. Call **Player.placeBets()** method to create bets.
         2. Call **Wheel.choose()** method to get the next winning :class:`Bin` object.
-        3. Call **iter()** on the :class:`table` to get all of the :class:`Bet` instances.
+        3. Notify the :class:`Player` of the winning :class:`Bin` with **Game.notify()**.
+        4. Call **iter()** on the :class:`table` to get all of the :class:`Bet` instances.
            For each :class:`Bet` instance, if the winning :class:`Bin` contains the
            :class:`Outcome`, call **Player.win()** method, otherwise, call the
            **Player.lose()** method.
@@ -53,9 +62,91 @@ class Game:
 
         player.placeBets()
         winning_bin = self.wheel.choose()
-        player.winners(set(winning_bin))
+        self.notify(player, winning_bin)
         for bet in self.table:
             if bet.outcome in winning_bin:
                 player.win(bet)
             else:
                 player.lose(bet)
+
+    @staticmethod
+    def notify(player: Player, winning_bin: Bin) -> None:
+        """
+        :param player: the individual player to notify of the winning outcomes.
+        :param winning_bin: the winning :class:`Bin` object.
+
+        Tells the :class:`Player` object about the winning :class:`Bin` using the cheapest
+        notification it understands. A player overriding **Player.winnersMask()** gets the
+        precomputed bitmask of the :class:`Bin`, a player overriding only **Player.winners()** gets
+        a **set** of :class:`Outcome` instances, and any other player is not notified at all.
+        """
+
+        player_class = type(player)
+        if player_class.winnersMask is not Player.winnersMask:
+            player.winnersMask(winning_bin.mask)
+        elif player_class.winners is not Player.winners:
+            player.winners(set(winning_bin))
+
+    def bind(self, player: Player) -> Tuple:
+        """
+        :param player: the individual player for the coming session.
+        :return: the new value of **bound**.
+
+        Looks up, once per session, every bound method **Game.fastCycle()** needs: the player's
+        **tryPlaceBets()**, **win()** and **lose()**, the wheel's **choose()** and the player's
+        winners notification chosen as in **Game.notify()**. Rebinding is needed if any of
+        them is replaced during the session.
+        """
+
+        winners_mask: Optional[Callable[[int], None]] = None
+        winners: Optional[Callable] = None
+        player_class = type(player)
+        if player_class.winnersMask is not Player.winnersMask:
+            winners_mask = player.winnersMask
+        elif player_class.winners is not Player.winners:
+            winners = player.winners
+        self.bound = (
+            player,
+            player.tryPlaceBets,
+            self.wheel.choose,
+            player.win,
+            player.lose,
+            winners_mask,
+            winners,
+        )
+        return self.bound
+
+    def fastCycle(self, player: Player) -> bool:
+        """
+        :param player: the individual player that places bets, receives winnings and pays losses.
+
+        The same single cycle of play as **Game.cycle()**, without allocating any objects of its
+        own. It calls the methods cached by **Game.bind()**, binding the player first if needed,
+        passes the winning :class:`Bin`’s cached mask instead of a **set** copy, and iterates the
+        table’s **list** of bets directly.
+
+        Bets are placed with **Player.tryPlaceBets()**. If the table refuses them, the wheel is not
+        spun and :samp:`False` is returned instead of raising :class:`InvalidBet`.
+
+        :return: :samp:`True` if the cycle was played.
+        :rtype: bool
+        """
+
+        bound = self.bound
+        if bound is None or bound[0] is not player:
+            bound = self.bind(player)
+        _, place_bets, choose, win, lose, winners_mask, winners = bound
+
+        if not place_bets():
+            return False
+        winning_bin = choose()
+        if winners_mask is not None:
+            winners_mask(winning_bin.mask)
+        elif winners is not None:
+            winners(set(winning_bin))
+        for bet in self.table.bets:
+            if bet.outcome in winning_bin:
+                win(bet)
+            else:
+                lose(bet)
+        return True
@@ -0,0 +1,328 @@
+import math
+from bisect import bisect
+from itertools import accumulate
+from typing import Callable, Dict, Optional, Sequence
+from bin import Bin
+from wheel import Wheel
+from simulation_spec import SimulationSpec
+
+
+class TiltedWheel(Wheel):
+    """
+    :class:`TiltedWheel` is a :class:`Wheel` whose bins come up with chosen probabilities
+    instead of 1/38 each, for importance sampling: spinning towards the outcomes which make a
+    rare event happen, such as the long losing streaks that take a
+    :class:`~players.martingale.Martingale` player to the table limit, so the event is seen in
+    thousands of sessions rather than billions.
+
+    To keep the estimates unbiased, the wheel keeps the likelihood ratio of the spins since
+    **TiltedWheel.resetWeight()**: the product, over those spins, of the fair probability of the
+    bin chosen divided by its tilted probability. Weighting each session by the ratio of its
+    spins makes the weighted average of any function of the sessions an unbiased estimate of
+    its plain average on a fair wheel. The ratio is kept as a sum of logarithms, so long
+    sessions neither overflow nor underflow it.
+
+    The wheel shares the **bins** and outcomes of a built wheel, like **Wheel.clone()**, and has
+    its own **rng**. Every bin needs a probability above 0; a bin which never comes up would make
+    the sessions which need it impossible to estimate.
+
+    .. attribute:: probabilities
+
+       The probability of each bin, in bin order.
+
+    .. attribute:: cumulative
+
+       The running sums of **probabilities**, for choosing a bin with one random number.
+
+    .. attribute:: logRatios
+
+       The logarithm of the fair probability of each bin divided by its tilted probability.
+
+    .. attribute:: logWeight
+
+       The logarithm of the likelihood ratio of the spins since the last
+       **TiltedWheel.resetWeight()**.
+    """
+
+    def __init__(self, wheel: Wheel, probabilities: Sequence[float]) -> None:
+        """
+        :param wheel: a built wheel.
+        :param probabilities: the probability of each bin, in bin order.
+        :raises ValueError: if there is not one positive probability per bin, or they do not
+            add up to 1.
+        """
+
+        super().__init__()
+        if len(probabilities) != len(wheel.bins) or min(probabilities) <= 0:
+            raise ValueError("each bin needs a probability above 0")
+        if not math.isclose(math.fsum(probabilities), 1.0):
+            raise ValueError("the probabilities must add up to 1")
+        wheel.precomputeMasks()
+        self.bins = wheel.bins
+        self.all_outcomes = wheel.all_outcomes
+        self.probabilities = list(probabilities)
+        self.cumulative = list(accumulate(self.probabilities))
+        fair = 1 / len(self.bins)
+        self.logRatios = [math.log(fair / probability) for probability in probabilities]
+        self.logWeight = 0.0
+
+    @classmethod
+    def towards(cls, wheel: Wheel, name: str, probability: float) -> "TiltedWheel":
+        """
+        Tilts a wheel so that the bins holding an :class:`Outcome` come up together with the
+        given probability, each as often as the others in its group; so do the bins without it.
+        For example, :samp:`TiltedWheel.towards(wheel, "Black", 0.3)` makes a player betting
+        on black lose far more often than the fair 20 times in 38.
+
+        :param wheel: a built wheel.
+        :param name: the name of an :class:`Outcome`.
+        :param probability: the probability that a spin wins the outcome.
+        :return: the tilted wheel
+        :rtype: :class:`TiltedWheel`
+        """
+
+        outcome = wheel.getOutcome(name)
+        winning = [outcome in bin for bin in wheel.bins]
+        count = sum(winning)
+        return cls(
+            wheel,
+            [
+                probability / count
+                if wins
+                else (1 - probability) / (len(winning) - count)
+                for wins in winning
+            ],
+        )
+
+    def choose(self) -> Bin:
+        """
+        Chooses a bin with the tilted probabilities and adds its log ratio to **logWeight**.
+
+        :return: the chosen bin.
+        :rtype: :class:`Bin`
+        """
+
+        index = min(
+            bisect(self.cumulative, self.rng.random() * self.cumulative[-1]),
+            len(self.bins) - 1,
+        )
+        self.logWeight += self.logRatios[index]
+        return self.bins[index]
+
+    def clone(self) -> "TiltedWheel":
+        """
+        Creates a wheel with the same bins and tilt but its own **rng** and **logWeight**.
+
+        :return: the new wheel
+        :rtype: :class:`TiltedWheel`
+        """
+
+        return TiltedWheel(self, self.probabilities)
+
+    def weight(self) -> float:
+        """
+        :return: the likelihood ratio of the spins since the last
+            **TiltedWheel.resetWeight()**.
+        :rtype: float
+        """
+
+        return math.exp(self.logWeight)
+
+    def resetWeight(self) -> None:
+        """
+        Starts a new likelihood ratio, before a session.
+        """
+
+        self.logWeight = 0.0
+
+
+class WeightedEstimate:
+    """
+    :class:`WeightedEstimate` accumulates the weighted values of sessions run on a
+    :class:`TiltedWheel`, and estimates their mean on a fair wheel.
+
+    **WeightedEstimate.mean()** is the average of weight times value, which is unbiased.
+    **WeightedEstimate.effectiveSampleSize()** tells how many plain sessions the weighted ones
+    are worth: it is the number of sessions when all weights are equal, and falls as a few
+    large weights come to dominate, which means the tilt is too strong or in the wrong
+    direction, and the estimate and its standard error cannot be trusted.
+
+    Accumulators can be merged, so each worker of a parallel run can keep its own.
+
+    .. attribute:: sessions
+
+       The number of sessions.
+
+    .. attribute:: weights
+
+       The sum of the weights.
+
+    .. attribute:: squaredWeights
+
+       The sum of the squared weights.
+
+    .. attribute:: weighted
+
+       The sum of weight times value.
+
+    .. attribute:: squaredWeighted
+
+       The sum of the squares of weight times value.
+    """
+
+    def __init__(self) -> None:
+        self.sessions = 0
+        self.weights = 0.0
+        self.squaredWeights = 0.0
+        self.weighted = 0.0
+        self.squaredWeighted = 0.0
+
+    def add(self, value: float, weight: float) -> None:
+        """
+        Includes one session.
+
+        :param value: the value of the session, such as 1 if the rare event happened and 0 if
+            not.
+        :param weight: the likelihood ratio of the session’s spins.
+        """
+
+        self.sessions += 1
+        self.weights += weight
+        self.squaredWeights += weight * weight
+        self.weighted += weight * value
+        self.squaredWeighted += (weight * value) ** 2
+
+    def merge(self, other: "WeightedEstimate") -> None:
+        """
+        Includes the sessions of another :class:`WeightedEstimate`.
+
+        :param other: the accumulator to merge into this one.
+        """
+
+        self.sessions += other.sessions
+        self.weights += other.weights
+        self.squaredWeights += other.squaredWeights
+        self.weighted += other.weighted
+        self.squaredWeighted += other.squaredWeighted
+
+    def mean(self) -> float:
+        """
+        :return: the unbiased estimate of the mean value on a fair wheel.
+        :rtype: float
+        """
+
+        return self.weighted / self.sessions if self.sessions else math.nan
+
+    def standardError(self) -> float:
+        """
+        :return: the standard error of **WeightedEstimate.mean()**, from the sample variance of
+            weight times value.
+        :rtype: float
+        """
+
+        if self.sessions < 2:
+            return math.inf
+        variance = (self.squaredWeighted - self.sessions * self.mean() ** 2) / (
+            self.sessions - 1
+        )
+        return math.sqrt(max(variance, 0.0) / self.sessions)
+
+    def selfNormalizedMean(self) -> float:
+        """
+        :return: the weighted average of the values, divided by the sum of the weights rather
+            than the number of sessions. It is biased, but often has the smaller error when
+            the weights vary a great deal.
+        :rtype: float
+        """
+
+        return self.weighted / self.weights if self.weights else math.nan
+
+    def effectiveSampleSize(self) -> float:
+        """
+        :return: the effective sample size, the squared sum of the weights over the sum of
+            their squares.
+        :rtype: float
+        """
+
+        return self.weights**2 / self.squaredWeights if self.squaredWeights else 0.0
+
+    def report(self) -> Dict[str, float]:
+        """
+        :return: the number of sessions, **WeightedEstimate.mean()**, its standard error, the
+            self-normalized mean and the effective sample size, as a flat **dict**.
+        :rtype: dict
+        """
+
+        return {
+            "sessions": self.sessions,
+            "mean": self.mean(),
+            "standard_error": self.standardError(),
+            "self_normalized_mean": self.selfNormalizedMean(),
+            "effective_sample_size": self.effectiveSampleSize(),
+        }
+
+
+class ImportanceSampler:
+    """
+    :class:`ImportanceSampler` estimates how often an event happens in the sessions of a
+    :py:class:`~simulation_spec.SimulationSpec` on a fair wheel, by running them on a
+    :class:`TiltedWheel` and weighting each by its likelihood ratio. For example, the chance
+    that a :class:`~players.martingale.Martingale` session with a stake of 1000 ends before its
+    50 rounds, at the table limit or out of money, spinning black less often to make the losing
+    streaks which end it more common::
+
+        wheel = TiltedWheel.towards(buildWheel(), "Black", 0.42)
+        spec = SimulationSpec(Martingale, stake=1000, duration=50, samples=4000)
+        ImportanceSampler(spec, wheel).run(lambda stakes: len(stakes) < 50).report()
+
+    Sessions are seeded from their index, as by **SimulationSpec.sessions()**, so chunks of a
+    run can be estimated anywhere and their :class:`WeightedEstimate` merged.
+
+    The :samp:`"fast"` engine draws a whole session’s spins at once, even for a session which
+    ends early, and the spins after its end count towards its weight. The estimate stays
+    unbiased, but the weights vary more, so the :samp:`"object"` engine usually gives the
+    larger effective sample size.
+
+    .. attribute:: spec
+
+       The simulation.
+
+    .. attribute:: wheel
+
+       The tilted wheel its sessions are run on.
+    """
+
+    def __init__(self, spec: SimulationSpec, wheel: TiltedWheel) -> None:
+        """
+        :param spec: the simulation.
+        :param wheel: the tilted wheel to run its sessions on.
+        """
+
+        self.spec = spec
+        self.wheel = wheel
+
+    def run(
+        self,
+        event: Callable[[Sequence[int]], float],
+        start: int = 0,
+        count: Optional[int] = None,
+    ) -> WeightedEstimate:
+        """
+        Runs the sessions with indexes **start** to **start** + **count**, or to **samples**
+        when no count is given.
+
+        :param event: the value of a session from its stake values: 1 or :samp:`True` if the
+            event happened and 0 or :samp:`False` if not, or any other number to estimate its
+            mean.
+        :param start: the index of the first session.
+        :param count: the number of sessions.
+        :return: the weighted values of the sessions.
+        :rtype: :class:`WeightedEstimate`
+        """
+
+        estimate = WeightedEstimate()
+        self.wheel.resetWeight()
+        for _, stake_values in self.spec.sessions(self.wheel, start, count):
+            estimate.add(float(event(stake_values)), self.wheel.weight())
+            self.wheel.resetWeight()
+        return estimate
@@ -1,7 +1,9 @@
+import threading
 from dataclasses import dataclass
+from typing import ClassVar, Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outcome:
     """
     :class:`Outcome` contains a single outcome on which a bet can be placed.
@@ -21,22 +23,110 @@ class Outcome:
 
     .. attribute:: odds
 
-        Holds the payout odds for this Outcome. Most odds are stated as 1:1 or 17:1, we only keep
-        the numerator (17) and assume the denominator is 1.
+        Holds the payout odds for this Outcome. Most odds are stated as 1:1 or 17:1, where this
+        is the numerator (17) and the **denominator** is 1.
+
+    .. attribute:: denominator
+
+        The denominator of the payout odds. It defaults to 1; rational odds such as 6:5 keep 6 in
+        **odds** and 5 here, so payouts are computed with exact integer arithmetic.
+
+    .. attribute:: bits
+
+        Class-level registry mapping each :class:`Outcome` name to a single bit. A :class:`Bin`
+        folds the bits of its outcomes into one **int** mask, so a :class:`Player` watching for
+        an outcome can test a winning :class:`Bin` with a single ``&``. New names are added
+        under a lock, so threads never hand the same bit to two names.
+
+    .. attribute:: interned
+
+        Class-level intern table mapping each name to its canonical :class:`Outcome` instance.
+        See :meth:`Outcome.intern`.
 
     """
 
+    bits: ClassVar[Dict[str, int]] = {}
+    bitsLock: ClassVar[threading.Lock] = threading.Lock()
+    interned: ClassVar[Dict[str, "Outcome"]] = {}
+
     name: str
     odds: int
+    denominator: int = 1
+
+    @classmethod
+    def intern(cls, name: str, odds: int, denominator: int = 1) -> "Outcome":
+        """
+        Returns the canonical :class:`Outcome` with the given name and odds, creating it on first
+        use. The :class:`Wheel` interns every :class:`Outcome` it is given, so a :class:`Player`
+        interning a well-known name such as :samp:`"Red"` shares the wheel's instance, and
+        equality checks between them succeed on identity alone.
+
+        If the name is already interned with different odds, the new :class:`Outcome` replaces
+        the old one in the table.
+
+        :param name: the name of the :class:`Outcome`
+        :param odds: the payout odds of the :class:`Outcome`
+        :param denominator: the denominator of the payout odds
+        :return: the canonical :class:`Outcome` instance
+        :rtype: :class:`Outcome`
+        """
+        outcome = cls.interned.get(name)
+        if outcome is None or (outcome.odds, outcome.denominator) != (
+            odds,
+            denominator,
+        ):
+            outcome = cls.interned[name] = cls(name, odds, denominator)
+        return outcome
+
+    @classmethod
+    def bitFor(cls, name: str) -> int:
+        """
+        Returns the bit assigned to the :class:`Outcome` with the given name. Bits are handed out
+        in the order names are first seen, so the same name always maps to the same bit.
+
+        :param name: the name of an :class:`Outcome`
+        :return: an **int** with exactly one bit set
+        :rtype: int
+        """
+        bit = cls.bits.get(name)
+        if bit is None:
+            with cls.bitsLock:
+                bit = cls.bits.setdefault(name, 1 << len(cls.bits))
+        return bit
+
+    @property
+    def bit(self) -> int:
+        """
+        The bit assigned to this :class:`Outcome`'s name. See :meth:`Outcome.bitFor`.
+
+        :rtype: int
+        """
+        return Outcome.bitFor(self.name)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares name and odds, succeeding at once when both sides are the same instance.
+
+        :rtype: bool
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Outcome):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.odds == other.odds
+            and self.denominator == other.denominator
+        )
 
     def __str__(self) -> str:
         """
         Easy-to-read representation of outcome instances.
 
-        :return: String of the form *name (odds*:1).
+        :return: String of the form *name (odds*:*denominator*).
         :rtype: str
         """
-        return f"{self.name:s} ({self.odds:d}:1)"
+        return f"{self.name:s} ({self.odds:d}:{self.denominator:d})"
 
     def winAmount(self, amount: float) -> float:
         """
@@ -45,4 +135,23 @@ class Outcome:
         :param amount: amount being bet
         :type amount: float
         """
-        return self.odds * amount
+        if self.denominator == 1:
+            return self.odds * amount
+        return self.odds * amount / self.denominator
+
+    def exactWinAmount(self, amount: int) -> int:
+        """
+        The integer form of **Outcome.winAmount()**, used to settle bets. For the common N:1 odds
+        this is a single integer multiplication. Rational odds multiply by the numerator and
+        floor-divide by the denominator, so a 6:5 payout on 7 is exactly 8; any fraction of a
+        unit is kept by the house, as at a real table. No float or :class:`fractions.Fraction`
+        is involved.
+
+        :param amount: amount being bet
+        :type amount: int
+        :return: amount won, not including the amount bet
+        :rtype: int
+        """
+        if self.denominator == 1:
+            return self.odds * amount
+        return self.odds * amount // self.denominator
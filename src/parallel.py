@@ -0,0 +1,231 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict, Optional, Set, Tuple
+from wheel import Wheel
+from simulation_spec import SimulationSpec, buildWheel
+from running_statistics import SessionStatistics
+
+_wheel: Optional[Wheel] = None
+_local = threading.local()
+
+
+def freeThreaded() -> bool:
+    """
+    :return: :samp:`True` when running on a free-threaded build of Python with the global
+        interpreter lock disabled, so threads can run simulations in parallel.
+    :rtype: bool
+    """
+
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _initWorker() -> None:
+    """
+    Builds the :class:`Wheel` once in each worker process.
+    """
+
+    global _wheel  # pylint: disable=global-statement
+    _wheel = buildWheel()
+
+
+def _runChunk(
+    spec: SimulationSpec, start: int, count: int
+) -> Tuple[int, SessionStatistics]:
+    """
+    Runs one chunk of sessions in a worker process.
+
+    :return: the worker's process id and the statistics of the chunk
+    """
+
+    assert _wheel is not None
+    return os.getpid(), spec.run(_wheel, start, count)
+
+
+def _runChunkInThread(
+    spec: SimulationSpec, wheel: Wheel, start: int, count: int
+) -> Tuple[int, SessionStatistics]:
+    """
+    Runs one chunk of sessions in a worker thread, on the thread's own clone of the wheel.
+
+    :return: the worker thread's identifier and the statistics of the chunk
+    """
+
+    if getattr(_local, "wheel", None) is None:
+        _local.wheel = wheel.clone()
+    return threading.get_ident(), spec.run(_local.wheel, start, count)
+
+
+class Scheduler:
+    """
+    :class:`Scheduler` runs the sessions of a :py:class:`~simulation_spec.SimulationSpec` across
+    a pool of worker processes with dynamic scheduling.
+
+    Session lengths vary a great deal: a :class:`~players.martingale.Martingale` session can end
+    after a handful of spins while a :class:`~players.passenger57.Passenger57` session always
+    plays the full duration. Splitting the sessions into one static share per worker leaves the
+    workers with short sessions idle while the others finish. Instead, the sessions are cut into
+    small chunks of **chunk** sessions, and each worker takes the next chunk as soon as it is
+    done with its last, so all workers stay busy until the queue runs dry. Only a few chunks per
+    worker are queued at a time, so the number of sessions can be very large.
+
+    Each chunk returns its own :py:class:`~running_statistics.SessionStatistics`; these are merged
+    into one accumulator per worker, and those into the total. Since every session is seeded from
+    its index, the result does not depend on which worker ran which chunk.
+
+    On a free-threaded build of Python, the workers can be threads instead, which need no
+    pickling and no copy of the :class:`Wheel` per process. Each chunk builds its own
+    :class:`Table` and :class:`Player`, and each thread spins its own **Wheel.clone()** of the
+    one wheel built in this process, so nothing mutable is shared. With the global interpreter
+    lock enabled, threads would take turns rather than run in parallel, so the scheduler falls
+    back to processes.
+
+    .. attribute:: spec
+
+       The simulation to run.
+
+    .. attribute:: workers
+
+       The number of worker processes or threads.
+
+    .. attribute:: chunk
+
+       The number of sessions handed to a worker at a time. Smaller chunks balance the load
+       better; larger ones cost less in communication.
+
+    .. attribute:: threads
+
+       :samp:`True` to use worker threads when **freeThreaded()** allows it.
+
+    .. attribute:: workerStatistics
+
+       A **dict** mapping the process or thread id of each worker to the statistics of the
+       sessions it ran in the last **Scheduler.run()**. Their **elapsed** is the time the worker
+       spent busy.
+
+    .. attribute:: elapsed
+
+       The wall-clock seconds of the last **Scheduler.run()**.
+    """
+
+    def __init__(
+        self,
+        spec: SimulationSpec,
+        workers: Optional[int] = None,
+        chunk: int = 100,
+        threads: bool = False,
+    ) -> None:
+        """
+        :param spec: the simulation to run.
+        :param workers: the number of workers; the number of CPUs by default.
+        :param chunk: the number of sessions handed to a worker at a time.
+        :param threads: use worker threads on a free-threaded build of Python.
+        """
+
+        self.spec = spec
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk = chunk
+        self.threads = threads
+        self.workerStatistics: Dict[int, SessionStatistics] = {}
+        self.elapsed = 0.0
+
+    def usesThreads(self) -> bool:
+        """
+        :return: :samp:`True` if the workers will be threads rather than processes.
+        :rtype: bool
+        """
+
+        return self.threads and freeThreaded()
+
+    def executor(self) -> Executor:
+        """
+        :return: a new pool of **workers** threads or processes, see **Scheduler.usesThreads()**.
+        :rtype: :py:class:`~concurrent.futures.Executor`
+        """
+
+        if self.usesThreads():
+            if _wheel is None:
+                _initWorker()
+            return ThreadPoolExecutor(max_workers=self.workers)
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_initWorker)
+
+    def submit(self, executor: Executor, start: int) -> Future:
+        """
+        Hands the chunk of sessions beginning at **start** to a pool from
+        **Scheduler.executor()**.
+
+        :param executor: the pool
+        :param start: the index of the chunk’s first session
+        :return: the future of the chunk’s worker id and statistics
+        :rtype: :py:class:`~concurrent.futures.Future`
+        """
+
+        count = min(self.chunk, self.spec.samples - start)
+        if isinstance(executor, ThreadPoolExecutor):
+            assert _wheel is not None
+            return executor.submit(_runChunkInThread, self.spec, _wheel, start, count)
+        return executor.submit(_runChunk, self.spec, start, count)
+
+    def run(self) -> SessionStatistics:
+        """
+        Runs all **samples** sessions of **spec**.
+
+        :return: the statistics of every session; their **elapsed** is the wall-clock time.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        """
+
+        self.workerStatistics = {}
+        begin = time.perf_counter()
+        starts = iter(range(0, self.spec.samples, self.chunk))
+        pending: Set[Future] = set()
+        with self.executor() as executor:
+            while True:
+                for start in starts:
+                    pending.add(self.submit(executor, start))
+                    if len(pending) >= 2 * self.workers:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pid, statistics = future.result()
+                    local = self.workerStatistics.setdefault(pid, SessionStatistics())
+                    local.merge(statistics)
+        self.elapsed = time.perf_counter() - begin
+
+        total = SessionStatistics()
+        for pid in sorted(self.workerStatistics):
+            total.merge(self.workerStatistics[pid])
+        total.elapsed = self.elapsed
+        return total
+
+    def utilization(self) -> Dict[int, Dict[str, float]]:
+        """
+        Reports how the last **Scheduler.run()** used each worker: the sessions it ran, the
+        seconds it was busy, and the busy time as a fraction of the wall-clock time. Low
+        utilization across the board suggests a smaller **chunk**; high utilization with a long
+        run time, a larger one.
+
+        :return: a **dict** mapping each worker’s process id to its figures
+        :rtype: dict
+        """
+
+        return {
+            pid: {
+                "sessions": statistics.sessions,
+                "busy": statistics.elapsed,
+                "utilization": statistics.elapsed / self.elapsed
+                if self.elapsed
+                else 0.0,
+            }
+            for pid, statistics in self.workerStatistics.items()
+        }
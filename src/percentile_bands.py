@@ -0,0 +1,158 @@
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+"""
+The quantiles of a fan chart: the 5th, 25th, 50th, 75th and 95th percentiles.
+"""
+
+
+class PercentileBands:
+    """
+    :class:`PercentileBands` accumulates the distribution of the stake at each round across many
+    sessions, for fan charts of the stake over time, without storing any trajectory.
+
+    Each round has a histogram of stakes in bins of **width**, held sparsely as a **dict** from
+    bin number to count, so a round costs memory only for the stakes actually reached. Stakes
+    are integers, and with the default width of 1 every bin holds a single stake, so the
+    percentiles are exact. Wider bins use less memory for strategies whose stakes spread far;
+    their percentiles are then the lower edge of the bin holding them.
+
+    A session which ends before **rounds** keeps its final stake for the remaining rounds, as
+    the player leaves the table with it, so every round’s distribution covers every session.
+
+    Accumulators of the same **rounds** and **width** can be merged, so each worker of a
+    parallel run can keep its own and the bands of the whole run come from merging them.
+
+    .. attribute:: rounds
+
+       The number of rounds tracked, normally the **Simulator.initDuration**.
+
+    .. attribute:: width
+
+       The width of the histogram bins.
+
+    .. attribute:: counts
+
+       A **list** with the histogram of each round, from the stake after the first round on.
+
+    .. attribute:: sessions
+
+       The number of sessions accumulated.
+    """
+
+    def __init__(self, rounds: int, width: int = 1) -> None:
+        """
+        :param rounds: the number of rounds to track.
+        :param width: the width of the histogram bins.
+        """
+
+        self.rounds = rounds
+        self.width = width
+        self.counts: List[Dict[int, int]] = [{} for _ in range(rounds)]
+        self.sessions = 0
+
+    def add(self, stakes: Sequence[int], initial: int) -> None:
+        """
+        Includes one session.
+
+        :param stakes: the stake after each round of the session.
+        :param initial: the stake before the first round, which a session ending before it
+            keeps throughout.
+        """
+
+        width = self.width
+        for counts, stake in zip(self.counts, stakes):
+            key = stake // width
+            counts[key] = counts.get(key, 0) + 1
+        key = (stakes[-1] if stakes else initial) // width
+        for counts in self.counts[len(stakes) :]:
+            counts[key] = counts.get(key, 0) + 1
+        self.sessions += 1
+
+    def merge(self, other: "PercentileBands") -> None:
+        """
+        Includes the sessions accumulated by another :class:`PercentileBands` instance.
+
+        :param other: the accumulator to merge into this one.
+        :raises ValueError: if the two track different rounds or use different bins.
+        """
+
+        if (other.rounds, other.width) != (self.rounds, self.width):
+            raise ValueError("can only merge bands of the same rounds and width")
+        for counts, more in zip(self.counts, other.counts):
+            for key, count in more.items():
+                counts[key] = counts.get(key, 0) + count
+        self.sessions += other.sessions
+
+    def percentile(self, round: int, quantile: float) -> Optional[int]:
+        """
+        :param round: a round, from 1 to **rounds**.
+        :param quantile: the fraction of sessions, from 0 to 1.
+        :return: the smallest stake at or below which at least **quantile** of the sessions
+            were after **round**, or :samp:`None` before any session is added.
+        :rtype: int
+        """
+
+        return self.percentiles(round, (quantile,))[0]
+
+    def percentiles(
+        self, round: int, quantiles: Sequence[float] = QUANTILES
+    ) -> List[Optional[int]]:
+        """
+        :param round: a round, from 1 to **rounds**.
+        :param quantiles: the fractions of sessions, in increasing order.
+        :return: the **PercentileBands.percentile()** of each quantile.
+        :rtype: list
+        """
+
+        counts = self.counts[round - 1]
+        keys = iter(sorted(counts))
+        key, seen = None, 0
+        values: List[Optional[int]] = []
+        for quantile in quantiles:
+            rank = max(1, math.ceil(quantile * self.sessions))
+            while seen < rank and self.sessions:
+                key = next(keys)
+                seen += counts[key]
+            values.append(None if key is None else key * self.width)
+        return values
+
+    def bands(
+        self, quantiles: Sequence[float] = QUANTILES
+    ) -> List[List[Optional[int]]]:
+        """
+        :param quantiles: the fractions of sessions, in increasing order.
+        :return: the **PercentileBands.percentiles()** of every round, in round order.
+        :rtype: list
+        """
+
+        return [
+            self.percentiles(round, quantiles) for round in range(1, self.rounds + 1)
+        ]
+
+    def asDict(self) -> Dict[str, Any]:
+        """
+        :return: the accumulator as a **dict** of plain values, suitable for JSON.
+        :rtype: dict
+        """
+
+        return {
+            "rounds": self.rounds,
+            "width": self.width,
+            "sessions": self.sessions,
+            "counts": [sorted(counts.items()) for counts in self.counts],
+        }
+
+    @classmethod
+    def fromDict(cls, values: Dict[str, Any]) -> "PercentileBands":
+        """
+        :param values: a **dict** returned by **PercentileBands.asDict()**.
+        :return: the accumulator it describes.
+        :rtype: :class:`PercentileBands`
+        """
+
+        bands = cls(values["rounds"], values["width"])
+        bands.sessions = values["sessions"]
+        bands.counts = [dict(counts) for counts in values["counts"]]
+        return bands
@@ -1,3 +1,4 @@
+from typing import Tuple
 from outcome import Outcome
 from table import Table
 from bet import Bet
@@ -30,7 +31,7 @@ class PlayerCancellation(Player):
         """
 
         super().__init__(table)
-        self.outcome = Outcome("Red", 1)
+        self.outcome = Outcome.intern("Red", 1)
         self.sequence: list[int] = []
         self.bet_amount = 0
         self.resetSequence()
@@ -84,3 +85,16 @@ class PlayerCancellation(Player):
             self.resetSequence()
             return False
         return True
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :py:class:`~players.player.Player` snapshot with a **tuple** copy of
+        **sequence** and the current bet amount.
+        """
+
+        return super().snapshot() + (tuple(self.sequence), self.bet_amount)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-2])
+        sequence, self.bet_amount = snapshot[-2:]
+        self.sequence = list(sequence)
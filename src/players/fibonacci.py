@@ -1,3 +1,4 @@
+from typing import Tuple
 from bet import Bet
 from players.player import Player
 from table import Table
@@ -26,7 +27,7 @@ class PlayerFibonacci(Player):
         """
 
         super().__init__(table)
-        self.outcome = Outcome("Black", 1)
+        self.outcome = Outcome.intern("Black", 1)
         self.recent = 1
         self.previous = 0
         self.bet_amount = self.recent + self.previous
@@ -75,3 +76,16 @@ class PlayerFibonacci(Player):
     def placeBets(self) -> None:
         self.table.placeBet(Bet(self.bet_amount, self.outcome))
         self.stake -= self.bet_amount
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :py:class:`~players.player.Player` snapshot with
+        :class:`PlayerFibonacci.recent`, :class:`PlayerFibonacci.previous` and the current bet
+        amount.
+        """
+
+        return super().snapshot() + (self.recent, self.previous, self.bet_amount)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-3])
+        self.recent, self.previous, self.bet_amount = snapshot[-3:]
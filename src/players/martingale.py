@@ -1,3 +1,4 @@
+from typing import Tuple
 from table import Table
 from outcome import Outcome
 from bet import Bet
@@ -18,6 +19,10 @@ class Martingale(Player):
 
        The the bet multiplier, based on the number of losses. This starts at 1, and is reset to 1 on
        each win. It is doubled in each loss. This is always equal to :math:`2^{lossCount}`.
+
+    .. attribute:: outcome
+
+       The interned “black” :class:`Outcome` this player bets on.
     """
 
     def __init__(self, table: Table):
@@ -31,23 +36,33 @@ class Martingale(Player):
         super().__init__(table)
         self.losscount = 0
         self.betMultiple = 1
+        self.outcome = Outcome.intern("Black", 1)
 
     def placeBets(self) -> None:
         """
         Updates the :class:`Table` object with a bet on “black”. The amount bet is
         :math:`2^{lossCount}`, which is the value of **betMultiple**.
+
+        **Raises:** :class:`InvalidBet` if the bet exceeds the table limit. The progression is
+        reset first, as in **Martingale.tryPlaceBets()**.
+        """
+
+        if not self.tryPlaceBets():
+            raise InvalidBet
+
+    def tryPlaceBets(self) -> bool:
+        """
+        Places the bet described in **Martingale.placeBets()** with **Table.placeValidBet()**.
+        If the table refuses it, **losscount** and **betMultiple** are reset and :samp:`False` is
+        returned; no exception is raised.
         """
 
-        outcome = Outcome("Black", 1)
-        bet = Bet(self.betMultiple, outcome)
-        self.table.placeBet(bet)
-        try:
-            self.table.isValid()
-        except InvalidBet as exc:
+        if not self.table.placeValidBet(Bet(self.betMultiple, self.outcome)):
             self.losscount = 0
             self.betMultiple = 2**self.losscount
-            raise InvalidBet from exc
+            return False
         self.stake -= self.betMultiple
+        return True
 
     def playing(self) -> bool:
         if not super().playing() or self.betMultiple > self.stake:
@@ -80,3 +95,14 @@ class Martingale(Player):
         super().lose(bet)
         self.losscount += 1
         self.betMultiple = 2**self.losscount
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :class:`Player` snapshot with **losscount** and **betMultiple**.
+        """
+
+        return super().snapshot() + (self.losscount, self.betMultiple)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-2])
+        self.losscount, self.betMultiple = snapshot[-2:]
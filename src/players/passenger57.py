@@ -1,3 +1,4 @@
+from typing import List
 from players.player import Player
 from table import Table
 from wheel import Wheel
@@ -15,12 +16,18 @@ class Passenger57(Player):
 
        This :class:`Player` will get this from the :class:`Wheel` using a well-known bet name.
 
+    .. attribute:: bet_amount
+
+       The amount of every bet this player places.
+
     .. attribute:: table
 
        The :class:`Table` that is used to place individual :class:`Bet` instances.
 
     """
 
+    outcomeIndependent = True
+
     def __init__(self, table: Table, wheel: Wheel) -> None:
         """
         Constructs the :class:`Player` instance with a specific table for placing bets. This also
@@ -35,6 +42,11 @@ class Passenger57(Player):
         self.table = table
         self.wheel = wheel
         self.black = self.wheel.getOutcome("Black")
+        self.bet_amount = 20
+
+    @classmethod
+    def create(cls, table: Table, wheel: Wheel) -> "Passenger57":
+        return cls(table, wheel)
 
     def placeBets(self) -> None:
         """
@@ -44,7 +56,14 @@ class Passenger57(Player):
 
         """
 
-        bet_amount = 20
-        bet = Bet(bet_amount, self.black)
+        bet = Bet(self.bet_amount, self.black)
         self.table.placeBet(bet)
-        self.stake -= bet_amount
+        self.stake -= self.bet_amount
+
+    def betSchedule(self, rounds: int) -> List[Bet]:
+        """
+        This player always bets on black, so the schedule repeats a single :class:`Bet` instance
+        **rounds** times.
+        """
+
+        return [Bet(self.bet_amount, self.black)] * rounds
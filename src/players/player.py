@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import List, Set, Tuple
 from outcome import Outcome
 from table import Table
+from wheel import Wheel
 from bet import Bet
 
 
@@ -28,8 +29,16 @@ class Player(ABC):
        The :class:`Table` object used to place individual :class:`Bet` instances. The :class:`Table`
        object contains the current :class:`Wheel` object from which the player can get
        :class:`Outcome` objects used to build :class:`Bet` instances.
+
+    .. attribute:: outcomeIndependent
+
+       :samp:`True` for a strategy whose bets never depend on earlier results. Such a player
+       provides **Player.betSchedule()**, and the :py:class:`~simulator.Simulator` can settle a
+       whole session against a block of spins instead of cycling the :class:`Game` every round.
     """
 
+    outcomeIndependent = False
+
     def __init__(self, table: Table) -> None:
         """
         Constructs the :class:`Player` instance with a specific :class:`Table` object for placing
@@ -45,6 +54,30 @@ class Player(ABC):
         self.stake = 100
         self.roundsToGo = 250
 
+    @classmethod
+    def create(
+        cls, table: Table, wheel: Wheel  # pylint: disable=unused-argument
+    ) -> "Player":
+        """
+        Constructs a player of this class from the :class:`Table` and the :class:`Wheel`, so
+        code choosing a strategy at run time can build any of them the same way. Most strategies
+        only need the table; those which also need the wheel override this.
+
+        :param table: the table to use
+        :param wheel: the wheel which defines all :class:`Outcome` instances
+        :return: the new player
+        """
+
+        return cls(table)
+
+    def reseed(self, seed: int) -> None:
+        """
+        :param seed: the seed for the player's own random number generator.
+
+        Seeds any random number generator the strategy keeps, so runs can be reproduced. Most
+        strategies are deterministic and have nothing to seed.
+        """
+
     def win(self, bet: Bet) -> None:
         """
         :param bet: The bet which won
@@ -73,17 +106,80 @@ class Player(ABC):
         for more information.
         """
 
+    def tryPlaceBets(self) -> bool:
+        """
+        The status-code form of **Player.placeBets()**. It returns :samp:`False` instead of
+        raising :py:class:`~invalid_bet.InvalidBet` when the bets would break the table limit, so
+        the :class:`~game.Game` can end a session without unwinding the stack.
+
+        A player which never breaks the limit can rely on this default, which simply calls
+        **Player.placeBets()**.
+
+        :return: :samp:`True` if the bets were placed.
+        :rtype: bool
+        """
+
+        self.placeBets()
+        return True
+
     def playing(self) -> bool:
         """
         Returns :samp:`True` while the player is still active.
         """
         return self.roundsToGo > 0
 
+    def snapshot(self) -> Tuple:
+        """
+        :return: the player's state as a flat **tuple**.
+        :rtype: tuple
+
+        Captures everything needed to continue play from this point: the **stake**, the
+        **roundsToGo** and whatever a subclass adds. Each subclass appends its own values to the
+        end of its superclass's snapshot, so **Player.restore()** can peel them off again.
+        """
+
+        return (self.stake, self.roundsToGo)
+
+    def restore(self, snapshot: Tuple) -> None:
+        """
+        :param snapshot: a **tuple** returned by **Player.snapshot()**.
+
+        Puts the player back into the state captured by the snapshot. A subclass restores its own
+        values from the end of the snapshot and passes the rest on to its superclass.
+        """
+
+        self.stake, self.roundsToGo = snapshot
+
+    def betSchedule(self, rounds: int) -> List[Bet]:
+        """
+        :param rounds: the number of rounds to schedule.
+        :return: one :class:`Bet` per round, in the order they would be placed.
+        :rtype: list
+
+        Generates the bets this player would place over the next **rounds** rounds, deducting
+        nothing from the stake. Only an **outcomeIndependent** player can do this; the others raise
+        :samp:`NotImplementedError`.
+        """
+
+        raise NotImplementedError(f"{type(self).__name__} depends on outcomes")
+
     def winners(self, outcomes: Set[Outcome]) -> None:
         """
         :param outcomes: The set of :py:class:`~outcome.Outcome` instances that are part of the
         current win.
 
         The game will notify a player of each spin using this method. This will be invoked even if
-        the player places no bets.
+        the player places no bets, unless the player overrides **Player.winnersMask()** instead.
+        The :class:`~game.Game` skips the notification entirely for players that override
+        neither method.
+        """
+
+    def winnersMask(self, mask: int) -> None:
+        """
+        :param mask: The :py:attr:`~bin.Bin.mask` of the winning :py:class:`~bin.Bin`.
+
+        The cheaper form of **Player.winners()**. The game passes the precomputed outcome bitmask
+        of the winning bin instead of building a **set** of :py:class:`~outcome.Outcome`
+        instances. A player watching for an outcome tests its :py:attr:`~outcome.Outcome.bit`
+        against the mask.
         """
@@ -1,3 +1,4 @@
+from typing import Tuple
 from bet import Bet
 from table import Table
 from players.player import Player
@@ -62,3 +63,16 @@ class Player1326(Player):
         """
 
         self.state = self.state.nextLost()
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :py:class:`~players.player.Player` snapshot with the class name of the current
+        state. The states are singletons, so the name is all that is needed to get it back from
+        the :py:class:`~players.player1326.player1326_state_factory.Player1326StateFactory`.
+        """
+
+        return super().snapshot() + (type(self.state).__name__,)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-1])
+        self.state = Player1326StateFactory().get(snapshot[-1])
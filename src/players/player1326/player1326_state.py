@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import ClassVar
 from bet import Bet
 from outcome import Outcome
 
@@ -6,16 +7,24 @@ from outcome import Outcome
 class Player1326State:
     """
     :class:`Player1326State` is the superclass for all of the states in the 1-3-2-6 betting system.
+
+    The states are immutable singletons without any slots. Each one is created when this module
+    is imported, and its bet amount and :py:class:`~outcome.Outcome` are class constants, so the
+    same state can be shared by any number of players, in any number of threads.
+
+    .. attribute:: betAmount
+
+       The amount this state bets. Each subclass sets its own.
+
+    .. attribute:: outcome
+
+       The :py:class:`~outcome.Outcome` to bet on.
     """
 
-    def __init__(self) -> None:
-        """
-        The constructor for this class saves the initializes the betaAmount and saves the
-        :py:class:`~outcome.Outcome` to bet on.
-        """
+    __slots__ = ()
 
-        self.betAmount: int = 0
-        self.outcome = Outcome("Red", 1)
+    betAmount: ClassVar[int] = 0
+    outcome: ClassVar[Outcome] = Outcome.intern("Red", 1)
 
     @abstractmethod
     def currentBet(self) -> Bet:
@@ -63,13 +72,13 @@ class Player1326NoWins(Player1326State):
     system. When there are no wins, the base bet value of 1 is used.
     """
 
-    _player1326_no_wins = None
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.betAmount = 1
+    betAmount = 1
 
-    def __new__(cls, *args, **kwargs) -> "Player1326NoWins":
+    _player1326_no_wins = None
+
+    def __new__(cls) -> "Player1326NoWins":
         if cls._player1326_no_wins is None:
             cls._player1326_no_wins = super().__new__(cls)
         return cls._player1326_no_wins
@@ -96,13 +105,13 @@ class Player1326OneWin(Player1326State):
     system. When there is one wins, the base bet value of 3 is used.
     """
 
-    _player1326_onewin = None
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.betAmount = 3
+    betAmount = 3
 
-    def __new__(cls, *args, **kwargs) -> "Player1326OneWin":
+    _player1326_onewin = None
+
+    def __new__(cls) -> "Player1326OneWin":
         if cls._player1326_onewin is None:
             cls._player1326_onewin = super().__new__(cls)
         return cls._player1326_onewin
@@ -129,13 +138,13 @@ class Player1326TwoWins(Player1326State):
     system. When there are two wins, the base bet value of 2 is used.
     """
 
-    _player1326_two_wins = None
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.betAmount = 2
+    betAmount = 2
+
+    _player1326_two_wins = None
 
-    def __new__(cls, *args, **kwargs) -> "Player1326TwoWins":
+    def __new__(cls) -> "Player1326TwoWins":
         if cls._player1326_two_wins is None:
             cls._player1326_two_wins = super().__new__(cls)
         return cls._player1326_two_wins
@@ -163,13 +172,13 @@ class Player1326ThreeWins(Player1326State):
     system. When there are three wins, the base bet value of 6 is used.
     """
 
-    _player1326_three_wins = None
+    __slots__ = ()
+
+    betAmount = 6
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.betAmount = 6
+    _player1326_three_wins = None
 
-    def __new__(cls, *args, **kwargs) -> "Player1326ThreeWins":
+    def __new__(cls) -> "Player1326ThreeWins":
         if cls._player1326_three_wins is None:
             cls._player1326_three_wins = super().__new__(cls)
         return cls._player1326_three_wins
@@ -188,3 +197,9 @@ class Player1326ThreeWins(Player1326State):
         """
 
         return Player1326NoWins()
+
+
+Player1326NoWins()
+Player1326OneWin()
+Player1326TwoWins()
+Player1326ThreeWins()
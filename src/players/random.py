@@ -1,4 +1,5 @@
 import random
+from typing import List, Tuple
 from bet import Bet
 from players.player import Player
 
@@ -20,6 +21,8 @@ class PlayerRandom(Player):
        **Set** of all known :py:class:`~outcome.Outcome` instances.
     """
 
+    outcomeIndependent = True
+
     def __init__(self, table, wheel) -> None:
         """
         This uses the **super()** construct to invoke the superclass constructor using the Table
@@ -35,6 +38,13 @@ class PlayerRandom(Player):
         bin_iterator = wheel.binIterator()
         self.all_OC = set(outcome for bin in bin_iterator for outcome in bin)
 
+    @classmethod
+    def create(cls, table, wheel) -> "PlayerRandom":
+        return cls(table, wheel)
+
+    def reseed(self, seed: int) -> None:
+        self.rng.seed(seed)
+
     def placeBets(self) -> None:
         """
         Updates the :py:class:`~table.Table` object with a randomly placed :py:class:`~bet.Bet`
@@ -44,5 +54,27 @@ class PlayerRandom(Player):
         self.table.placeBet(Bet(bet_amount, self.rng.choice(list(self.all_OC))))
         self.stake -= bet_amount
 
+    def betSchedule(self, rounds: int) -> List[Bet]:
+        """
+        Draws **rounds** random :py:class:`~bet.Bet` instances from **rng**, in the same order
+        **PlayerRandom.placeBets()** would draw them.
+        """
+
+        bet_amount = 1
+        all_outcomes = list(self.all_OC)
+        return [Bet(bet_amount, self.rng.choice(all_outcomes)) for _ in range(rounds)]
+
     def playing(self) -> bool:
         return super().playing() and self.stake > 0
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :py:class:`~players.player.Player` snapshot with the state of **rng**, so a
+        restored player draws the same bets again.
+        """
+
+        return super().snapshot() + (self.rng.getstate(),)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-1])
+        self.rng.setstate(snapshot[-1])
@@ -0,0 +1,129 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from players.player import Player
+
+ENTRY_POINT_GROUP = "roulette.strategies"
+"""
+The entry-point group in which installed packages register their strategies, for example in
+:file:`pyproject.toml`::
+
+    [project.entry-points."roulette.strategies"]
+    labouchere = "my_strategies.labouchere:Labouchere"
+"""
+
+
+class StrategyRegistry:
+    """
+    :class:`StrategyRegistry` resolves the names of betting strategies to :class:`Player`
+    subclasses. It holds the name of each strategy’s module, not the module itself, and imports a
+    module only when its strategy is resolved, so a program naming one strategy does not pay for
+    importing the others.
+
+    The strategies of the :mod:`players` package are registered under the names of their
+    modules. Strategies from other packages join through the **ENTRY_POINT_GROUP** entry points,
+    which are read the first time a name is not found among those already registered, or when
+    every name is listed; or by calling **StrategyRegistry.register()**.
+
+    .. attribute:: targets
+
+       A **dict** mapping each registered name to its strategy: a
+       :samp:`"module:qualname"` string until it is first resolved, the :class:`Player` subclass
+       after.
+
+    .. attribute:: discovered
+
+       :samp:`True` once the entry points have been read.
+    """
+
+    builtins = {
+        "cancellation": "players.cancellation:PlayerCancellation",
+        "fibonacci": "players.fibonacci:PlayerFibonacci",
+        "martingale": "players.martingale:Martingale",
+        "passenger57": "players.passenger57:Passenger57",
+        "player1326": "players.player1326.player1326:Player1326",
+        "random": "players.random:PlayerRandom",
+        "seven_reds": "players.seven_reds:SevenReds",
+    }
+
+    def __init__(self) -> None:
+        self.targets: Dict[str, Union[str, Type["Player"]]] = dict(self.builtins)
+        self.discovered = False
+
+    def register(self, name: str, target: Union[str, Type["Player"]]) -> None:
+        """
+        Registers a strategy, replacing any registered under the same name.
+
+        :param name: the name of the strategy.
+        :param target: the :class:`Player` subclass, or its :samp:`"module:qualname"` to import
+            it later.
+        """
+
+        self.targets[name] = target
+
+    def discover(self) -> None:
+        """
+        Registers the strategies of the **ENTRY_POINT_GROUP** entry points, without importing
+        them. A strategy registered already keeps its name.
+        """
+
+        if self.discovered:
+            return
+        self.discovered = True
+        from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+            entry_points,
+        )
+
+        for entry in entry_points(group=ENTRY_POINT_GROUP):
+            self.targets.setdefault(entry.name, entry.value)
+
+    def names(self) -> List[str]:
+        """
+        :return: the names of every strategy, including those of the entry points.
+        :rtype: list
+        """
+
+        self.discover()
+        return sorted(self.targets)
+
+    def resolve(self, name: str) -> Type["Player"]:
+        """
+        Imports a strategy by its registered name. A :class:`Player` subclass from the
+        :mod:`players` package can also be named by its module and qualified name, as in
+        :samp:`"players.martingale:Martingale"`.
+
+        :param name: the name of the strategy.
+        :return: the :class:`Player` subclass
+        :rtype: type
+        :raises ValueError: if no strategy has this name, or it is not a :class:`Player`.
+        """
+
+        if name not in self.targets:
+            self.discover()
+        target = self.targets.get(name)
+        if target is None:
+            if name.split(".")[0] != "players" or ":" not in name:
+                raise ValueError(f"unknown strategy {name!r}")
+            target = name
+        if isinstance(target, str):
+            module, _, qualname = target.partition(":")
+            strategy: Any = importlib.import_module(module)
+            for part in qualname.split("."):
+                strategy = getattr(strategy, part)
+            from players.player import (  # pylint: disable=import-outside-toplevel
+                Player,
+            )
+
+            if not (isinstance(strategy, type) and issubclass(strategy, Player)):
+                raise ValueError(f"{name!r} is not a Player")
+            target = strategy
+            if name in self.targets:
+                self.targets[name] = strategy
+        return target
+
+
+strategies = StrategyRegistry()
+"""
+The registry of **roulette.main()**.
+"""
@@ -1,4 +1,4 @@
-from typing import Set
+from typing import Set, Tuple
 from outcome import Outcome
 from players.martingale import Martingale
 
@@ -14,6 +14,11 @@ class SevenReds(Martingale):
        The number of reds yet to go. This starts at 7 , is reset to 7 on each non-red outcome, and
        decrements by 1 on each red outcome.
 
+    .. attribute:: redBit
+
+       The :py:attr:`~outcome.Outcome.bit` of the :samp:`"Red"` outcome, used to test the winning
+       bin mask without building any :py:class:`~outcome.Outcome` instances.
+
     **Note:** that this class inherits betMultiple. This is initially 1, doubles with each loss
     and is reset to one on each win.
     """
@@ -21,15 +26,19 @@ class SevenReds(Martingale):
     def __init__(self, table):
         super().__init__(table)
         self.redCount = 7
+        self.red = Outcome.intern("Red", 1)
+        self.redBit = Outcome.bitFor(self.red.name)
 
-    def placeBets(self) -> None:
+    def tryPlaceBets(self) -> bool:
         """
-        If **redCount** is zero, this places a bet on black, using the bet multiplier.
+        If **redCount** is zero, this places a bet on black, using the bet multiplier. The
+        inherited **Martingale.placeBets()** calls this and raises if the bet was refused.
         """
 
         if self.redCount == 0:
             self.redCount = 7
-            super().placeBets()
+            return super().tryPlaceBets()
+        return True
 
     def winners(self, outcomes: Set[Outcome]) -> None:
         """
@@ -39,8 +48,31 @@ class SevenReds(Martingale):
         this vector includes red, redCount is decremented. Otherwise, redCount is reset to 7.
         """
 
-        red_outcome = Outcome("Red", 1)
-        if red_outcome in outcomes:
+        if self.red in outcomes:
             self.redCount -= 1
         else:
             self.redCount = 7
+
+    def winnersMask(self, mask: int) -> None:
+        """
+        :param mask: The :py:attr:`~bin.Bin.mask` of the winning Bin.
+
+        The bitmask form of **SevenReds.winners()**. If the red bit is set in the mask, redCount is
+        decremented. Otherwise, redCount is reset to 7.
+        """
+
+        if mask & self.redBit:
+            self.redCount -= 1
+        else:
+            self.redCount = 7
+
+    def snapshot(self) -> Tuple:
+        """
+        Extends the :py:class:`~players.martingale.Martingale` snapshot with **redCount**.
+        """
+
+        return super().snapshot() + (self.redCount,)
+
+    def restore(self, snapshot: Tuple) -> None:
+        super().restore(snapshot[:-1])
+        (self.redCount,) = snapshot[-1:]
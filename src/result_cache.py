@@ -0,0 +1,262 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from wheel import Wheel
+import simulation_spec
+from simulation_spec import SimulationSpec
+from running_statistics import SessionStatistics
+from players.player import Player
+
+
+@cache
+def sourceDigest() -> str:
+    """
+    Hashes the source of every module of the simulator: the players, the game, the table, the
+    bets and outcomes, the simulator and the code seeding and running sessions. It is computed
+    once per process.
+
+    :return: the hex SHA-256 digest of all the **.py** files next to this module and below
+    :rtype: str
+    """
+
+    root = Path(simulation_spec.__file__).resolve().parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(str(path.relative_to(root)).encode() + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def moduleSource(name: str) -> Optional[str]:
+    """
+    Describes the code of an imported module for a cache key. That is its source if it can be
+    found; otherwise, as for a plugin installed as compiled **.pyc** files only or from a zip
+    archive, the SHA-256 digest of the file its loader imported it from.
+
+    :param name: the name of an imported module
+    :return: the source or the digest, or :samp:`None` if the module’s code cannot be read
+    :rtype: str
+    """
+
+    module = sys.modules[name]
+    try:
+        return inspect.getsource(module)
+    except (OSError, TypeError):
+        pass
+    path = getattr(module, "__file__", None)
+    get_data = getattr(getattr(module, "__loader__", None), "get_data", None)
+    if path is None or get_data is None:
+        return None
+    try:
+        return hashlib.sha256(get_data(path)).hexdigest()
+    except OSError:
+        return None
+
+
+class ResultCache:
+    """
+    :class:`ResultCache` keeps the results of simulations in a local directory, so running the
+    same :py:class:`~simulation_spec.SimulationSpec` again costs a file read instead of the whole
+    simulation.
+
+    Each result is stored under a key which hashes everything the result depends on: the
+    strategy’s name, the source of the modules defining it and its :class:`Player` superclasses (see
+    **moduleSource()**), a digest of the
+    whole simulator’s source from **sourceDigest()**, every parameter of the spec including the
+    **Table.limit**, the seed and the number of samples, and the outcomes in every :class:`Bin` of
+    the :class:`Wheel`.
+    Editing a strategy or any part of the simulator therefore changes the key, and stale results
+    are simply never found again. A result file which cannot be read, for example one left
+    corrupt by a crash, counts as missing.
+
+    The directory is bounded in size. Reading a result marks it as recently used, and storing a
+    result evicts the least recently used ones until the directory fits in **maxBytes**.
+
+    .. attribute:: directory
+
+       The :py:class:`~pathlib.Path` of the directory holding one JSON file per result.
+
+    .. attribute:: maxBytes
+
+       The most bytes the result files may use together.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], maxBytes: int = 100_000_000
+    ) -> None:
+        """
+        :param directory: the directory for the result files; it is created if needed.
+        :param maxBytes: the most bytes the result files may use together.
+        """
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxBytes = maxBytes
+
+    @staticmethod
+    def key(spec: SimulationSpec, wheel: Wheel) -> Optional[str]:
+        """
+        Computes the key of a simulation.
+
+        :param spec: the simulation
+        :param wheel: the built wheel it runs on
+        :return: the hex SHA-256 digest identifying the simulation’s result, or :samp:`None` if
+            the code of the strategy cannot be read, so its results cannot be cached safely
+        :rtype: str
+        """
+
+        classes = [cls for cls in spec.strategy.__mro__ if issubclass(cls, Player)]
+        sources = [
+            moduleSource(name) for name in sorted({cls.__module__ for cls in classes})
+        ]
+        if None in sources:
+            return None
+        description = {
+            "strategy": f"{spec.strategy.__module__}:{spec.strategy.__qualname__}",
+            "sources": sources,
+            "simulator": sourceDigest(),
+            "parameters": [
+                spec.stake,
+                spec.duration,
+                spec.limit,
+                spec.samples,
+                spec.seed,
+                spec.engine,
+            ],
+            "wheel": [
+                sorted(
+                    [outcome.name, outcome.odds, outcome.denominator] for outcome in bin
+                )
+                for bin in wheel.bins
+            ],
+        }
+        encoded = json.dumps(description, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        :param key: a key from **ResultCache.key()**.
+        :return: the file holding the result with this key.
+        :rtype: :py:class:`~pathlib.Path`
+        """
+
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Reads a stored result and marks it as recently used.
+
+        :param key: a key from **ResultCache.key()**.
+        :return: a **dict** with the :samp:`"statistics"` as a **SessionStatistics.asDict()** and
+            the raw :samp:`"results"`, which is :samp:`None` if they were not stored; or
+            :samp:`None` if there is no readable result with this key.
+        :rtype: dict
+        """
+
+        path = self.path(key)
+        try:
+            with path.open(encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "statistics" not in entry:
+            return None
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+        return entry
+
+    def put(
+        self,
+        key: str,
+        statistics: SessionStatistics,
+        results: Optional[List[Tuple[int, int]]] = None,
+    ) -> None:
+        """
+        Stores a result, replacing any with the same key, then evicts the least recently used
+        results until the directory fits in **maxBytes**. The file is written under a temporary
+        name and renamed into place, so a reader never sees a partial result.
+
+        :param key: a key from **ResultCache.key()**.
+        :param statistics: the aggregated statistics of the simulation.
+        :param results: the duration and maximum of every session, if they should be kept.
+        """
+
+        entry = {
+            "statistics": statistics.asDict(),
+            "results": None if results is None else [list(pair) for pair in results],
+        }
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        path = self.path(key)
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Deletes the least recently used results until the directory fits in **maxBytes**.
+        """
+
+        files = [(path.stat(), path) for path in self.directory.glob("*.json")]
+        files.sort(key=lambda item: item[0].st_mtime_ns)
+        total = sum(status.st_size for status, _ in files)
+        for status, path in files:
+            if total <= self.maxBytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= status.st_size
+
+    def clear(self) -> None:
+        """
+        Deletes every stored result.
+        """
+
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def run(
+        self,
+        spec: SimulationSpec,
+        wheel: Wheel,
+        results: Optional[List[Tuple[int, int]]] = None,
+    ) -> SessionStatistics:
+        """
+        Returns the stored result of a simulation, running it with **SimulationSpec.run()** and
+        storing the result first if needed. A simulation without a **ResultCache.key()** is
+        simply run.
+
+        :param spec: the simulation
+        :param wheel: the built wheel it runs on
+        :param results: if given, the duration and maximum of each session are appended to it;
+            a stored result without them is then computed again.
+        :return: the statistics of the simulation
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        """
+
+        key = self.key(spec, wheel)
+        if key is None:
+            return spec.run(wheel, results=results)
+        entry = self.get(key)
+        if entry is not None and (results is None or entry["results"] is not None):
+            if results is not None:
+                results.extend(tuple(pair) for pair in entry["results"])
+            return SessionStatistics.fromDict(entry["statistics"])
+        computed: List[Tuple[int, int]] = []
+        statistics = spec.run(wheel, results=computed)
+        self.put(key, statistics, None if results is None else computed)
+        if results is not None:
+            results.extend(computed)
+        return statistics
@@ -1,32 +1,218 @@
-from wheel import Wheel
-from bin_builder import BinBuilder
-from table import Table
-from game import Game
-from simulator import Simulator
-from players.fibonacci import PlayerFibonacci
-
-
-def main() -> None:  # pragma: no cover
-    """
-    A main application function that creates the necessary objects, runs the Simulator’s gather()
-    method, and writes the available outputs to sys.stdout
-    """
-    wheel = Wheel()
-    bin_builder = BinBuilder()
-    table = Table()
-    game = Game(wheel, table)
-    bin_builder.buildBins(wheel)
-    player = PlayerFibonacci(table)
-    simulator = Simulator(game, player)
-    simulator.gather()
-
-    print("maxima: ", simulator.maxima)
-    print("Mean of maxima:", simulator.maxima.mean())
-    print("Standard deviation of maxima:", simulator.maxima.stdev())
-
-    print("duration: ", simulator.durations)
-    print("Mean of duration:", simulator.durations.mean())
-    print("Standard deviation of duration:", simulator.durations.stdev())
+import argparse
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, TextIO, Tuple
+from players.registry import strategies
+
+if TYPE_CHECKING:  # pragma: no cover
+    from running_statistics import SessionStatistics
+    from simulation_spec import SimulationSpec
+
+# The simulation modules are imported by the functions which need them, not here, so that
+# ``--help`` and argument errors answer at once, and a run imports only the strategy it names.
+# pylint: disable=import-outside-toplevel
+
+FORMATS = ("text", "json", "csv")
+"""
+The output formats of **main()**.
+"""
+
+PARAMETERS = ("samples", "duration", "stake", "limit", "seed", "engine")
+"""
+The :py:class:`~simulation_spec.SimulationSpec` fields which can be set on the command line.
+"""
+
+
+def parseArguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Reads the command line.
+
+    :param argv: the arguments; those of the process by default.
+    :return: the parsed arguments
+    :rtype: :py:class:`~argparse.Namespace`
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Simulate a roulette betting strategy."
+    )
+    parser.add_argument(
+        "--strategy",
+        default="fibonacci",
+        help="a registered strategy name, or a players module:Class name; "
+        "--strategy list shows the names",
+    )
+    for name, help_text in (
+        ("samples", "the number of sessions"),
+        ("duration", "the most rounds in a session"),
+        ("stake", "the initial stake of each session"),
+        ("limit", "the table limit"),
+        ("seed", "the seed of the first session"),
+    ):
+        parser.add_argument(f"--{name}", type=int, help=help_text)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="the number of worker processes; 0 for one per CPU",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("object", "fast"),
+        help="how sessions are played, see Simulator.engine",
+    )
+    parser.add_argument(
+        "--format", choices=FORMATS, default="text", help="the output format"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile the run and write the hottest functions to stderr",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="add the setup time and the sessions per second to the output",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="DIRECTORY",
+        help="also write the duration and maximum of every session as binary columns "
+        "to DIRECTORY; needs --workers 1",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.output is not None and arguments.workers != 1:
+        parser.error("--output needs --workers 1")
+    if arguments.strategy == "list":
+        print("\n".join(strategies.names()))
+        parser.exit()
+    try:
+        arguments.strategy = strategies.resolve(arguments.strategy)
+    except (ValueError, ImportError, AttributeError) as error:
+        parser.error(str(error))
+    return arguments
+
+
+def simulate(arguments: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Runs the simulation described by the command line. The parameters left out keep the
+    defaults of :py:class:`~simulation_spec.SimulationSpec`.
+
+    :param arguments: the arguments from **parseArguments()**.
+    :return: the spec’s **SimulationSpec.asDict()** followed by the
+        **SessionStatistics.report()**, and with **benchmark** set, the seconds this process
+        spent building the :class:`Wheel` and the sessions run per second.
+    :rtype: dict
+    """
+
+    from simulation_spec import SimulationSpec
+
+    values = vars(arguments)
+    spec = SimulationSpec(
+        arguments.strategy,
+        **{name: values[name] for name in PARAMETERS if values[name] is not None},
+    )
+    if arguments.workers == 1:
+        statistics, setup = runHere(spec, arguments.output)
+    else:
+        setup = 0.0
+        from parallel import Scheduler
+
+        statistics = Scheduler(spec, arguments.workers or None).run()
+    row = {**spec.asDict(), **statistics.report()}
+    if arguments.benchmark:
+        row["setup"] = setup
+        row["sessions_per_second"] = (
+            statistics.sessions / statistics.elapsed if statistics.elapsed else 0.0
+        )
+    return row
+
+
+def runHere(
+    spec: "SimulationSpec", output: Optional[str]
+) -> Tuple["SessionStatistics", float]:
+    """
+    Runs a simulation in this process.
+
+    :param spec: the simulation.
+    :param output: if given, the directory where a :py:class:`~column_file.ColumnWriter`
+        streams the duration and maximum of every session, with the spec and the report as
+        metadata.
+    :return: the statistics of the sessions and the seconds spent building the :class:`Wheel`.
+    :rtype: tuple
+    """
+
+    from simulation_spec import buildWheel
+
+    begin = time.perf_counter()
+    wheel = buildWheel()
+    setup = time.perf_counter() - begin
+    if output is None:
+        return spec.run(wheel), setup
+    from column_file import ColumnWriter
+    from running_statistics import finite
+
+    with ColumnWriter(
+        output, {"duration": "i", "maximum": "i"}, {"spec": spec.asDict()}
+    ) as columns:
+        statistics = spec.run(wheel, results=columns)
+        columns.metadata["report"] = finite(statistics.report())
+    return statistics, setup
+
+
+def write(row: Dict[str, Any], format: str, file: TextIO) -> None:
+    """
+    Writes the result of **simulate()**.
+
+    :param row: the result.
+    :param format: one of **FORMATS**: :samp:`"text"` writes one line per value,
+        :samp:`"json"` one JSON object, in which values the report cannot give are
+        :samp:`null`, and :samp:`"csv"` a header and one row.
+    :param file: the stream to write to.
+    """
+
+    if format == "json":
+        import json
+        from running_statistics import finite
+
+        json.dump(finite(row), file, allow_nan=False)
+        file.write("\n")
+    elif format == "csv":
+        import csv
+
+        writer = csv.DictWriter(file, fieldnames=list(row))
+        writer.writeheader()
+        writer.writerow(row)
+    else:
+        width = max(map(len, row))
+        for name, value in row.items():
+            file.write(f"{name:<{width}}  {value}\n")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the simulation described on the command line, as in
+    ``python roulette.py --strategy martingale --samples 10000 --engine fast --format json``,
+    and writes its summary to :samp:`sys.stdout`. The result of every session goes only to the
+    binary columns of ``--output``, never to the terminal. With ``--profile`` the run is
+    profiled with :mod:`cProfile` and the functions with the most cumulative time are written
+    to :samp:`sys.stderr`.
+
+    :param argv: the arguments; those of the process by default.
+    """
+
+    arguments = parseArguments(argv)
+    if arguments.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        row = profiler.runcall(simulate, arguments)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(
+            25
+        )
+    else:
+        row = simulate(arguments)
+    write(row, arguments.format, sys.stdout)
 
 
 if __name__ == "__main__":  # pragma: no cover
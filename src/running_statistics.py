@@ -0,0 +1,271 @@
+import math
+from statistics import NormalDist
+from typing import Any, Dict, Optional
+
+
+def finite(report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replaces the infinite and undefined values of a **SessionStatistics.report()**, such as the
+    confidence interval of fewer than two sessions, with :samp:`None`, which JSON can represent.
+
+    :param report: a report.
+    :return: a copy of the report with only finite numbers.
+    :rtype: dict
+    """
+
+    return {
+        name: None if isinstance(value, float) and not math.isfinite(value) else value
+        for name, value in report.items()
+    }
+
+
+class RunningStatistics:
+    """
+    :class:`RunningStatistics` computes the same descriptive statistics as
+    :py:class:`~integer_statistics.IntegerStatistics` without keeping the values. It uses Welford’s
+    streaming update, so the mean and variance stay accurate over billions of values, and two
+    instances built from separate runs can be merged.
+
+    .. attribute:: count
+
+       The number of values seen.
+
+    .. attribute:: average
+
+       The mean of the values seen so far.
+
+    .. attribute:: squares
+
+       The sum of the squared differences between each value and **average**.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty accumulator.
+        """
+
+        self.count = 0
+        self.average = 0.0
+        self.squares = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Includes one more value.
+
+        :param value: the value to include
+        """
+
+        self.count += 1
+        delta = value - self.average
+        self.average += delta / self.count
+        self.squares += delta * (value - self.average)
+
+    def merge(self, other: "RunningStatistics") -> None:
+        """
+        Includes all the values seen by another :class:`RunningStatistics` instance, as if they had
+        been added here. This uses the pairwise update of Chan, Golub and LeVeque.
+
+        :param other: the statistics to merge into this instance
+        """
+
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.average - self.average
+        self.squares += other.squares + delta * delta * self.count * other.count / count
+        self.average += delta * other.count / count
+        self.count = count
+
+    def mean(self) -> float:
+        """
+        Computes the mean of the values.
+        """
+
+        return self.average
+
+    def stdev(self) -> float:
+        """
+        Computes the sample standard deviation of the values.
+        """
+
+        if self.count < 2:
+            return math.inf
+        return math.sqrt(self.squares / (self.count - 1))
+
+    def halfWidth(self, confidence: float = 0.95) -> float:
+        """
+        Computes half the width of the normal-approximation confidence interval for the mean.
+
+        :param confidence: the confidence level of the interval, for example 0.95
+        :return: the distance from the mean to either end of the interval
+        :rtype: float
+        """
+
+        if self.count < 2:
+            return math.inf
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * self.stdev() / math.sqrt(self.count)
+
+    def relativeError(self, confidence: float = 0.95) -> float:
+        """
+        Computes **RunningStatistics.halfWidth()** as a fraction of the mean.
+
+        :param confidence: the confidence level of the interval, for example 0.95
+        :rtype: float
+        """
+
+        if self.average == 0:
+            return math.inf
+        return self.halfWidth(confidence) / abs(self.average)
+
+    def state(self) -> list:
+        """
+        :return: the **count**, **average** and **squares**, which are all that is needed to
+            rebuild this accumulator.
+        :rtype: list
+        """
+
+        return [self.count, self.average, self.squares]
+
+    @classmethod
+    def fromState(cls, state: list) -> "RunningStatistics":
+        """
+        :param state: a **list** returned by **RunningStatistics.state()**.
+        :return: a new accumulator with the same values seen.
+        :rtype: :class:`RunningStatistics`
+        """
+
+        statistics = cls()
+        statistics.count, statistics.average, statistics.squares = state
+        return statistics
+
+
+class SessionStatistics:
+    """
+    :class:`SessionStatistics` collects the duration and maximum metrics of many sessions of play
+    as two :class:`RunningStatistics` instances.
+
+    .. attribute:: durations
+
+       The :class:`RunningStatistics` of the session durations.
+
+    .. attribute:: maxima
+
+       The :class:`RunningStatistics` of the session maximum stakes.
+
+    .. attribute:: elapsed
+
+       The wall-clock seconds spent producing these sessions.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates empty statistics.
+        """
+
+        self.durations = RunningStatistics()
+        self.maxima = RunningStatistics()
+        self.elapsed = 0.0
+
+    @property
+    def sessions(self) -> int:
+        """
+        The number of sessions collected.
+        """
+
+        return self.durations.count
+
+    def add(self, duration: int, maximum: int) -> None:
+        """
+        Includes the metrics of one more session.
+
+        :param duration: the session duration
+        :param maximum: the session maximum stake
+        """
+
+        self.durations.add(duration)
+        self.maxima.add(maximum)
+
+    def merge(self, other: "SessionStatistics") -> None:
+        """
+        Includes the sessions collected by another :class:`SessionStatistics` instance.
+
+        :param other: the statistics to merge into this instance
+        """
+
+        self.durations.merge(other.durations)
+        self.maxima.merge(other.maxima)
+        self.elapsed += other.elapsed
+
+    def asDict(self) -> Dict[str, Any]:
+        """
+        :return: the statistics as a **dict** of plain values, suitable for JSON.
+        :rtype: dict
+        """
+
+        return {
+            "durations": self.durations.state(),
+            "maxima": self.maxima.state(),
+            "elapsed": self.elapsed,
+        }
+
+    @classmethod
+    def fromDict(cls, values: Dict[str, Any]) -> "SessionStatistics":
+        """
+        :param values: a **dict** returned by **SessionStatistics.asDict()**.
+        :return: the statistics it describes.
+        :rtype: :class:`SessionStatistics`
+        """
+
+        statistics = cls()
+        statistics.durations = RunningStatistics.fromState(values["durations"])
+        statistics.maxima = RunningStatistics.fromState(values["maxima"])
+        statistics.elapsed = values["elapsed"]
+        return statistics
+
+    def precise(
+        self,
+        width: Optional[float] = None,
+        relativeError: Optional[float] = None,
+        confidence: float = 0.95,
+    ) -> bool:
+        """
+        Checks whether the confidence intervals on both the mean duration and the mean maximum
+        meet a target. With both targets given, meeting either one is enough.
+
+        :param width: the largest acceptable width of each confidence interval
+        :param relativeError: the largest acceptable half width, as a fraction of each mean
+        :param confidence: the confidence level of the intervals
+        :return: :samp:`True` if a target is met; :samp:`False` if none is given
+        :rtype: bool
+        """
+
+        for statistics in (self.durations, self.maxima):
+            narrow = width is not None and 2 * statistics.halfWidth(confidence) <= width
+            close = (
+                relativeError is not None
+                and statistics.relativeError(confidence) <= relativeError
+            )
+            if not (narrow or close):
+                return False
+        return True
+
+    def report(self, confidence: float = 0.95) -> Dict[str, float]:
+        """
+        Summarizes the statistics: the number of sessions, the elapsed time, and the mean,
+        standard deviation and confidence-interval half width of both metrics.
+
+        :param confidence: the confidence level of the intervals
+        :return: a flat **dict** of named values
+        :rtype: dict
+        """
+
+        summary: Dict[str, float] = {"sessions": self.sessions, "elapsed": self.elapsed}
+        for name, statistics in (
+            ("duration", self.durations),
+            ("maximum", self.maxima),
+        ):
+            summary[f"{name}_mean"] = statistics.mean()
+            summary[f"{name}_stdev"] = statistics.stdev()
+            summary[f"{name}_half_width"] = statistics.halfWidth(confidence)
+        return summary
@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from simulation_spec import SimulationSpec
+from worker_pool import Job, WarmPool
+from running_statistics import finite
+from players.player import Player
+
+
+class SimulationServer:
+    """
+    :class:`SimulationServer` answers simulation requests over a small local HTTP/JSON API, using
+    **asyncio**. It keeps a :py:class:`~worker_pool.WarmPool` of workers, each with its
+    :class:`Wheel` already built, so a request costs only its sessions and never a process start.
+
+    Jobs are identified by a hash of their :py:class:`~simulation_spec.SimulationSpec`. Posting a
+    spec identical to one still running returns the running job instead of starting it again.
+    Once a job finishes, only its final status is kept, and only for the last **retain** jobs.
+
+    The API is:
+
+    :samp:`POST /jobs`
+       Submits a job. The body is a **SimulationSpec.asDict()**; every field but
+       :samp:`"strategy"` may be left out. The strategy must be a :class:`Player` subclass from
+       the :mod:`players` package. The answer holds the job’s :samp:`"id"`.
+
+    :samp:`GET /jobs/{id}`
+       The job’s progress and, once finished, its **SessionStatistics.report()**, or its
+       :samp:`"error"` if a chunk failed. Values the report cannot give, such as the confidence
+       interval of a single session, are :samp:`null`.
+
+    :samp:`GET /jobs/{id}/progress`
+       Streams the job’s progress as one line of JSON per finished chunk, then a last line with
+       the report or the error.
+
+    :samp:`GET /queue`
+       The number of running jobs and of their chunks still waiting or running.
+
+    .. attribute:: pool
+
+       The warm workers running the jobs.
+
+    .. attribute:: jobs
+
+       A **dict** mapping the id of each running job to its :py:class:`~worker_pool.Job`.
+
+    .. attribute:: finished
+
+       An ordered **dict** mapping the ids of the last **retain** finished jobs to their final
+       **SimulationServer.status()**.
+
+    .. attribute:: retain
+
+       The number of finished jobs whose status is kept.
+    """
+
+    retain = 1000
+
+    def __init__(self, pool: WarmPool) -> None:
+        """
+        :param pool: the warm workers to run the jobs.
+        """
+
+        self.pool = pool
+        self.jobs: Dict[str, Job] = {}
+        self.finished: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def parseSpec(values: Dict[str, Any]) -> SimulationSpec:
+        """
+        Builds the spec of a submitted job. Only modules of the :mod:`players` package are
+        imported, so a request cannot import arbitrary code.
+
+        :param values: the decoded body of the request.
+        :return: the spec
+        :rtype: :py:class:`~simulation_spec.SimulationSpec`
+        :raises ValueError: if the strategy is not a :class:`Player` from :mod:`players`.
+        """
+
+        module = str(values.get("strategy", "")).partition(":")[0]
+        if module.split(".")[0] != "players":
+            raise ValueError("the strategy must come from the players package")
+        spec = SimulationSpec.fromDict(values)
+        if not (isinstance(spec.strategy, type) and issubclass(spec.strategy, Player)):
+            raise ValueError(f"{values['strategy']} is not a Player")
+        return spec
+
+    @staticmethod
+    def jobId(spec: SimulationSpec) -> str:
+        """
+        :param spec: a simulation.
+        :return: the id of its job, a hash of the spec.
+        :rtype: str
+        """
+
+        encoded = json.dumps(spec.asDict(), sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def submit(self, spec: SimulationSpec) -> str:
+        """
+        Submits a simulation to **pool**, unless an identical one is still running.
+
+        :param spec: the simulation.
+        :return: the id of its job
+        :rtype: str
+        """
+
+        self.prune()
+        key = self.jobId(spec)
+        if key not in self.jobs:
+            self.finished.pop(key, None)
+            self.jobs[key] = self.pool.submit(spec)
+        return key
+
+    def prune(self) -> None:
+        """
+        Moves the finished jobs out of **jobs**, keeping only their final status in **finished**
+        and dropping the oldest beyond **retain**.
+        """
+
+        for key in [key for key, job in self.jobs.items() if job.done()]:
+            self.finished[key] = self.status(key, self.jobs.pop(key))
+        while len(self.finished) > self.retain:
+            self.finished.popitem(last=False)
+
+    def queueDepth(self) -> Dict[str, int]:
+        """
+        :return: the number of unfinished jobs and of their chunks not yet done.
+        :rtype: dict
+        """
+
+        self.prune()
+        chunks = [
+            sum(not future.done() for future in job.futures)
+            for job in self.jobs.values()
+        ]
+        return {"jobs": sum(count > 0 for count in chunks), "chunks": sum(chunks)}
+
+    @staticmethod
+    def status(key: str, job: Job) -> Dict[str, Any]:
+        """
+        :param key: a job id.
+        :param job: the job.
+        :return: the job’s progress, and its report once it has finished or the error of the
+            first chunk which failed.
+        :rtype: dict
+        """
+
+        status: Dict[str, Any] = {
+            "id": key,
+            "done": sum(future.done() for future in job.futures),
+            "total": len(job.futures),
+        }
+        errors = [
+            future.exception()
+            for future in job.futures
+            if future.done() and not future.cancelled()
+        ]
+        error = next((error for error in errors if error is not None), None)
+        if job.cancelled():
+            status["cancelled"] = True
+        elif error is not None:
+            status["error"] = repr(error)
+        elif job.done():
+            status["report"] = finite(job.result().report())
+        return status
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        :param key: a job id.
+        :return: the job’s current status, or :samp:`None` if there is no such job.
+        :rtype: dict
+        """
+
+        self.prune()
+        if key in self.jobs:
+            return self.status(key, self.jobs[key])
+        return self.finished.get(key)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serves one HTTP request. A request which cannot be read, or a job which cannot be built,
+        is answered with status 400 before any other response is started.
+
+        :param reader: the request stream.
+        :param writer: the response stream.
+        """
+
+        try:
+            method, path, body = await self.readRequest(reader)
+            parts = path.strip("/").split("/")
+            spec = None
+            if method == "POST" and parts == ["jobs"]:
+                spec = self.parseSpec(json.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError, ImportError) as error:
+            await self.respond(writer, HTTPStatus.BAD_REQUEST, {"error": str(error)})
+        else:
+            await self.dispatch(writer, method, parts, spec)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def dispatch(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        parts: List[str],
+        spec: Optional[SimulationSpec],
+    ) -> None:
+        """
+        Answers a request which was read successfully.
+
+        :param writer: the response stream.
+        :param method: the HTTP method.
+        :param parts: the segments of the path.
+        :param spec: the spec of a submitted job, for :samp:`POST /jobs`.
+        """
+
+        if spec is not None:
+            await self.respond(writer, HTTPStatus.ACCEPTED, {"id": self.submit(spec)})
+        elif method == "GET" and parts == ["queue"]:
+            await self.respond(writer, HTTPStatus.OK, self.queueDepth())
+        elif method == "GET" and parts[0] == "jobs" and len(parts) in (2, 3):
+            status = self.lookup(parts[1])
+            if status is None:
+                await self.respond(
+                    writer, HTTPStatus.NOT_FOUND, {"error": "no such job"}
+                )
+            elif len(parts) == 3 and parts[2] == "progress":
+                await self.stream(writer, parts[1])
+            else:
+                await self.respond(writer, HTTPStatus.OK, status)
+        else:
+            await self.respond(writer, HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    @staticmethod
+    async def readRequest(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        """
+        Reads an HTTP request.
+
+        :param reader: the request stream.
+        :return: the method, the path and the body
+        :rtype: tuple
+        """
+
+        method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return method, path, await reader.readexactly(length)
+
+    @staticmethod
+    async def respond(
+        writer: asyncio.StreamWriter, status: HTTPStatus, body: Dict[str, Any]
+    ) -> None:
+        """
+        Writes a complete JSON response.
+
+        :param writer: the response stream.
+        :param status: the HTTP status.
+        :param body: the JSON body.
+        """
+
+        encoded = json.dumps(body, allow_nan=False).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(encoded)}\r\n"
+            "Connection: close\r\n\r\n".encode() + encoded
+        )
+        await writer.drain()
+
+    async def stream(self, writer: asyncio.StreamWriter, key: str) -> None:
+        """
+        Streams a job’s progress as newline-delimited JSON: one **SimulationServer.status()** line
+        when the stream starts and after each chunk finishes, the last one with the report or the
+        error. A job which has already finished streams its final status alone.
+
+        :param writer: the response stream.
+        :param key: the id of a running or finished job.
+        """
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        job = self.jobs.get(key)
+        if job is None:
+            writer.write(
+                json.dumps(self.finished[key], allow_nan=False).encode() + b"\n"
+            )
+            await writer.drain()
+            return
+        pending = {asyncio.wrap_future(future) for future in job.futures}
+        while True:
+            status = self.status(key, job)
+            writer.write(json.dumps(status, allow_nan=False).encode() + b"\n")
+            await writer.drain()
+            if not pending or "cancelled" in status or "error" in status:
+                break
+            _, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """
+        Starts **pool**, then starts listening for requests. The workers are started first so
+        that they do not inherit the listening socket or any client connection, and from the
+        event loop’s own thread, as a process forked while another thread holds a lock can
+        deadlock.
+
+        :param host: the host to listen on.
+        :param port: the port to listen on; 0 picks a free port.
+        :return: the running server
+        :rtype: :py:class:`~asyncio.Server`
+        """
+
+        self.pool.start()
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def _serveForever(host: str, port: int, workers: Optional[int]) -> None:
+    """
+    Runs a :class:`SimulationServer` until the process is stopped.
+    """
+
+    with WarmPool(workers) as pool:
+        server = await SimulationServer(pool).serve(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:  # pragma: no cover
+    """
+    Runs a :class:`SimulationServer` on the address named on the command line, as in
+    ``python server.py --port 8000``.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Serve roulette simulations over HTTP."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="the port to listen on")
+    parser.add_argument("--workers", type=int, help="the number of worker processes")
+    arguments = parser.parse_args()
+    asyncio.run(_serveForever(arguments.host, arguments.port, arguments.workers))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
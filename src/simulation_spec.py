@@ -0,0 +1,210 @@
+import hashlib
+import importlib
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple, Type
+from wheel import Wheel
+from bin_builder import BinBuilder
+from table import Table
+from game import Game
+from simulator import Simulator
+from running_statistics import SessionStatistics
+from players.player import Player
+
+
+def buildWheel() -> Wheel:
+    """
+    Creates a :class:`Wheel` and populates its bins with :class:`BinBuilder`. A built wheel is
+    never changed by play, and the masks of its bins are computed up front, so one can be shared
+    by every simulation in a process.
+
+    :return: the built wheel
+    :rtype: :class:`Wheel`
+    """
+
+    wheel = Wheel()
+    BinBuilder().buildBins(wheel)
+    wheel.precomputeMasks()
+    return wheel
+
+
+class Results(Protocol):
+    """
+    Anything the duration and maximum of each session can be appended to by
+    **SimulationSpec.run()**: a **list**, or a :py:class:`~column_file.ColumnWriter` streaming
+    them to disk.
+    """
+
+    def append(self, result: Tuple[int, int], /) -> None:
+        """
+        :param result: the duration and maximum of one session.
+        """
+
+
+@dataclass(frozen=True)
+class SimulationSpec:
+    """
+    :class:`SimulationSpec` describes one simulation completely: the strategy, the
+    :class:`Simulator` and :class:`Table` parameters and a seed. It can be built into a
+    :class:`Simulator` anywhere a built :class:`Wheel` is available, including in another process.
+
+    Every session has its own seed, derived from **seed** and the session’s index. Sessions with
+    the same index therefore see the same spins in every spec with the same **seed**, whatever the
+    strategy or parameters, which gives common random numbers across the cells of a sweep.
+
+    .. attribute:: strategy
+
+       The :class:`Player` subclass to simulate.
+
+    .. attribute:: stake
+
+       The initial stake, **Simulator.initStake**.
+
+    .. attribute:: duration
+
+       The initial rounds to go, **Simulator.initDuration**.
+
+    .. attribute:: limit
+
+       The table limit, **Table.limit**.
+
+    .. attribute:: samples
+
+       The number of sessions, **Simulator.samples**.
+
+    .. attribute:: seed
+
+       The base seed of the sessions.
+
+    .. attribute:: engine
+
+       The **Simulator.engine** to use.
+    """
+
+    strategy: Type[Player]
+    stake: int = 100
+    duration: int = 250
+    limit: int = 300
+    samples: int = 50
+    seed: int = 0
+    engine: str = "object"
+
+    def build(self, wheel: Wheel) -> Simulator:
+        """
+        Creates a :class:`Table`, a :class:`Game` and the strategy’s :class:`Player`, and a
+        :class:`Simulator` configured with this spec’s parameters.
+
+        :param wheel: a built wheel
+        :return: the configured simulator
+        :rtype: :class:`Simulator`
+        """
+
+        table = Table()
+        table.limit = self.limit
+        simulator = Simulator(Game(wheel, table), self.strategy.create(table, wheel))
+        simulator.initStake = self.stake
+        simulator.initDuration = self.duration
+        simulator.samples = self.samples
+        simulator.engine = self.engine
+        return simulator
+
+    def asDict(self) -> Dict[str, Any]:
+        """
+        :return: the spec as a **dict** of plain values, suitable for JSON. The strategy is named
+            by its module and qualified name, as in :samp:`"players.martingale:Martingale"`.
+        :rtype: dict
+        """
+
+        values = asdict(self)
+        values["strategy"] = f"{self.strategy.__module__}:{self.strategy.__qualname__}"
+        return values
+
+    @classmethod
+    def fromDict(cls, values: Dict[str, Any]) -> "SimulationSpec":
+        """
+        :param values: a **dict** returned by **SimulationSpec.asDict()**.
+        :return: the spec it describes, with the strategy class imported by name.
+        :rtype: :class:`SimulationSpec`
+        """
+
+        module, qualname = values["strategy"].split(":")
+        strategy: Any = importlib.import_module(module)
+        for name in qualname.split("."):
+            strategy = getattr(strategy, name)
+        return cls(**{**values, "strategy": strategy})
+
+    def sessionSeed(self, index: int, stream: str) -> int:
+        """
+        Derives the seed of one random stream of one session by hashing **seed**, the session’s
+        index and the stream’s name. The :class:`Wheel` and the :class:`Player` each get their
+        own stream, so a player choosing its bets at random draws them independently of the
+        spins: seeding both from one value would replay the same Mersenne Twister sequence in
+        each, and correlate the bets with the winning bins.
+
+        :param index: the session index
+        :param stream: the name of the stream, :samp:`"wheel"` or :samp:`"player"`
+        :return: the seed of the stream
+        :rtype: int
+        """
+
+        key = f"{self.seed}:{index}:{stream}".encode()
+        return int.from_bytes(hashlib.blake2b(key, digest_size=16).digest(), "big")
+
+    def sessions(
+        self, wheel: Wheel, start: int = 0, count: Optional[int] = None
+    ) -> Iterator[Tuple[int, List[int]]]:
+        """
+        Plays the sessions with indexes **start** to **start** + **count**, or to **samples**
+        when no count is given, one at a time. Before each session the :class:`Player` is
+        restored to its initial state and the :class:`Wheel` and the player are each seeded with
+        their own **sessionSeed()**, so a session’s result depends only on its index, not on
+        which sessions ran before it or where.
+
+        :param wheel: a built wheel
+        :param start: the index of the first session
+        :param count: the number of sessions
+        :return: an iterator over the index and the stake values of each session
+        :rtype: iterator
+        """
+
+        simulator = self.build(wheel)
+        player = simulator.player
+        initial = player.snapshot()
+        if count is None:
+            count = self.samples - start
+        for index in range(start, start + count):
+            player.restore(initial)
+            player.reseed(self.sessionSeed(index, "player"))
+            wheel.rng.seed(self.sessionSeed(index, "wheel"))
+            yield index, simulator.runSession()
+
+    def run(
+        self,
+        wheel: Wheel,
+        start: int = 0,
+        count: Optional[int] = None,
+        results: Optional[Results] = None,
+    ) -> SessionStatistics:
+        """
+        Runs the sessions of **SimulationSpec.sessions()** and summarizes them. A session which
+        ends before its first round, for example with a stake of 0 or a table limit below the
+        first bet, counts with a duration of 0 and a maximum of the initial stake.
+
+        :param wheel: a built wheel
+        :param start: the index of the first session
+        :param count: the number of sessions
+        :param results: if given, the duration and maximum of each session are appended to it
+        :return: the statistics of these sessions
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        """
+
+        statistics = SessionStatistics()
+        begin = time.perf_counter()
+        for _, stake_values in self.sessions(wheel, start, count):
+            duration = len(stake_values)
+            maximum = max(stake_values, default=self.stake)
+            statistics.add(duration, maximum)
+            if results is not None:
+                results.append((duration, maximum))
+        statistics.elapsed = time.perf_counter() - begin
+        return statistics
@@ -1,6 +1,15 @@
+import hashlib
+import time
+from itertools import accumulate
+from typing import Iterable, Optional, Tuple
 from game import Game
+from checkpoint import Checkpoint
+from trajectory_store import TrajectoryWriter
+from trajectory_sampling import TrajectorySampler
+from percentile_bands import PercentileBands
 from invalid_bet import InvalidBet
 from integer_statistics import IntegerStatistics
+from running_statistics import SessionStatistics
 from players.player import Player
 
 
@@ -42,8 +51,23 @@ class Simulator:
 
        The casino game we are simulating. This is an instance of the :class:`Game` class,
        which embodies the various rules, the :class:`Table` object and the :class:`Wheel` instance.
+
+    .. attribute:: engine
+
+       Selects how sessions are played. :samp:`"object"`, the default, cycles the :class:`Game`
+       every round. :samp:`"fast"` settles a pre-generated bet schedule for an outcome-independent
+       :class:`Player`, see **Simulator.scheduledSession()**, and uses **Game.fastCycle()** for
+       every other :class:`Player`, see **Simulator.fastSession()**.
+
+    .. attribute:: confidence
+
+       The confidence level of the intervals **Simulator.gatherUntil()** checks. The default is
+       0.95.
     """
 
+    engine = "object"
+    confidence = 0.95
+
     def __init__(self, game: Game, player: Player) -> None:
         """
         Saves the Player and :class:`Game` instances so we can gather statistics on the performance
@@ -67,15 +91,26 @@ class Simulator:
         :rtype: list
 
         Executes a single game session. The :class:`Player` instance is initialized with their
-        initial stake and initial cycles to go. An empty **list** of stake values is created.
-        The session loop executes until the **Player.playing()** method returns false. This loop
-        executes the **Game.cycle()** method; then it gets the stake from the :class:`Player` and
-        appends this amount to the **list** of stake values. The **list** of individual stake
-        values is returned as the result of the session of play.
+        initial stake and initial cycles to go, and **Simulator.continueSession()** plays the
+        session out.
         """
 
         self.player.stake = self.initStake
         self.player.roundsToGo = self.initDuration
+        return self.continueSession()
+
+    def continueSession(self) -> list[int]:
+        """
+        :return: list of stake values.
+        :rtype: list
+
+        Plays the current session from wherever the :class:`Player` is now. An empty **list** of
+        stake values is created. The session loop executes until the **Player.playing()** method
+        returns false. This loop executes the **Game.cycle()** method; then it gets the stake from
+        the :class:`Player` and appends this amount to the **list** of stake values. The **list**
+        of individual stake values is returned as the result of the session of play.
+        """
+
         stake_values = []
         try:
             while self.player.playing():
@@ -87,19 +122,396 @@ class Simulator:
             pass
         return stake_values
 
+    def snapshot(self) -> Tuple[Tuple, Tuple]:
+        """
+        :return: the :class:`Player` snapshot and the :class:`Wheel` snapshot.
+        :rtype: tuple
+
+        Captures the state of play, mid-session or between sessions, so it can be restored with
+        **Simulator.restore()**.
+        """
+
+        return self.player.snapshot(), self.game.wheel.snapshot()
+
+    def restore(self, snapshot: Tuple[Tuple, Tuple]) -> None:
+        """
+        :param snapshot: a **tuple** returned by **Simulator.snapshot()**.
+
+        Puts the :class:`Player` and the :class:`Wheel` back into a captured state of play.
+        """
+
+        player_snapshot, wheel_snapshot = snapshot
+        self.player.restore(player_snapshot)
+        self.game.wheel.restore(wheel_snapshot)
+
+    def branch(
+        self, snapshot: Tuple[Tuple, Tuple], seeds: Iterable[int]
+    ) -> list[list[int]]:
+        """
+        :param snapshot: a **tuple** returned by **Simulator.snapshot()**, usually mid-session.
+        :param seeds: one seed for the :class:`Wheel` per continuation.
+        :return: a **list** of stake values for each continuation.
+        :rtype: list
+
+        Plays several continuations of a session from a common prefix. For each seed, the
+        snapshot is restored, the :class:`Wheel` is reseeded so the continuations differ, and
+        **Simulator.continueSession()** plays out the rest of the session. This is much cheaper
+        than replaying the prefix for every continuation.
+        """
+
+        continuations = []
+        for seed in seeds:
+            self.restore(snapshot)
+            self.game.wheel.rng.seed(seed)
+            continuations.append(self.continueSession())
+        return continuations
+
+    def fastSession(self) -> list[int]:
+        """
+        :return: list of stake values.
+        :rtype: list
+
+        Executes a single game session like **Simulator.session()**, using **Game.fastCycle()**.
+        The :class:`Player` is bound to the :class:`Game` once for the whole session, and the
+        :class:`Table`’s **list** of bets is cleared in place each round rather than replaced.
+
+        A table-limit violation ends the session through the status returned by
+        **Game.fastCycle()**, so no exception is raised. :class:`InvalidBet` is still caught for
+        a :class:`Player` which only implements **Player.placeBets()**.
+        """
+
+        player = self.player
+        player.stake = self.initStake
+        player.roundsToGo = self.initDuration
+        self.game.bind(player)
+        fast_cycle = self.game.fastCycle
+        bets = player.table.bets
+        stake_values: list[int] = []
+        append = stake_values.append
+        try:
+            while player.playing():
+                bets.clear()
+                if not fast_cycle(player):
+                    break
+                append(player.stake)
+                player.roundsToGo -= 1
+        except InvalidBet:
+            pass
+        return stake_values
+
+    def scheduledSession(self) -> list[int]:
+        """
+        :return: list of stake values.
+        :rtype: list
+
+        Executes a single game session for an **outcomeIndependent** :class:`Player` without
+        cycling the :class:`Game`. The whole session's bets come from **Player.betSchedule()** and
+        are settled against a block of **initDuration** spins: the masks of all the spins are drawn
+        first, the bit, net win and loss of each distinct outcome and amount are looked up once,
+        and the per-round change in stake is picked from those by testing each spin's
+        :py:attr:`~bin.Bin.mask`. **itertools.accumulate()** turns the changes into stake values.
+        The session is then cut at the first round where **Player.playing()** returns false.
+
+        A whole session's worth of bets and spins is always drawn, so a session that ends early
+        consumes more random numbers than **Simulator.session()** would: more of the
+        :class:`Wheel`'s, and, for a :class:`Player` drawing its bets at random, such as
+        :py:class:`~players.random.PlayerRandom`, more of the player's own. From the second
+        session on, the two engines therefore play different spins and bets, with the same
+        distribution. Seed each session, as **SimulationSpec.run()** does, to make every session
+        independent of the ones before it.
+        """
+
+        rounds = self.initDuration
+        choose = self.game.wheel.choose
+        schedule = self.player.betSchedule(rounds)
+        masks = [choose().mask for _ in range(rounds)]
+        terms = {
+            (bet.outcome, bet.amount): (
+                bet.outcome.bit,
+                bet.winAmount() - bet.amount,
+                -bet.amount,
+            )
+            for bet in schedule
+        }
+        changes = []
+        for bet, mask in zip(schedule, masks):
+            bit, win, loss = terms[bet.outcome, bet.amount]
+            changes.append(win if mask & bit else loss)
+        stakes = list(accumulate(changes, initial=self.initStake))
+
+        duration = 0
+        while duration < rounds:
+            self.player.stake = stakes[duration]
+            self.player.roundsToGo = rounds - duration
+            if not self.player.playing():
+                break
+            duration += 1
+        self.player.stake = stakes[duration]
+        self.player.roundsToGo = rounds - duration
+        return stakes[1 : duration + 1]
+
+    def runSession(self) -> list[int]:
+        """
+        :return: list of stake values.
+        :rtype: list
+
+        Executes a single game session with the selected **engine**. The :samp:`"fast"` engine uses
+        **Simulator.scheduledSession()** when the :class:`Player` is **outcomeIndependent** and
+        **Simulator.fastSession()** otherwise. The :samp:`"object"` engine uses
+        **Simulator.session()**.
+        """
+
+        if self.engine == "fast":
+            if self.player.outcomeIndependent:
+                return self.scheduledSession()
+            return self.fastSession()
+        return self.session()
+
     def gather(self) -> None:
         """
-        Executes the number of games sessions in samples. Each game session returns a **list** of
-        stake values. When the session is over (either the play reached their time limit or their
-        stake was spent), then the length of the session **list** and the maximum value in the
-        session **list** are the resulting duration and maximum metrics. These two metrics are
-        appended to the **durations** list and the **maxima** list.
+        Executes the number of games sessions in samples using **Simulator.runSession()**. Each
+        game session returns a **list** of stake values. When the session is over (either the play
+        reached their time limit or their stake was spent), then the length of the session
+        **list** and the maximum value in the session **list** are the resulting duration and
+        maximum metrics. These two metrics are appended to the **durations** list and the
+        **maxima** list.
 
         A client class will either display the durations and maxima raw metrics or produce
         statistical summaries.
         """
 
         for _ in range(self.samples):
-            stake_values: list[int] = self.session()
+            stake_values: list[int] = self.runSession()
             self.maxima.append(max(stake_values))
             self.durations.append(len(stake_values))
+
+    def gatherBatch(
+        self, statistics: SessionStatistics, count: int, keep: bool = True
+    ) -> None:
+        """
+        :param statistics: the streaming statistics to feed.
+        :param count: the number of sessions to run.
+        :param keep: also append the metrics to **durations** and **maxima**.
+
+        Runs **count** sessions with **Simulator.runSession()**, adding their metrics to
+        **statistics** and, if **keep** is set, appending them to **durations** and **maxima**.
+        A session which ends before its first round counts with a maximum of **initStake**.
+        """
+
+        for _ in range(count):
+            stake_values = self.runSession()
+            duration = len(stake_values)
+            maximum = max(stake_values, default=self.initStake)
+            if keep:
+                self.maxima.append(maximum)
+                self.durations.append(duration)
+            statistics.add(duration, maximum)
+
+    def gatherTrajectories(self, writer: TrajectoryWriter) -> SessionStatistics:
+        """
+        :param writer: where to store the trajectories.
+        :return: the streaming statistics of the **samples** sessions.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        Runs **samples** sessions with **Simulator.runSession()** and appends the stake values
+        of each one to **writer**, so whole trajectories can be kept for millions of sessions.
+        A session which ends before its first round is stored empty and counts with a maximum
+        of **initStake**. **durations** and **maxima** do not grow.
+        """
+
+        statistics = SessionStatistics()
+        start = time.perf_counter()
+        for _ in range(self.samples):
+            stake_values = self.runSession()
+            writer.append(stake_values)
+            statistics.add(len(stake_values), max(stake_values, default=self.initStake))
+        statistics.elapsed = time.perf_counter() - start
+        return statistics
+
+    def gatherSampled(self, sampler: TrajectorySampler) -> SessionStatistics:
+        """
+        :param sampler: the policy choosing which trajectories to keep.
+        :return: the streaming statistics of the **samples** sessions.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        Runs **samples** sessions like **Simulator.gatherTrajectories()**, but only the
+        sessions **sampler** chooses keep their stake values, in **TrajectorySampler.captured**;
+        the metrics of every session go to the returned statistics alone. Sessions are indexed
+        from 0 in the order they are run. **durations** and **maxima** do not grow.
+        """
+
+        statistics = SessionStatistics()
+        start = time.perf_counter()
+        offer = sampler.offer
+        for index in range(self.samples):
+            stake_values = self.runSession()
+            statistics.add(len(stake_values), max(stake_values, default=self.initStake))
+            offer(index, stake_values)
+        statistics.elapsed = time.perf_counter() - start
+        return statistics
+
+    def gatherBands(self, bands: PercentileBands) -> SessionStatistics:
+        """
+        :param bands: the accumulator of the stake at each round.
+        :return: the streaming statistics of the **samples** sessions.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        Runs **samples** sessions with **Simulator.runSession()** and feeds the stake after each
+        round of every session to **bands**, from which the percentile bands of the stake over
+        time can be read once the run is over. No trajectory is kept. **durations** and
+        **maxima** do not grow.
+        """
+
+        statistics = SessionStatistics()
+        start = time.perf_counter()
+        for _ in range(self.samples):
+            stake_values = self.runSession()
+            statistics.add(len(stake_values), max(stake_values, default=self.initStake))
+            bands.add(stake_values, self.initStake)
+        statistics.elapsed = time.perf_counter() - start
+        return statistics
+
+    def identity(self) -> str:
+        """
+        :return: a digest of everything that decides the sessions from here on.
+        :rtype: str
+
+        Hashes the :class:`Player` class and the current **Simulator.snapshot()**, which includes
+        the :class:`Wheel`’s random number generator state and so stands for the seed, together
+        with **initStake**, **initDuration**, the **Table.limit** and **engine**. Two runs with the
+        same identity play the same sessions.
+        """
+
+        player_class = type(self.player)
+        description = repr(
+            (
+                f"{player_class.__module__}:{player_class.__qualname__}",
+                self.snapshot(),
+                self.initStake,
+                self.initDuration,
+                self.player.table.limit,
+                self.engine,
+            )
+        )
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def gatherCheckpointed(
+        self, checkpoint: Checkpoint, resume: bool = True
+    ) -> SessionStatistics:
+        """
+        :param checkpoint: where to save progress.
+        :param resume: continue from the saved checkpoint, if there is one.
+        :return: the streaming statistics of all **samples** sessions.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        Runs **samples** sessions like **Simulator.gather()**, in batches of
+        **Checkpoint.interval** sessions, and saves a checkpoint after each batch. When resuming,
+        the saved **Simulator.snapshot()** is restored and gathering continues from the saved
+        session count, so the final statistics are identical to those of an uninterrupted run.
+
+        Each checkpoint records the **Simulator.identity()** taken before the first session, and
+        resuming from a checkpoint with a different identity raises :samp:`ValueError`. The
+        **samples** may differ, so a finished run can be extended.
+
+        The metrics are appended to **durations** and **maxima** as usual, but after a resume
+        those only hold the sessions run since; the returned statistics cover every session.
+        """
+
+        identity = self.identity()
+        index, statistics = 0, SessionStatistics()
+        saved = checkpoint.load(identity) if resume else None
+        if saved is not None:
+            index, snapshot, statistics = saved
+            self.restore(snapshot)
+        start = time.perf_counter() - statistics.elapsed
+        while index < self.samples:
+            count = min(checkpoint.interval, self.samples - index)
+            self.gatherBatch(statistics, count)
+            index += count
+            statistics.elapsed = time.perf_counter() - start
+            checkpoint.save(identity, index, self.snapshot(), statistics)
+        return statistics
+
+    def gatherUntil(
+        self,
+        width: Optional[float] = None,
+        relativeError: Optional[float] = None,
+        maxSessions: int = 1_000_000,
+        maxSeconds: Optional[float] = None,
+    ) -> SessionStatistics:
+        """
+        :param width: the target width of the confidence intervals on the means.
+        :param relativeError: the target half width, as a fraction of each mean.
+        :param maxSessions: the most sessions to run, whatever the precision.
+        :param maxSeconds: the most wall-clock seconds to run, whatever the precision.
+        :return: the streaming statistics of every session run.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        The sequential form of **Simulator.gather()**. Sessions are run in batches of
+        **samples**, and their metrics are fed to a
+        :py:class:`~running_statistics.SessionStatistics` only; **durations** and **maxima** do
+        not grow. After each batch the **confidence** intervals on the mean duration and the mean
+        maximum are checked with **SessionStatistics.precise()**, and gathering stops as soon as
+        they meet the target or a cap is reached. The clock is only read once per batch.
+
+        :raises ValueError: if neither **width** nor **relativeError** is given, or **samples**
+            is less than one.
+        """
+
+        if width is None and relativeError is None:
+            raise ValueError("gatherUntil needs a width or a relativeError target")
+        if self.samples < 1:
+            raise ValueError("gatherUntil needs samples of at least 1")
+        statistics = SessionStatistics()
+        start = time.perf_counter()
+        while statistics.sessions < maxSessions:
+            self.gatherBatch(
+                statistics,
+                min(self.samples, maxSessions - statistics.sessions),
+                keep=False,
+            )
+            statistics.elapsed = time.perf_counter() - start
+            if statistics.precise(width, relativeError, self.confidence):
+                break
+            if maxSeconds is not None and statistics.elapsed >= maxSeconds:
+                break
+        return statistics
+
+    def gatherFor(self, seconds: float) -> SessionStatistics:
+        """
+        :param seconds: the wall-clock budget.
+        :return: the streaming statistics of every session run.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+
+        Runs as many sessions as fit in **seconds**. The clock is read once per batch, never per
+        spin. The first batch is a single session, and each batch after that is at most twice
+        the sessions run so far, until the average session time gives a usable rate; each batch
+        is then sized from that rate to fit what is left of the budget, up to **samples**
+        sessions, and gathering stops when not even one more session is expected to fit. Slow
+        strategies, whose sessions are long, get small batches and cannot overrun a short
+        budget by much, and fast ones soon get batches of **samples** sessions. The metrics are
+        fed to a :py:class:`~running_statistics.SessionStatistics` only; **durations** and
+        **maxima** do not grow. With no budget, no session is run.
+
+        The returned statistics hold the number of sessions completed and the elapsed time, and
+        **SessionStatistics.report()** gives the precision achieved.
+        """
+
+        statistics = SessionStatistics()
+        if seconds <= 0:
+            return statistics
+        start = time.perf_counter()
+        batch = 1
+        while batch > 0:
+            self.gatherBatch(statistics, batch, keep=False)
+            statistics.elapsed = time.perf_counter() - start
+            remaining = seconds - statistics.elapsed
+            if remaining <= 0:
+                break
+            fit = (
+                int(remaining * statistics.sessions / statistics.elapsed)
+                if statistics.elapsed
+                else self.samples
+            )
+            batch = min(self.samples, 2 * statistics.sessions, fit)
+        return statistics
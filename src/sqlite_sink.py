@@ -0,0 +1,194 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+from wheel import Wheel
+from simulation_spec import SimulationSpec
+from running_statistics import SessionStatistics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    strategy TEXT NOT NULL,
+    stake INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    table_limit INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    started REAL NOT NULL,
+    elapsed REAL,
+    sessions INTEGER
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    run INTEGER NOT NULL REFERENCES runs (id),
+    session INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    maximum INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    PRIMARY KEY (run, session)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_parameters
+    ON runs (strategy, table_limit, stake, duration, seed);
+CREATE INDEX IF NOT EXISTS sessions_maximum ON sessions (run, maximum);
+"""
+"""
+The tables of a results database: one row of metadata per run, and one summary row per
+session, keyed by the run and the session index.
+"""
+
+
+class SqliteSink:
+    """
+    :class:`SqliteSink` records simulation results in a local SQLite database, so questions
+    about past runs, such as every :class:`~players.martingale.Martingale` session with a
+    maximum over 500 at a table limit of 300, are answered by an indexed query instead of a new
+    run. See **SCHEMA** for the tables.
+
+    Each session is stored with its index in the run; with the run’s seed, that is enough for
+    **SimulationSpec.sessions()** to replay it exactly.
+
+    Inserting must keep up with the simulator, so the database uses write-ahead logging with
+    :samp:`synchronous=NORMAL`, which makes a commit cost no disk sync, and session rows are
+    inserted **batch** at a time with **executemany()** in one transaction per batch.
+
+    The sink is a context manager; leaving the **with** block closes the database.
+
+    .. attribute:: connection
+
+       The :py:class:`~sqlite3.Connection` to the database, for queries of any kind.
+
+    .. attribute:: batch
+
+       The number of session rows inserted per transaction.
+    """
+
+    batch = 10_000
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        :param path: the database file; it is created with its tables if need be.
+        """
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def record(
+        self, spec: SimulationSpec, wheel: Wheel
+    ) -> Tuple[int, SessionStatistics]:
+        """
+        Runs every session of a simulation, recording the run and a summary of each session:
+        its duration, its maximum stake and its final stake. A session which ends before its
+        first round has a duration of 0 and a maximum and final stake of the initial stake.
+
+        :param spec: the simulation.
+        :param wheel: a built wheel.
+        :return: the id of the run in the database, and the statistics of its sessions.
+        :rtype: tuple
+        """
+
+        with self.connection:
+            run = self.connection.execute(
+                "INSERT INTO runs (strategy, stake, duration, table_limit, samples, seed, "
+                "engine, started) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    spec.asDict()["strategy"],
+                    spec.stake,
+                    spec.duration,
+                    spec.limit,
+                    spec.samples,
+                    spec.seed,
+                    spec.engine,
+                    time.time(),
+                ),
+            ).lastrowid
+        assert run is not None
+        statistics = SessionStatistics()
+        begin = time.perf_counter()
+        rows: List[Tuple[int, int, int, int, int]] = []
+        for index, stake_values in spec.sessions(wheel):
+            duration = len(stake_values)
+            maximum = max(stake_values, default=spec.stake)
+            statistics.add(duration, maximum)
+            rows.append(
+                (
+                    run,
+                    index,
+                    duration,
+                    maximum,
+                    stake_values[-1] if duration else spec.stake,
+                )
+            )
+            if len(rows) >= self.batch:
+                self.insert(rows)
+                rows = []
+        self.insert(rows)
+        statistics.elapsed = time.perf_counter() - begin
+        with self.connection:
+            self.connection.execute(
+                "UPDATE runs SET elapsed = ?, sessions = ? WHERE id = ?",
+                (statistics.elapsed, statistics.sessions, run),
+            )
+        return run, statistics
+
+    def insert(self, rows: List[Tuple[int, int, int, int, int]]) -> None:
+        """
+        Inserts session rows in one transaction.
+
+        :param rows: the run, session index, duration, maximum and final stake of each session.
+        """
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO sessions (run, session, duration, maximum, final) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def find(
+        self,
+        strategy: str,
+        limit: Optional[int] = None,
+        minimum: Optional[int] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Looks up recorded sessions through the indexes.
+
+        :param strategy: the strategy, named as in **SimulationSpec.asDict()**, such as
+            :samp:`"players.martingale:Martingale"`.
+        :param limit: only sessions at this table limit.
+        :param minimum: only sessions whose maximum stake exceeds this.
+        :return: the run id, seed, session index, duration, maximum and final stake of each
+            matching session, ordered by run and session.
+        :rtype: list
+        """
+
+        query = (
+            "SELECT runs.id, runs.seed, session, sessions.duration, maximum, final "
+            "FROM runs JOIN sessions ON sessions.run = runs.id WHERE strategy = ?"
+        )
+        parameters: List[Any] = [strategy]
+        if limit is not None:
+            query += " AND table_limit = ?"
+            parameters.append(limit)
+        if minimum is not None:
+            query += " AND maximum > ?"
+            parameters.append(minimum)
+        return self.connection.execute(
+            query + " ORDER BY runs.id, session", parameters
+        ).fetchall()
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+
+        self.connection.close()
+
+    def __enter__(self) -> "SqliteSink":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.close()
@@ -0,0 +1,216 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+from wheel import Wheel
+from simulation_spec import SimulationSpec, buildWheel
+from worker_pool import WarmPool
+from players.player import Player
+
+_wheel: Optional[Wheel] = None
+
+
+def _initWorker() -> None:
+    """
+    Builds the :class:`Wheel` once in each worker process.
+    """
+
+    global _wheel  # pylint: disable=global-statement
+    _wheel = buildWheel()
+
+
+def _runCell(spec: SimulationSpec) -> Dict[str, Any]:
+    """
+    Runs one cell of a sweep in a worker process and returns its result row.
+    """
+
+    assert _wheel is not None
+    return Sweep.row(spec, spec.run(_wheel).report())
+
+
+class Sweep:
+    """
+    :class:`Sweep` runs a :class:`Simulator` study over a design of strategies, initial stakes,
+    durations and table limits. Each point of the design is a cell, described by a
+    :py:class:`~simulation_spec.SimulationSpec`, and produces one result row.
+
+    All cells share one **seed**, so session *i* of every cell sees the same spins: differences
+    between cells come from the parameters, not from the luck of the wheel.
+
+    .. attribute:: strategies
+
+       The :class:`Player` subclasses to sweep over.
+
+    .. attribute:: stakes
+
+       The initial stakes to sweep over.
+
+    .. attribute:: durations
+
+       The session durations to sweep over.
+
+    .. attribute:: limits
+
+       The table limits to sweep over.
+
+    .. attribute:: template
+
+       The :py:class:`~simulation_spec.SimulationSpec` providing **samples**, **seed** and
+       **engine** for every cell. It starts as the default spec of the first strategy; replace it
+       to change those parameters.
+    """
+
+    def __init__(
+        self,
+        strategies: Sequence[Type[Player]],
+        stakes: Sequence[int] = (100,),
+        durations: Sequence[int] = (250,),
+        limits: Sequence[int] = (300,),
+    ) -> None:
+        """
+        :param strategies: the :class:`Player` subclasses to sweep over.
+        :param stakes: the initial stakes to sweep over; a **range** works well.
+        :param durations: the session durations to sweep over.
+        :param limits: the table limits to sweep over.
+        """
+
+        self.strategies = list(strategies)
+        self.stakes = list(stakes)
+        self.durations = list(durations)
+        self.limits = list(limits)
+        self.template = SimulationSpec(self.strategies[0])
+
+    def cell(
+        self, strategy: Type[Player], stake: int, duration: int, limit: int
+    ) -> SimulationSpec:
+        """
+        :return: the spec of one cell, based on **template**.
+        :rtype: :py:class:`~simulation_spec.SimulationSpec`
+        """
+
+        return replace(
+            self.template,
+            strategy=strategy,
+            stake=stake,
+            duration=duration,
+            limit=limit,
+        )
+
+    def grid(self) -> List[SimulationSpec]:
+        """
+        The full factorial design: one cell for every combination of the values.
+
+        :return: the cell specs
+        :rtype: list
+        """
+
+        return [
+            self.cell(*values)
+            for values in product(
+                self.strategies, self.stakes, self.durations, self.limits
+            )
+        ]
+
+    def randomDesign(self, cells: int, rng: random.Random) -> List[SimulationSpec]:
+        """
+        A design of **cells** cells, each taking a value from every axis independently at random.
+
+        :param cells: the number of cells
+        :param rng: the random number generator choosing the values
+        :return: the cell specs
+        :rtype: list
+        """
+
+        axes: Tuple[List, ...] = (
+            self.strategies,
+            self.stakes,
+            self.durations,
+            self.limits,
+        )
+        return [self.cell(*(rng.choice(axis) for axis in axes)) for _ in range(cells)]
+
+    def latinHypercube(self, cells: int, rng: random.Random) -> List[SimulationSpec]:
+        """
+        A Latin hypercube design of **cells** cells. Each axis is split into **cells** strata of
+        consecutive values, every stratum is used exactly once, and a random value is drawn within
+        it. The strata of the different axes are paired up by independent random permutations. This
+        covers each axis evenly with far fewer cells than the full grid.
+
+        :param cells: the number of cells
+        :param rng: the random number generator choosing the strata pairing and values
+        :return: the cell specs
+        :rtype: list
+        """
+
+        columns = []
+        axes: Tuple[List, ...] = (
+            self.strategies,
+            self.stakes,
+            self.durations,
+            self.limits,
+        )
+        for axis in axes:
+            column = []
+            for stratum in range(cells):
+                low = stratum * len(axis) // cells
+                high = max(low + 1, (stratum + 1) * len(axis) // cells)
+                column.append(axis[rng.randrange(low, high)])
+            rng.shuffle(column)
+            columns.append(column)
+        return [self.cell(*values) for values in zip(*columns)]
+
+    @staticmethod
+    def row(spec: SimulationSpec, report: Dict[str, float]) -> Dict[str, Any]:
+        """
+        :param spec: the spec of a cell.
+        :param report: the **SessionStatistics.report()** of the cell.
+        :return: the result row of the cell: its parameters followed by the report.
+        :rtype: dict
+        """
+
+        return {
+            "strategy": spec.strategy.__name__,
+            "stake": spec.stake,
+            "duration": spec.duration,
+            "limit": spec.limit,
+            "samples": spec.samples,
+            "seed": spec.seed,
+            **report,
+        }
+
+    def run(
+        self,
+        specs: Sequence[SimulationSpec],
+        workers: int = 1,
+        pool: Optional[WarmPool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Runs the cells and yields one result row per cell, in the order of **specs**.
+
+        With one worker, the cells run in this process on a single built :class:`Wheel`. With more,
+        they are scheduled across a pool of processes, each of which builds its :class:`Wheel`
+        once and then runs whichever cells it is handed. Given a
+        :py:class:`~worker_pool.WarmPool`, the cells are submitted to it instead and **workers**
+        is ignored, so repeated sweeps pay for starting workers only once.
+
+        :param specs: the cell specs, for example from **Sweep.grid()**
+        :param workers: the number of worker processes
+        :param pool: a pool of warm workers to run the cells on
+        :return: an iterator over the result rows
+        """
+
+        if pool is not None:
+            jobs = [pool.submit(spec) for spec in specs]
+            for job in jobs:
+                yield self.row(job.spec, job.result().report())
+            return
+        if workers <= 1:
+            wheel = buildWheel()
+            for spec in specs:
+                yield self.row(spec, spec.run(wheel).report())
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_initWorker
+        ) as executor:
+            yield from executor.map(_runCell, specs)
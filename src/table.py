@@ -56,6 +56,32 @@ class Table:
 
         return iter(self.bets)
 
+    def withinLimit(self) -> bool:
+        """
+        Applies the table-limit rules without raising an exception.
+
+        :return: :samp:`True` if the sum of all bets is less than or equal to the table limit.
+        :rtype: bool
+        """
+
+        return sum(bet.amount for bet in self.bets) <= self.limit
+
+    def placeValidBet(self, bet: Bet) -> bool:
+        """
+        The status-code form of **Table.placeBet()** followed by **Table.isValid()**. The
+        :class:`Bet` instance is added to the list of current bets only if the bets still pass the
+        table-limit rules afterwards.
+
+        :param bet: A :class:`Bet` instance to be added to the table.
+        :return: :samp:`True` if the bet was placed, :samp:`False` if it would break the limit.
+        :rtype: bool
+        """
+
+        if sum(placed.amount for placed in self.bets) + bet.amount > self.limit:
+            return False
+        self.bets.append(bet)
+        return True
+
     def isValid(self) -> None:
         """
         **Raises:** :class:`InvalidBet` if the bets don’t pass the table limit rules.
@@ -66,14 +92,12 @@ class Table:
 
             - All bet amounts are greater than or equal to the table minimum.
 
-        If there’s a problem an :class:`InvalidBet` exception is raised.
+        If there’s a problem an :class:`InvalidBet` exception is raised. **Table.withinLimit()**
+        applies the same rules without the exception.
         """
 
-        bets_sum = 0
-        for bet in self.bets:
-            bets_sum += bet.amount
-            if bets_sum > self.limit:
-                raise InvalidBet
+        if not self.withinLimit():
+            raise InvalidBet
 
     def __str__(self) -> str:
         """
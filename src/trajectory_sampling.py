@@ -0,0 +1,143 @@
+import random
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+from trajectory_store import TrajectoryWriter
+
+
+class TrajectorySampler:
+    """
+    :class:`TrajectorySampler` is the superclass of the policies choosing which sessions of a
+    run keep their whole trajectory, the stake after every round. **Simulator.gatherSampled()**
+    offers each session to the sampler after summarizing it; the sampler keeps the trajectories
+    it chooses, as compact **array('i')** values, and lets every other one go.
+
+    The kept trajectories are few, so they are held in memory until the run is over; then
+    **TrajectorySampler.write()** stores them with a :py:class:`~trajectory_store.TrajectoryWriter`.
+
+    .. attribute:: captured
+
+       A **dict** mapping the index of each kept session to its trajectory.
+    """
+
+    def __init__(self) -> None:
+        self.captured: Dict[int, array] = {}
+
+    def offer(self, index: int, stakes: Sequence[int]) -> None:
+        """
+        Keeps the trajectory of a session if the policy chooses it. Each subclass defines its
+        own policy; this one keeps nothing.
+
+        :param index: the index of the session in the run.
+        :param stakes: the stake after each round of the session.
+        """
+
+    def write(self, writer: TrajectoryWriter) -> List[int]:
+        """
+        Stores the kept trajectories in session order.
+
+        :param writer: where to store them.
+        :return: the index of each stored session, in the order written.
+        :rtype: list
+        """
+
+        indexes = sorted(self.captured)
+        for index in indexes:
+            writer.append(self.captured[index])
+        return indexes
+
+
+class EveryKth(TrajectorySampler):
+    """
+    Keeps the trajectory of every **k**-th session, starting with the first.
+
+    .. attribute:: k
+
+       The spacing of the kept sessions.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        :param k: the spacing of the kept sessions.
+        :raises ValueError: if **k** is less than one.
+        """
+
+        super().__init__()
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+
+    def offer(self, index: int, stakes: Sequence[int]) -> None:
+        if index % self.k == 0:
+            self.captured[index] = array("i", stakes)
+
+
+class Reservoir(TrajectorySampler):
+    """
+    Keeps a uniform random sample of **size** sessions, however many are run, by reservoir
+    sampling: the first **size** sessions fill the reservoir, and the *n*-th session after that
+    replaces a random one of them with probability **size** / *n*. For a 1% sample of a run of
+    known length, use 1% of its **samples** as **size**.
+
+    .. attribute:: size
+
+       The number of sessions kept.
+
+    .. attribute:: rng
+
+       The random number generator choosing the sessions; it is independent of the
+       :class:`Wheel`’s, so sampling does not change the spins.
+
+    .. attribute:: seen
+
+       The number of sessions offered so far.
+    """
+
+    def __init__(self, size: int, seed: Optional[int] = None) -> None:
+        """
+        :param size: the number of sessions to keep.
+        :param seed: the seed of **rng**.
+        """
+
+        super().__init__()
+        self.size = size
+        self.rng = random.Random(seed)
+        self.seen = 0
+        self.slots: List[int] = []
+
+    def offer(self, index: int, stakes: Sequence[int]) -> None:
+        self.seen += 1
+        if len(self.slots) < self.size:
+            slot = len(self.slots)
+            self.slots.append(index)
+        else:
+            slot = self.rng.randrange(self.seen)
+            if slot >= self.size:
+                return
+            del self.captured[self.slots[slot]]
+            self.slots[slot] = index
+        self.captured[index] = array("i", stakes)
+
+
+class Matching(TrajectorySampler):
+    """
+    Keeps the trajectory of every session matching a predicate, for example the sessions whose
+    maximum exceeds three times the initial stake::
+
+        Matching(lambda stakes: max(stakes, default=0) > 3 * 100)
+
+    .. attribute:: predicate
+
+       The test of a session’s stake values.
+    """
+
+    def __init__(self, predicate: Callable[[Sequence[int]], bool]) -> None:
+        """
+        :param predicate: the test of a session’s stake values.
+        """
+
+        super().__init__()
+        self.predicate = predicate
+
+    def offer(self, index: int, stakes: Sequence[int]) -> None:
+        if self.predicate(stakes):
+            self.captured[index] = array("i", stakes)
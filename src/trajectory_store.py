@@ -0,0 +1,210 @@
+import mmap
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+STAKES = "stakes.i32"
+"""
+The name of the file holding the stakes of every session, one after the other.
+"""
+
+OFFSETS = "offsets.i64"
+"""
+The name of the file holding the offsets index.
+"""
+
+
+class TrajectoryWriter:
+    """
+    :class:`TrajectoryWriter` stores the stake after every round of many sessions compactly, in
+    a directory of two files of native-endian integers:
+
+    :samp:`stakes.i32`
+       The stake values of every session, one session after the other, as 32-bit integers:
+       4 bytes a round rather than the 36 or so of an **int** in a **list**.
+
+    :samp:`offsets.i64`
+       The offsets index: for session *i*, the 64-bit index in :samp:`stakes.i32` just past its
+       last stake. Sessions end at different rounds, so they take different lengths, and a
+       session’s stakes run from the previous session’s offset to its own.
+
+    Stakes are gathered in an **array('i')** and appended to the file whenever **buffer** values
+    have built up, so memory stays bounded however many sessions are written. The offsets, 8
+    bytes a session, are kept until the writer is closed. Use the writer as a context manager,
+    or call **TrajectoryWriter.close()**, to write the index; a directory without one cannot be
+    read.
+
+    .. attribute:: directory
+
+       The :py:class:`~pathlib.Path` of the directory.
+
+    .. attribute:: buffer
+
+       The number of stake values gathered before they are appended to the file.
+
+    .. attribute:: offsets
+
+       The offsets index of the sessions written so far, an **array('q')**.
+    """
+
+    buffer = 1 << 20
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        :param directory: the directory to write; it is created if need be, and any
+            trajectories already in it are replaced.
+        """
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / OFFSETS).unlink(missing_ok=True)
+        self.file = (self.directory / STAKES).open("wb")
+        self.pending = array("i")
+        self.offsets = array("q")
+        self.written = 0
+
+    def append(self, stakes: Sequence[int]) -> None:
+        """
+        Adds one session.
+
+        :param stakes: the stake after each round of the session.
+        :raises OverflowError: if a stake does not fit in 32 bits.
+        """
+
+        values = array("i", stakes)
+        self.pending.extend(values)
+        self.written += len(values)
+        self.offsets.append(self.written)
+        if len(self.pending) >= self.buffer:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Appends the gathered stakes to the file.
+        """
+
+        self.pending.tofile(self.file)
+        self.pending = array("i")
+
+    def close(self) -> None:
+        """
+        Writes the remaining stakes and the offsets index.
+        """
+
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        with (self.directory / OFFSETS).open("wb") as file:
+            self.offsets.tofile(file)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __enter__(self) -> "TrajectoryWriter":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.close()
+
+
+class TrajectoryReader:
+    """
+    :class:`TrajectoryReader` reads the trajectories written by a :class:`TrajectoryWriter`
+    without copying them. The stakes file is memory-mapped, and each session is a
+    :py:class:`memoryview` of 32-bit integers over its part of the map, which the operating
+    system pages in only when it is read. A memoryview supports the buffer protocol, so
+    analysis code can wrap it without a copy, for instance with :samp:`numpy.frombuffer()`.
+
+    Release every view taken from the reader before closing it. The reader is a context manager.
+
+    .. attribute:: offsets
+
+       The offsets index, an **array('q')**.
+
+    .. attribute:: stakes
+
+       A :py:class:`memoryview` of every stake, in session order.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        :param directory: a directory written by a :class:`TrajectoryWriter`.
+        :raises ValueError: if the stakes file does not match the offsets index.
+        """
+
+        directory = Path(directory)
+        self.offsets = array("q")
+        with (directory / OFFSETS).open("rb") as file:
+            self.offsets.frombytes(file.read())
+        total = self.offsets[-1] if self.offsets else 0
+        self.map: Optional[mmap.mmap] = None
+        with (directory / STAKES).open("rb") as file:
+            size = file.seek(0, 2)
+            expected = total * array("i").itemsize
+            if size != expected:
+                raise ValueError(
+                    f"{directory} holds {size} bytes of stakes, the index {expected}"
+                )
+            if size:
+                self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.stakes = (
+            memoryview(self.map) if self.map is not None else memoryview(b"")
+        ).cast("i")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def bounds(self, index: int) -> Tuple[int, int]:
+        """
+        :param index: the index of a session; negative indexes count from the end.
+        :return: the index in **stakes** of the session’s first stake, and the index just past
+            its last.
+        :rtype: tuple
+        """
+
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError("session index out of range")
+        return (self.offsets[index - 1] if index else 0), self.offsets[index]
+
+    def __getitem__(self, index: int) -> memoryview:
+        """
+        :param index: the index of a session.
+        :return: the stake after each round of the session.
+        :rtype: :py:class:`memoryview`
+        """
+
+        start, end = self.bounds(index)
+        return self.stakes[start:end]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(len(self.offsets)):
+            yield self[index]
+
+    def duration(self, index: int) -> int:
+        """
+        :param index: the index of a session.
+        :return: the number of rounds the session lasted, read from the index alone.
+        :rtype: int
+        """
+
+        start, end = self.bounds(index)
+        return end - start
+
+    def close(self) -> None:
+        """
+        Releases the map of the stakes file.
+        """
+
+        self.stakes.release()
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def __enter__(self) -> "TrajectoryReader":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.close()
@@ -1,5 +1,5 @@
 import random
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Tuple
 from outcome import Outcome
 from bin import Bin
 
@@ -44,7 +44,11 @@ class Wheel:
         :type number: int
         :param outcome: The Outcome to add to this Bin
         :type outcome: Outcome
+
+        The :class:`Outcome` is interned first, so every :class:`Bin` holding an outcome with this
+        name shares one instance.
         """
+        outcome = Outcome.intern(outcome.name, outcome.odds, outcome.denominator)
         updated_bin = Bin(list(self.bins[number].union(Bin([outcome]))))
         self.bins = self.bins[:number] + (updated_bin,) + self.bins[number + 1 :]
 
@@ -98,3 +102,49 @@ class Wheel:
         """
 
         return iter(self.bins)
+
+    def snapshot(self) -> Tuple:
+        """
+        Returns the state of **rng**. Restoring it with **Wheel.restore()** makes the wheel repeat
+        the same sequence of spins.
+
+        :return: the random number generator state
+        :rtype: tuple
+        """
+
+        return self.rng.getstate()
+
+    def restore(self, snapshot: Tuple) -> None:
+        """
+        Puts **rng** back into a state returned by **Wheel.snapshot()**.
+
+        :param snapshot: a random number generator state
+        :type snapshot: tuple
+        """
+
+        self.rng.setstate(snapshot)
+
+    def clone(self) -> "Wheel":
+        """
+        Creates a wheel which shares this wheel’s **bins** and outcomes but has its own **rng**.
+        The bins are never changed by play, so each thread of a parallel simulation can spin its
+        own clone of one built wheel.
+
+        :return: the new wheel
+        :rtype: :class:`Wheel`
+        """
+
+        self.precomputeMasks()
+        wheel = Wheel()
+        wheel.bins = self.bins
+        wheel.all_outcomes = self.all_outcomes
+        return wheel
+
+    def precomputeMasks(self) -> None:
+        """
+        Computes the **Bin.mask** of every bin now, rather than on first use, so bins shared
+        between threads are only ever read.
+        """
+
+        for bin in self.bins:
+            _ = bin.mask
@@ -0,0 +1,200 @@
+import importlib
+import os
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from typing import List, Optional, Sequence, Type
+from wheel import Wheel
+from simulation_spec import SimulationSpec, buildWheel
+from running_statistics import SessionStatistics
+from players.player import Player
+
+_wheel: Optional[Wheel] = None
+
+
+def _initWorker(modules: Sequence[str]) -> None:
+    """
+    Prepares a worker process once: imports the strategy modules and builds the :class:`Wheel`.
+    """
+
+    global _wheel  # pylint: disable=global-statement
+    for module in modules:
+        importlib.import_module(module)
+    _wheel = buildWheel()
+
+
+def _runChunk(spec: SimulationSpec, start: int, count: int) -> SessionStatistics:
+    """
+    Runs one chunk of a job in a worker process.
+    """
+
+    assert _wheel is not None
+    return spec.run(_wheel, start, count)
+
+
+class Job:
+    """
+    :class:`Job` is the handle of one simulation submitted to a :class:`WarmPool`.
+
+    .. attribute:: spec
+
+       The simulation.
+
+    .. attribute:: futures
+
+       The :py:class:`~concurrent.futures.Future` of each chunk of sessions, in session order.
+    """
+
+    def __init__(self, spec: SimulationSpec, futures: List[Future]) -> None:
+        """
+        :param spec: the simulation.
+        :param futures: the futures of its chunks, in session order.
+        """
+
+        self.spec = spec
+        self.futures = futures
+
+    def cancel(self) -> bool:
+        """
+        Cancels the chunks which have not started yet. Chunks already running finish, but their
+        results are dropped with the rest of the job.
+
+        :return: :samp:`True` if no chunk had finished or was running, so no work was wasted.
+        :rtype: bool
+        """
+
+        stopped = [future.cancel() for future in self.futures]
+        return all(stopped)
+
+    def cancelled(self) -> bool:
+        """
+        :return: :samp:`True` if **Job.cancel()** stopped any chunk.
+        :rtype: bool
+        """
+
+        return any(future.cancelled() for future in self.futures)
+
+    def done(self) -> bool:
+        """
+        :return: :samp:`True` if every chunk has finished or was cancelled.
+        :rtype: bool
+        """
+
+        return all(future.done() for future in self.futures)
+
+    def result(self, timeout: Optional[float] = None) -> SessionStatistics:
+        """
+        Waits for the job and merges its chunks in session order.
+
+        :param timeout: the most seconds to wait for each chunk.
+        :return: the statistics of every session; their **elapsed** is the total time the
+            workers spent on the job.
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        :raises concurrent.futures.CancelledError: if the job was cancelled.
+        """
+
+        if self.cancelled():
+            raise CancelledError()
+        total = SessionStatistics()
+        for future in self.futures:
+            total.merge(future.result(timeout))
+        return total
+
+
+class WarmPool:
+    """
+    :class:`WarmPool` is a long-lived pool of worker processes for running many small
+    simulations. Each worker imports the strategy modules and builds its :class:`Wheel` once,
+    when it starts, and then runs chunks of any number of jobs, so a job costs only its sessions.
+    Jobs queue up in the order they are submitted.
+
+    The workers are started by the first job, or earlier by **WarmPool.start()**. A forked worker
+    inherits every file and socket its parent has open at that moment, so a program which opens
+    sockets, such as a server, should start the pool before it opens them.
+
+    The pool is a context manager; leaving the **with** block shuts it down gracefully.
+
+    .. attribute:: executor
+
+       The :py:class:`~concurrent.futures.ProcessPoolExecutor` running the workers.
+
+    .. attribute:: workers
+
+       The number of worker processes.
+
+    .. attribute:: chunk
+
+       The number of sessions of a job handed to a worker at a time.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        strategies: Sequence[Type[Player]] = (),
+        chunk: int = 100,
+    ) -> None:
+        """
+        :param workers: the number of worker processes; the number of CPUs by default.
+        :param strategies: the :class:`Player` subclasses whose modules each worker preloads.
+        :param chunk: the number of sessions of a job handed to a worker at a time.
+        """
+
+        modules = sorted({strategy.__module__ for strategy in strategies})
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initWorker,
+            initargs=(modules,),
+        )
+        self.chunk = chunk
+
+    def start(self) -> None:
+        """
+        Starts the workers now and waits until each has imported the strategies and built its
+        :class:`Wheel`, rather than leaving that to the first job.
+        """
+
+        wait([self.executor.submit(os.getpid) for _ in range(self.workers)])
+
+    def submit(self, spec: SimulationSpec) -> Job:
+        """
+        Queues the sessions of a simulation in chunks of **chunk** sessions.
+
+        :param spec: the simulation.
+        :return: the handle of the job
+        :rtype: :class:`Job`
+        """
+
+        return Job(
+            spec,
+            [
+                self.executor.submit(
+                    _runChunk, spec, start, min(self.chunk, spec.samples - start)
+                )
+                for start in range(0, spec.samples, self.chunk)
+            ],
+        )
+
+    def run(self, spec: SimulationSpec) -> SessionStatistics:
+        """
+        Submits a simulation and waits for its result.
+
+        :param spec: the simulation.
+        :return: the statistics of every session
+        :rtype: :py:class:`~running_statistics.SessionStatistics`
+        """
+
+        return self.submit(spec).result()
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Stops the workers once they are idle.
+
+        :param cancel: if :samp:`True`, queued chunks are cancelled instead of run first.
+        """
+
+        self.executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self) -> "WarmPool":
+        return self
+
+    def __exit__(self, *exception: object) -> None:
+        self.shutdown()
@@ -34,3 +34,10 @@ class TestBet(TestCase):
 
         self.assertEqual(bet_one_expected_str, str_of_bet_one)
         self.assertEqual(bet_two_expected_str, str_of_bet_two)
+
+    def test_winAmount_is_exact_for_rational_odds(self):
+        bet = Bet(25, Outcome("Three to two", 3, 2))
+        expected_win_amount = 62
+
+        self.assertEqual(expected_win_amount, bet.winAmount())
+        self.assertIsInstance(bet.winAmount(), int)
@@ -13,3 +13,8 @@ class TestBin(TestCase):
         b2 = Bin([self.oc2, self.oc2])
         self.assertTrue(isinstance(b1, Bin), "b1 should be a object of Bin class")
         self.assertTrue(isinstance(b2, Bin), "b2 should be a object of Bin class")
+
+    def test_mask_combines_outcome_bits(self):
+        b1 = Bin([self.oc1, self.oc2])
+        expected_mask = self.oc1.bit | self.oc2.bit
+        self.assertEqual(expected_mask, b1.mask)
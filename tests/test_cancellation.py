@@ -83,3 +83,13 @@ class TestPlayerCancellation(TestCase):
         self.assertEqual(
             expected_sequence_after_playing, self.player_cancellation.sequence
         )
+
+    def test_restore_returns_to_snapshot_state(self):
+        snapshot = self.player_cancellation.snapshot()
+        self.player_cancellation.placeBets()
+        self.player_cancellation.lose(Bet(7, Outcome("Red", 1)))
+
+        self.player_cancellation.restore(snapshot)
+
+        self.assertEqual([1, 2, 3, 4, 5, 6], self.player_cancellation.sequence)
+        self.assertEqual(snapshot, self.player_cancellation.snapshot())
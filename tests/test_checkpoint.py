@@ -0,0 +1,44 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from checkpoint import Checkpoint
+from running_statistics import SessionStatistics
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.checkpoint = Checkpoint(Path(directory) / "run.ckpt", interval=5)
+
+    def test_load_without_checkpoint(self):
+        self.assertIsNone(self.checkpoint.load("run"))
+
+    def test_load_refuses_another_run(self):
+        self.checkpoint.save("run", 0, ((), ()), SessionStatistics())
+
+        with self.assertRaises(ValueError):
+            self.checkpoint.load("other run")
+
+    def test_save_then_load(self):
+        statistics = SessionStatistics()
+        statistics.add(12, 140)
+        statistics.add(30, 110)
+        snapshot = ((100, 250, 1), (3, (1, 2), None))
+
+        self.checkpoint.save("run", 2, snapshot, statistics)
+        index, loaded_snapshot, loaded_statistics = self.checkpoint.load("run")
+
+        self.assertEqual(2, index)
+        self.assertEqual(snapshot, loaded_snapshot)
+        self.assertEqual(statistics.report(), loaded_statistics.report())
+        self.assertFalse(self.checkpoint.path.with_suffix(".ckpt.tmp").exists())
+
+    def test_discard(self):
+        self.checkpoint.save("run", 0, ((), ()), SessionStatistics())
+
+        self.checkpoint.discard()
+
+        self.assertIsNone(self.checkpoint.load("run"))
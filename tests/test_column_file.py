@@ -0,0 +1,103 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from column_file import HEADER, METADATA, ColumnReader, ColumnWriter
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestColumnFile(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_round_trip_in_chunks(self):
+        rows = [(index, index * 3, index / 2) for index in range(25)]
+        writer = ColumnWriter(
+            self.directory, {"a": "i", "b": "q", "c": "d"}, {"seed": 7}
+        )
+        writer.buffer = 4
+        with writer:
+            writer.extend(rows)
+            writer.metadata["note"] = "done"
+
+        with ColumnReader(self.directory) as reader:
+            self.assertEqual(25, reader.rows)
+            self.assertEqual({"seed": 7, "note": "done"}, reader.metadata)
+            self.assertEqual([row[0] for row in rows], reader.column("a").tolist())
+            self.assertEqual([row[1] for row in rows], reader.column("b").tolist())
+            self.assertEqual([row[2] for row in rows], reader.column("c").tolist())
+
+    def test_files_are_npy(self):
+        with ColumnWriter(self.directory, {"a": "i"}) as writer:
+            writer.extend([(1,), (2,)])
+
+        data = (self.directory / "a.npy").read_bytes()
+        self.assertEqual(b"\x93NUMPY\x01\x00", data[:8])
+        self.assertEqual(HEADER, 10 + int.from_bytes(data[8:10], "little"))
+        self.assertIn(b"'shape': (2,)", data[:HEADER])
+        self.assertEqual(0, HEADER % 64)
+        self.assertEqual(HEADER + 8, len(data))
+
+    def test_empty_columns(self):
+        with ColumnWriter(self.directory, {"a": "i"}):
+            pass
+
+        with ColumnReader(self.directory) as reader:
+            self.assertEqual([], reader.column("a").tolist())
+
+    def test_unsigned_columns(self):
+        with ColumnWriter(self.directory, {"a": "I", "b": "b"}) as writer:
+            writer.append((4_000_000_000, -3))
+
+        self.assertIn(
+            b"'descr': '<u4'", (self.directory / "a.npy").read_bytes()[:HEADER]
+        )
+        with ColumnReader(self.directory) as reader:
+            self.assertEqual([4_000_000_000], reader.column("a").tolist())
+            self.assertEqual([-3], reader.column("b").tolist())
+
+    def test_rejects_typecodes_without_npy_equivalent(self):
+        with self.assertRaises(ValueError):
+            ColumnWriter(self.directory, {"a": "u"})
+        self.assertEqual([], list(self.directory.iterdir()))
+
+    def test_rejects_rows_of_the_wrong_length(self):
+        with ColumnWriter(self.directory, {"a": "i", "b": "i"}) as writer:
+            with self.assertRaises(ValueError):
+                writer.append((1,))
+            with self.assertRaises(ValueError):
+                writer.append((1, 2, 3))
+            writer.append((1, 2))
+
+        with ColumnReader(self.directory) as reader:
+            self.assertEqual(1, reader.rows)
+            self.assertEqual([2], reader.column("b").tolist())
+
+    def test_rejects_mismatched_column(self):
+        with ColumnWriter(self.directory, {"a": "i"}) as writer:
+            writer.append((1,))
+        metadata = json.loads((self.directory / METADATA).read_text())
+        metadata["rows"] = 2
+        (self.directory / METADATA).write_text(json.dumps(metadata))
+
+        with self.assertRaises(ValueError):
+            ColumnReader(self.directory)
+
+    def test_streams_spec_results(self):
+        spec = SimulationSpec(Martingale, samples=12)
+        wheel = buildWheel()
+        results = []
+        spec.run(wheel, results=results)
+
+        with ColumnWriter(self.directory, {"duration": "i", "maximum": "i"}) as writer:
+            spec.run(wheel, results=writer)
+
+        with ColumnReader(self.directory) as reader:
+            self.assertEqual(
+                results,
+                list(zip(reader.column("duration"), reader.column("maximum"))),
+            )
@@ -0,0 +1,56 @@
+import json
+import socket
+import threading
+from multiprocessing import Process
+from unittest import TestCase
+
+from distributed import Coordinator, Worker, runWorker
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestCoordinator(TestCase):
+    def setUp(self):
+        self.spec = SimulationSpec(Martingale, duration=30, samples=20, seed=9)
+        self.coordinator = Coordinator(self.spec, chunk=3)
+        self.addCleanup(self.coordinator.server.server_close)
+        self.results = []
+        self.thread = threading.Thread(
+            target=lambda: self.results.append(self.coordinator.run())
+        )
+
+    def start_workers(self, count):
+        workers = [
+            Process(target=runWorker, args=self.coordinator.address)
+            for _ in range(count)
+        ]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    def test_workers_run_every_range(self):
+        self.thread.start()
+        workers = self.start_workers(2)
+        self.thread.join(30)
+        for worker in workers:
+            worker.join(30)
+
+        sequential = self.spec.run(buildWheel())
+        self.assertEqual(20, self.results[0].sessions)
+        self.assertAlmostEqual(sequential.maxima.mean(), self.results[0].maxima.mean())
+        self.assertAlmostEqual(
+            sequential.durations.stdev(), self.results[0].durations.stdev()
+        )
+
+    def test_range_of_dead_worker_is_reissued(self):
+        self.thread.start()
+        with socket.create_connection(self.coordinator.address) as connection:
+            connection.sendall(b"{}\n")
+            assignment = json.loads(connection.makefile("rb").readline())
+        self.assertEqual(0, assignment["start"])
+
+        Worker(self.coordinator.address).run()
+        self.thread.join(30)
+
+        self.assertEqual(1, self.coordinator.reissued)
+        self.assertEqual(20, self.results[0].sessions)
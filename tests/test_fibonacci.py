@@ -93,3 +93,15 @@ class TestPlayerFibonacci(TestCase):
         self.player_fibonacci.placeBets()
 
         self.assertEqual(expected_stake_after_placeBets, self.player_fibonacci.stake)
+
+    def test_restore_returns_to_snapshot_state(self):
+        snapshot = self.player_fibonacci.snapshot()
+        self.player_fibonacci.stake = 50
+        self.player_fibonacci.lose(self.bet)
+        self.player_fibonacci.lose(self.bet)
+
+        self.player_fibonacci.restore(snapshot)
+
+        self.assertEqual(snapshot, self.player_fibonacci.snapshot())
+        self.assertEqual(1, self.player_fibonacci.recent)
+        self.assertEqual(100, self.player_fibonacci.stake)
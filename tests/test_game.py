@@ -8,6 +8,7 @@ from table import Table
 from bin_builder import BinBuilder
 from invalid_bet import InvalidBet
 from players.passenger57 import Passenger57
+from players.seven_reds import SevenReds
 
 
 class TestGame(TestCase):
@@ -57,3 +58,24 @@ class TestGame(TestCase):
                 with self.assertRaises(InvalidBet):
                     self.game.cycle(self.passenger)
         choose_mock.assert_not_called()
+
+    def test_cycle_skips_winners_if_player_does_not_watch_outcomes(self):
+        winners_mock = Mock(name="winners_mock")
+        with patch.object(self.passenger, "winners", winners_mock):
+            self.game.cycle(self.passenger)
+        winners_mock.assert_not_called()
+
+    def test_cycle_notifies_winnersMask_with_bin_mask(self):
+        seven_reds = SevenReds(self.table)
+        winning_bin = self.wheel.get(1)
+        winners_mask_mock = Mock(name="winners_mask_mock")
+        with patch("wheel.Wheel.choose", Mock(return_value=winning_bin)):
+            with patch("players.seven_reds.SevenReds.winnersMask", winners_mask_mock):
+                self.game.cycle(seven_reds)
+        winners_mask_mock.assert_called_once_with(winning_bin.mask)
+
+
+class TestGameFastCycle(TestGame):
+    def setUp(self):
+        super().setUp()
+        self.game.cycle = self.game.fastCycle
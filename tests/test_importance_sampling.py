@@ -0,0 +1,142 @@
+import math
+from unittest import TestCase
+
+from importance_sampling import ImportanceSampler, TiltedWheel, WeightedEstimate
+from simulation_spec import SimulationSpec, buildWheel
+from players.passenger57 import Passenger57
+
+
+def winning(stakes):
+    return stakes[-1] > 10_000
+
+
+class TestTiltedWheel(TestCase):
+    def setUp(self):
+        self.wheel = buildWheel()
+
+    def test_fair_probabilities_weigh_one(self):
+        tilted = TiltedWheel(self.wheel, [1 / 38] * 38)
+        for _ in range(100):
+            tilted.choose()
+
+        self.assertAlmostEqual(tilted.weight(), 1.0)
+
+    def test_towards_sets_the_probability_of_an_outcome(self):
+        tilted = TiltedWheel.towards(self.wheel, "Black", 0.6)
+        black = self.wheel.getOutcome("Black")
+
+        total = sum(
+            probability
+            for bin, probability in zip(tilted.bins, tilted.probabilities)
+            if black in bin
+        )
+
+        self.assertAlmostEqual(total, 0.6)
+        self.assertAlmostEqual(sum(tilted.probabilities), 1.0)
+
+    def test_weight_is_the_likelihood_ratio(self):
+        tilted = TiltedWheel.towards(self.wheel, "Black", 0.6)
+        black = self.wheel.getOutcome("Black")
+        tilted.rng.seed(3)
+        expected = 1.0
+        for _ in range(20):
+            chosen = tilted.choose()
+            expected *= (18 / 38) / 0.6 if black in chosen else (20 / 38) / 0.4
+
+        self.assertAlmostEqual(tilted.weight(), expected)
+        tilted.resetWeight()
+        self.assertEqual(tilted.weight(), 1.0)
+
+    def test_clone_keeps_the_tilt(self):
+        tilted = TiltedWheel.towards(self.wheel, "Black", 0.6)
+
+        clone = tilted.clone()
+
+        self.assertEqual(clone.probabilities, tilted.probabilities)
+        self.assertIs(clone.bins, tilted.bins)
+        self.assertIsNot(clone.rng, tilted.rng)
+
+    def test_rejects_bad_probabilities(self):
+        with self.assertRaises(ValueError):
+            TiltedWheel(self.wheel, [1 / 37] * 37)
+        with self.assertRaises(ValueError):
+            TiltedWheel(self.wheel, [0.0] + [1 / 37] * 37)
+        with self.assertRaises(ValueError):
+            TiltedWheel(self.wheel, [1 / 30] * 38)
+
+
+class TestWeightedEstimate(TestCase):
+    def test_statistics(self):
+        estimate = WeightedEstimate()
+        for value, weight in [(1, 0.5), (0, 2.0), (1, 1.5)]:
+            estimate.add(value, weight)
+
+        self.assertAlmostEqual(estimate.mean(), 2.0 / 3)
+        self.assertAlmostEqual(estimate.selfNormalizedMean(), 0.5)
+        self.assertAlmostEqual(estimate.effectiveSampleSize(), 16 / 6.5)
+        self.assertAlmostEqual(estimate.standardError(), math.sqrt(7 / 12 / 3))
+
+    def test_equal_weights_are_plain_monte_carlo(self):
+        estimate = WeightedEstimate()
+        for value in [3, 5, 10]:
+            estimate.add(value, 1.0)
+
+        self.assertAlmostEqual(estimate.mean(), 6.0)
+        self.assertAlmostEqual(estimate.effectiveSampleSize(), 3.0)
+
+    def test_merge(self):
+        whole, first, second = (
+            WeightedEstimate(),
+            WeightedEstimate(),
+            WeightedEstimate(),
+        )
+        for index, (value, weight) in enumerate(
+            [(1, 0.5), (0, 2.0), (1, 1.5), (1, 0.1)]
+        ):
+            whole.add(value, weight)
+            (first if index % 2 else second).add(value, weight)
+
+        first.merge(second)
+
+        self.assertEqual(first.report(), whole.report())
+
+    def test_empty(self):
+        report = WeightedEstimate().report()
+
+        self.assertEqual(report["sessions"], 0)
+        self.assertTrue(math.isnan(report["mean"]))
+        self.assertEqual(report["effective_sample_size"], 0.0)
+
+
+class TestImportanceSampler(TestCase):
+    def setUp(self):
+        self.wheel = buildWheel()
+        self.spec = SimulationSpec(
+            Passenger57, stake=10_000, duration=10, samples=4000, seed=11
+        )
+
+    def test_fair_wheel_is_plain_monte_carlo(self):
+        tilted = TiltedWheel(self.wheel, [1 / 38] * 38)
+        sampler = ImportanceSampler(self.spec, tilted)
+
+        estimate = sampler.run(winning, count=200)
+        again = sampler.run(winning, count=200)
+
+        self.assertAlmostEqual(estimate.mean(), estimate.selfNormalizedMean())
+        self.assertAlmostEqual(estimate.effectiveSampleSize(), 200)
+        self.assertEqual(again.report(), estimate.report())
+
+    def test_tilted_estimate_is_unbiased(self):
+        p = 18 / 38
+        exact = sum(
+            math.comb(10, wins) * p**wins * (1 - p) ** (10 - wins)
+            for wins in range(6, 11)
+        )
+        tilted = TiltedWheel.towards(self.wheel, "Black", 0.6)
+
+        estimate = ImportanceSampler(self.spec, tilted).run(winning)
+
+        self.assertEqual(estimate.sessions, 4000)
+        self.assertLess(abs(estimate.mean() - exact), 4 * estimate.standardError())
+        self.assertLess(estimate.effectiveSampleSize(), 4000)
+        self.assertGreater(estimate.effectiveSampleSize(), 1000)
@@ -79,3 +79,31 @@ class TestMartingale(TestCase):
 
         self.assertEqual(expected_losscount_value, self.martingale.losscount)
         self.assertEqual(expected_betmultiple_value, self.martingale.betMultiple)
+
+    def test_restore_returns_to_snapshot_state(self):
+        snapshot = self.martingale.snapshot()
+        self.martingale.placeBets()
+        self.martingale.lose(self.table.bets[0])
+
+        self.martingale.restore(snapshot)
+
+        self.assertEqual(0, self.martingale.losscount)
+        self.assertEqual(1, self.martingale.betMultiple)
+        self.assertEqual(snapshot, self.martingale.snapshot())
+
+    def test_tryPlaceBets_resets_without_exception_if_bet_is_invalid(self):
+        self.martingale.losscount = 9
+        self.martingale.betMultiple = 512
+
+        self.assertFalse(self.martingale.tryPlaceBets())
+
+        self.assertEqual(0, self.martingale.losscount)
+        self.assertEqual(1, self.martingale.betMultiple)
+        self.assertEqual([], self.table.bets)
+
+    def test_fastCycle_returns_false_if_bet_is_invalid(self):
+        self.martingale.betMultiple = 500
+        choose_mock = Mock(name="choose_mock")
+        with patch("wheel.Wheel.choose", choose_mock):
+            self.assertFalse(self.game.fastCycle(self.martingale))
+        choose_mock.assert_not_called()
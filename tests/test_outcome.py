@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from outcome import Outcome
@@ -25,3 +26,41 @@ class TestOutcome(TestCase):
 
     def test_inequality_when_names_differ(self):
         self.assertNotEqual(self.oc1, self.oc3)
+
+    def test_bit_is_shared_by_outcomes_with_same_name(self):
+        self.assertEqual(self.oc1.bit, self.oc2.bit)
+        self.assertNotEqual(self.oc1.bit, self.oc3.bit)
+        self.assertEqual(self.oc1.bit, Outcome.bitFor("Red"))
+
+    def test_bitFor_gives_each_name_one_bit_across_threads(self):
+        names = [f"Thread Outcome {index}" for index in range(64)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            bits = list(executor.map(Outcome.bitFor, names * 4))
+
+        self.assertEqual(len(names), len(set(bits)))
+        self.assertEqual(bits[: len(names)] * 4, bits)
+
+    def test_intern_returns_one_instance_per_name(self):
+        red = Outcome.intern("Red", 1)
+
+        self.assertIs(red, Outcome.intern("Red", 1))
+        self.assertEqual(self.oc1, red)
+        self.assertFalse(hasattr(red, "__dict__"))
+
+    def test_intern_replaces_instance_with_different_odds(self):
+        self.assertEqual(2, Outcome.intern("Interned", 2).odds)
+        self.assertEqual(3, Outcome.intern("Interned", 3).odds)
+
+    def test_exactWinAmount_for_whole_odds(self):
+        self.assertEqual(10, self.oc3.exactWinAmount(5))
+
+    def test_exactWinAmount_for_rational_odds(self):
+        six_to_five = Outcome("Six to five", 6, 5)
+
+        self.assertEqual(12, six_to_five.exactWinAmount(10))
+        self.assertEqual(8, six_to_five.exactWinAmount(7))
+        self.assertEqual(8.4, six_to_five.winAmount(7))
+        self.assertEqual("Six to five (6:5)", str(six_to_five))
+
+    def test_inequality_when_denominators_differ(self):
+        self.assertNotEqual(Outcome("Red", 1), Outcome("Red", 1, 2))
@@ -0,0 +1,52 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from parallel import Scheduler
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestScheduler(TestCase):
+    def setUp(self):
+        self.spec = SimulationSpec(Martingale, duration=40, samples=23, seed=4)
+        self.scheduler = Scheduler(self.spec, workers=2, chunk=3)
+
+    def test_run_matches_sequential_run(self):
+        parallel = self.scheduler.run()
+        sequential = self.spec.run(buildWheel())
+
+        self.assertEqual(23, parallel.sessions)
+        self.assertAlmostEqual(sequential.durations.mean(), parallel.durations.mean())
+        self.assertAlmostEqual(sequential.maxima.stdev(), parallel.maxima.stdev())
+
+    def test_utilization_accounts_for_every_session(self):
+        self.scheduler.run()
+
+        usage = self.scheduler.utilization()
+
+        self.assertEqual(23, sum(figures["sessions"] for figures in usage.values()))
+        self.assertTrue(
+            all(0 <= figures["utilization"] <= 1 for figures in usage.values())
+        )
+
+    def test_threads_fall_back_to_processes_with_gil(self):
+        scheduler = Scheduler(self.spec, workers=2, chunk=3, threads=True)
+
+        with patch("parallel.freeThreaded", return_value=False):
+            self.assertFalse(scheduler.usesThreads())
+            with scheduler.executor() as executor:
+                self.assertIsInstance(executor, ProcessPoolExecutor)
+
+    def test_threads_match_sequential_run(self):
+        scheduler = Scheduler(self.spec, workers=3, chunk=3, threads=True)
+
+        with patch("parallel.freeThreaded", return_value=True):
+            threaded = scheduler.run()
+
+        sequential = self.spec.run(buildWheel())
+        self.assertEqual(23, threaded.sessions)
+        self.assertAlmostEqual(sequential.durations.mean(), threaded.durations.mean())
+        self.assertAlmostEqual(sequential.maxima.stdev(), threaded.maxima.stdev())
+        self.assertNotIn(os.getpid(), scheduler.workerStatistics)
@@ -0,0 +1,84 @@
+import json
+import random
+from unittest import TestCase
+
+from percentile_bands import PercentileBands
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestPercentileBands(TestCase):
+    def test_exact_percentiles(self):
+        bands = PercentileBands(1)
+        for stake in range(1, 101):
+            bands.add([stake], 0)
+
+        self.assertEqual([5, 25, 50, 75, 95], bands.percentiles(1))
+        self.assertEqual(1, bands.percentile(1, 0.0))
+        self.assertEqual(100, bands.percentile(1, 1.0))
+
+    def test_short_sessions_keep_their_final_stake(self):
+        bands = PercentileBands(3)
+        bands.add([90, 80], 100)
+        bands.add([], 100)
+
+        self.assertEqual({80: 1, 100: 1}, bands.counts[2])
+        self.assertEqual([[90, 90], [80, 80], [80, 80]], bands.bands((0.5, 0.5)))
+
+    def test_wide_bins_give_lower_edges(self):
+        bands = PercentileBands(1, width=10)
+        for stake in (3, 14, 15, 27):
+            bands.add([stake], 0)
+
+        self.assertEqual([0, 10, 20], bands.percentiles(1, (0.25, 0.5, 1.0)))
+
+    def test_empty_bands(self):
+        self.assertEqual([None, None], PercentileBands(2).percentiles(2, (0.1, 0.9)))
+
+    def test_merge_equals_one_accumulator(self):
+        rng = random.Random(5)
+        sessions = [
+            [rng.randrange(200) for _ in range(rng.randrange(6))] for _ in range(200)
+        ]
+        whole, first, second = (
+            PercentileBands(5),
+            PercentileBands(5),
+            PercentileBands(5),
+        )
+        for index, stakes in enumerate(sessions):
+            whole.add(stakes, 100)
+            (first if index % 2 else second).add(stakes, 100)
+
+        first.merge(second)
+
+        self.assertEqual(whole.counts, first.counts)
+        self.assertEqual(whole.bands(), first.bands())
+        with self.assertRaises(ValueError):
+            first.merge(PercentileBands(5, width=2))
+
+    def test_dict_round_trip(self):
+        bands = PercentileBands(2)
+        bands.add([4, 5], 3)
+
+        restored = PercentileBands.fromDict(json.loads(json.dumps(bands.asDict())))
+
+        self.assertEqual(bands.counts, restored.counts)
+        self.assertEqual(1, restored.sessions)
+
+
+class TestGatherBands(TestCase):
+    def test_bands_match_stored_trajectories(self):
+        spec = SimulationSpec(Martingale, duration=20, samples=40)
+        wheel = buildWheel()
+        wheel.rng.seed(1)
+        bands = PercentileBands(20)
+
+        statistics = spec.build(wheel).gatherBands(bands)
+
+        wheel.rng.seed(1)
+        simulator = spec.build(wheel)
+        expected = PercentileBands(20)
+        for _ in range(40):
+            expected.add(simulator.runSession(), 100)
+        self.assertEqual(40, statistics.sessions)
+        self.assertEqual(expected.bands(), bands.bands())
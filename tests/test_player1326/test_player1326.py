@@ -2,7 +2,11 @@ from unittest import TestCase
 from table import Table
 from bet import Bet
 from outcome import Outcome
-from players.player1326.player1326_state import Player1326NoWins, Player1326OneWin
+from players.player1326.player1326_state import (
+    Player1326NoWins,
+    Player1326OneWin,
+    Player1326ThreeWins,
+)
 from players.player1326.player1326 import Player1326
 
 
@@ -13,7 +17,6 @@ class TestPlayer1326(TestCase):
 
     def test_player1326_plays_when_stake_higher_than_betAmount(self):
         self.player1326.stake = 2
-        self.player1326.state.betAmount = 1
         self.assertTrue(self.player1326.playing())
 
         self.player1326.stake = 0
@@ -31,13 +34,20 @@ class TestPlayer1326(TestCase):
 
     def test_stake_is_reduced_when_bet_placed(self):
         self.player1326.stake = 100
-        self.player1326.state.betAmount = 10
-        expected_bet_after_bet = 90
+        self.player1326.state = Player1326ThreeWins()
+        expected_bet_after_bet = 94
 
         self.player1326.placeBets()
 
         self.assertEqual(expected_bet_after_bet, self.player1326.stake)
 
+    def test_states_are_immutable(self):
+        state = Player1326NoWins()
+
+        with self.assertRaises(AttributeError):
+            state.betAmount = 10
+        self.assertEqual(1, Player1326NoWins().betAmount)
+
     def test_win_changes_state_to_nextWon_state(self):
         initial_state = Player1326NoWins()
         self.assertEqual(initial_state, self.player1326.state)
@@ -63,3 +73,12 @@ class TestPlayer1326(TestCase):
         expected_state_after_lose = Player1326NoWins()
 
         self.assertEqual(expected_state_after_lose, self.player1326.state)
+
+    def test_restore_returns_to_snapshot_state(self):
+        self.player1326.win(Bet(2, Outcome("Red", 1)))
+        snapshot = self.player1326.snapshot()
+        self.player1326.lose(Bet(2, Outcome("Red", 1)))
+
+        self.player1326.restore(snapshot)
+
+        self.assertIs(Player1326OneWin(), self.player1326.state)
@@ -36,3 +36,24 @@ class TestRandom(TestCase):
         self.random_player.stake = 1
 
         self.assertTrue(self.random_player.playing())
+
+    def test_betSchedule_draws_same_outcomes_as_placeBets(self):
+        fixed_seed = 1
+        rounds = 5
+        self.random_player.rng.seed(fixed_seed)
+        for _ in range(rounds):
+            self.random_player.placeBets()
+        self.random_player.rng.seed(fixed_seed)
+        schedule = self.random_player.betSchedule(rounds)
+
+        self.assertEqual(self.table.bets, schedule)
+
+    def test_restore_repeats_random_bets(self):
+        snapshot = self.random_player.snapshot()
+        self.random_player.placeBets()
+        first_bet = self.table.bets.pop()
+
+        self.random_player.restore(snapshot)
+        self.random_player.placeBets()
+
+        self.assertEqual(first_bet, self.table.bets.pop())
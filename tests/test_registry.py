@@ -0,0 +1,61 @@
+from importlib.metadata import EntryPoint
+from unittest import TestCase
+from unittest.mock import patch
+
+from players.registry import ENTRY_POINT_GROUP, StrategyRegistry
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+
+
+class TestStrategyRegistry(TestCase):
+    def setUp(self):
+        self.registry = StrategyRegistry()
+
+    def test_every_builtin_resolves(self):
+        for name in StrategyRegistry.builtins:
+            self.assertTrue(
+                self.registry.resolve(name).__module__.startswith("players.")
+            )
+
+    def test_resolve_caches_the_class(self):
+        self.assertIs(Martingale, self.registry.resolve("martingale"))
+        self.assertIs(Martingale, self.registry.targets["martingale"])
+
+    def test_resolve_by_module_and_class(self):
+        self.assertIs(
+            Martingale, self.registry.resolve("players.martingale:Martingale")
+        )
+
+    def test_rejects_unknown_names_and_non_players(self):
+        for name in ("nowhere", "os:system", "players.martingale:Bet"):
+            with self.assertRaises(ValueError):
+                self.registry.resolve(name)
+
+    def test_register(self):
+        self.registry.register("steady", Passenger57)
+        self.registry.register("doubling", "players.martingale:Martingale")
+
+        self.assertIs(Passenger57, self.registry.resolve("steady"))
+        self.assertIs(Martingale, self.registry.resolve("doubling"))
+
+    def test_discovers_entry_points_once(self):
+        plugin = EntryPoint(
+            name="plugin",
+            value="players.passenger57:Passenger57",
+            group=ENTRY_POINT_GROUP,
+        )
+        shadow = EntryPoint(
+            name="martingale",
+            value="players.random:PlayerRandom",
+            group=ENTRY_POINT_GROUP,
+        )
+        with patch(
+            "importlib.metadata.entry_points", return_value=[plugin, shadow]
+        ) as entry_points:
+            self.assertIs(Martingale, self.registry.resolve("martingale"))
+            entry_points.assert_not_called()
+            self.assertIs(Passenger57, self.registry.resolve("plugin"))
+            self.assertIn("plugin", self.registry.names())
+
+        entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+        self.assertIs(Martingale, self.registry.resolve("martingale"))
@@ -0,0 +1,119 @@
+import shutil
+import tempfile
+from dataclasses import replace
+from unittest import TestCase
+from unittest.mock import patch
+
+from result_cache import ResultCache
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+from players.fibonacci import PlayerFibonacci
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.cache = ResultCache(directory)
+        self.wheel = buildWheel()
+        self.spec = SimulationSpec(Martingale, duration=20, samples=5, seed=1)
+
+    def test_key_depends_on_every_parameter(self):
+        keys = {
+            self.cache.key(spec, self.wheel)
+            for spec in (
+                self.spec,
+                replace(self.spec, strategy=PlayerFibonacci),
+                replace(self.spec, stake=99),
+                replace(self.spec, limit=200),
+                replace(self.spec, samples=6),
+                replace(self.spec, seed=2),
+                replace(self.spec, engine="fast"),
+            )
+        }
+
+        self.assertEqual(7, len(keys))
+        self.assertEqual(
+            self.cache.key(self.spec, self.wheel),
+            self.cache.key(replace(self.spec), buildWheel()),
+        )
+
+    def test_run_reuses_stored_result(self):
+        first = self.cache.run(self.spec, self.wheel)
+        with patch.object(SimulationSpec, "run") as run:
+            second = self.cache.run(self.spec, self.wheel)
+
+        run.assert_not_called()
+        self.assertEqual(first.report(), second.report())
+
+    def test_run_stores_raw_results_on_request(self):
+        self.cache.run(self.spec, self.wheel)
+        computed = []
+        self.cache.run(self.spec, self.wheel, computed)
+        cached = []
+        with patch.object(SimulationSpec, "run") as run:
+            self.cache.run(self.spec, self.wheel, cached)
+
+        run.assert_not_called()
+        self.assertEqual(5, len(computed))
+        self.assertEqual(computed, cached)
+
+    def test_put_evicts_least_recently_used(self):
+        statistics = self.spec.run(self.wheel)
+        self.cache.put("a", statistics)
+        self.cache.maxBytes = 2 * self.cache.path("a").stat().st_size
+        self.cache.put("b", statistics)
+        self.cache.get("a")
+
+        self.cache.put("c", statistics)
+
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_clear_deletes_results(self):
+        self.cache.run(self.spec, self.wheel)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get(self.cache.key(self.spec, self.wheel)))
+
+    def test_corrupt_result_is_a_miss(self):
+        key = self.cache.key(self.spec, self.wheel)
+        self.cache.path(key).write_text('{"statistics": {"dura', encoding="utf-8")
+
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(5, self.cache.run(self.spec, self.wheel).sessions)
+
+    def test_key_depends_on_simulator_source(self):
+        before = self.cache.key(self.spec, self.wheel)
+
+        with patch("result_cache.sourceDigest", return_value="edited"):
+            self.assertNotEqual(before, self.cache.key(self.spec, self.wheel))
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        statistics = self.cache.run(self.spec, self.wheel)
+        self.cache.clear()
+
+        with patch("result_cache.json.dump", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.cache.put("key", statistics)
+
+        self.assertEqual([], list(self.cache.directory.iterdir()))
+
+    def test_key_hashes_the_module_file_without_source(self):
+        before = self.cache.key(self.spec, self.wheel)
+
+        with patch("result_cache.inspect.getsource", side_effect=OSError):
+            key = self.cache.key(self.spec, self.wheel)
+
+        self.assertIsNotNone(key)
+        self.assertNotEqual(before, key)
+
+    def test_unreadable_strategy_is_run_without_caching(self):
+        with patch("result_cache.moduleSource", return_value=None):
+            self.assertIsNone(self.cache.key(self.spec, self.wheel))
+            statistics = self.cache.run(self.spec, self.wheel)
+
+        self.assertEqual(5, statistics.sessions)
+        self.assertEqual([], list(self.cache.directory.iterdir()))
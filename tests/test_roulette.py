@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase
+
+from roulette import main, parseArguments
+from column_file import ColumnReader
+from players.fibonacci import PlayerFibonacci
+
+
+class TestRoulette(TestCase):
+    def run_main(self, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(list(argv))
+        return output.getvalue()
+
+    def test_rejects_unknown_strategies(self):
+        for name in ("nowhere", "os:system", "players.martingale:Bet"):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                parseArguments(["--strategy", name])
+
+    def test_lists_strategies(self):
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(SystemExit):
+            parseArguments(["--strategy", "list"])
+
+        self.assertIn("martingale", output.getvalue().split())
+
+    def test_import_defers_simulation_modules(self):
+        loaded = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, roulette; "
+                "print(sorted({'simulator', 'wheel', 'parallel'} & set(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        self.assertEqual("[]", loaded.strip())
+
+    def test_defaults(self):
+        arguments = parseArguments([])
+
+        self.assertIs(PlayerFibonacci, arguments.strategy)
+        self.assertIsNone(arguments.samples)
+        self.assertIsNone(arguments.engine)
+        self.assertEqual("text", arguments.format)
+
+    def test_json_output(self):
+        row = json.loads(
+            self.run_main(
+                "--strategy", "martingale", "--samples", "8", "--format", "json"
+            )
+        )
+
+        self.assertEqual("players.martingale:Martingale", row["strategy"])
+        self.assertEqual(8, row["sessions"])
+
+    def test_json_output_of_one_session_is_valid(self):
+        row = json.loads(self.run_main("--samples", "1", "--format", "json"))
+
+        self.assertIsNone(row["maximum_half_width"])
+
+    def test_csv_output_matches_across_engines_and_workers(self):
+        rows = [
+            next(csv.DictReader(io.StringIO(self.run_main(*argv))))
+            for argv in (
+                ("--strategy", "passenger57", "--samples", "6", "--format", "csv"),
+                (
+                    "--strategy",
+                    "passenger57",
+                    "--samples",
+                    "6",
+                    "--format",
+                    "csv",
+                    "--workers",
+                    "2",
+                ),
+            )
+        ]
+
+        self.assertEqual(rows[0]["maximum_mean"], rows[1]["maximum_mean"])
+
+    def test_text_output_with_benchmark(self):
+        output = self.run_main("--samples", "3", "--engine", "fast", "--benchmark")
+
+        self.assertIn("sessions_per_second", output)
+        self.assertIn("engine", output)
+
+    def test_profile_writes_to_stderr(self):
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            output = self.run_main("--samples", "2", "--profile")
+
+        self.assertIn("cumulative", errors.getvalue())
+        self.assertIn("sessions", output)
+
+    def test_output_writes_columns(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        output = self.run_main(
+            "--samples", "9", "--format", "json", "--output", directory
+        )
+
+        with ColumnReader(directory) as reader:
+            self.assertEqual(9, reader.rows)
+            self.assertAlmostEqual(
+                json.loads(output)["maximum_mean"],
+                sum(reader.column("maximum")) / 9,
+            )
+            self.assertEqual(9, reader.metadata["report"]["sessions"])
+            self.assertEqual(9, reader.metadata["spec"]["samples"])
+
+    def test_output_needs_one_worker(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parseArguments(["--output", "anywhere", "--workers", "2"])
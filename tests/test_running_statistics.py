@@ -0,0 +1,80 @@
+import math
+from unittest import TestCase
+
+from integer_statistics import IntegerStatistics
+from running_statistics import RunningStatistics, SessionStatistics
+
+
+class TestRunningStatistics(TestCase):
+    def setUp(self):
+        self.values = [10, 8, 13, 9, 11, 14, 6, 4, 12, 7, 5]
+        self.running = RunningStatistics()
+        for value in self.values:
+            self.running.add(value)
+
+    def test_mean_and_stdev_match_integer_statistics(self):
+        int_stat = IntegerStatistics(self.values)
+
+        self.assertAlmostEqual(int_stat.mean(), self.running.mean())
+        self.assertAlmostEqual(int_stat.stdev(), round(self.running.stdev(), 3))
+
+    def test_merge_matches_single_pass(self):
+        first, second = RunningStatistics(), RunningStatistics()
+        for value in self.values[:4]:
+            first.add(value)
+        for value in self.values[4:]:
+            second.add(value)
+
+        first.merge(second)
+
+        self.assertEqual(self.running.count, first.count)
+        self.assertAlmostEqual(self.running.mean(), first.mean())
+        self.assertAlmostEqual(self.running.stdev(), first.stdev())
+
+    def test_halfWidth_is_infinite_with_one_value(self):
+        single = RunningStatistics()
+        single.add(1)
+
+        self.assertEqual(math.inf, single.halfWidth())
+
+    def test_halfWidth_uses_normal_quantile(self):
+        expected_half_width = 1.959964 * self.running.stdev() / math.sqrt(11)
+
+        self.assertAlmostEqual(expected_half_width, self.running.halfWidth(), places=5)
+
+
+class TestSessionStatistics(TestCase):
+    def test_precise_checks_both_metrics(self):
+        statistics = SessionStatistics()
+        for duration, maximum in [(10, 100), (10, 300), (10, 100), (10, 300)]:
+            statistics.add(duration, maximum)
+
+        self.assertEqual(4, statistics.sessions)
+        self.assertFalse(statistics.precise())
+        self.assertFalse(statistics.precise(width=1))
+        self.assertTrue(statistics.precise(width=500))
+        self.assertTrue(statistics.precise(relativeError=0.9))
+
+    def test_report_summarizes_both_metrics(self):
+        statistics = SessionStatistics()
+        statistics.add(10, 100)
+        statistics.add(20, 300)
+
+        report = statistics.report()
+
+        self.assertEqual(2, report["sessions"])
+        self.assertEqual(15, report["duration_mean"])
+        self.assertEqual(200, report["maximum_mean"])
+        self.assertAlmostEqual(
+            statistics.maxima.halfWidth(), report["maximum_half_width"]
+        )
+
+    def test_asDict_round_trips(self):
+        statistics = SessionStatistics()
+        for duration, maximum in ((10, 120), (4, 100), (250, 90)):
+            statistics.add(duration, maximum)
+        statistics.elapsed = 1.5
+
+        restored = SessionStatistics.fromDict(statistics.asDict())
+
+        self.assertEqual(statistics.report(), restored.report())
@@ -0,0 +1,111 @@
+import asyncio
+import json
+from concurrent.futures import Future
+from unittest import IsolatedAsyncioTestCase
+
+from server import SimulationServer
+from worker_pool import Job, WarmPool
+from simulation_spec import SimulationSpec
+from players.martingale import Martingale
+
+
+class TestSimulationServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = WarmPool(workers=1, strategies=[Martingale], chunk=5)
+        self.addCleanup(self.pool.shutdown, True)
+        self.simulation = SimulationServer(self.pool)
+        self.server = await self.simulation.serve(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def request(self, method, path, body=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        payload = b"" if body is None else json.dumps(body).encode()
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        head, _, content = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), content
+
+    async def test_identical_requests_share_a_job(self):
+        spec = {"strategy": "players.martingale:Martingale", "samples": 20}
+
+        first = json.loads((await self.request("POST", "/jobs", spec))[1])
+        second = json.loads((await self.request("POST", "/jobs", spec))[1])
+
+        self.assertEqual(first["id"], second["id"])
+        self.assertEqual(1, len(self.simulation.jobs) + len(self.simulation.finished))
+
+    async def test_progress_streams_until_report(self):
+        spec = {"strategy": "players.martingale:Martingale", "samples": 20, "seed": 3}
+        key = json.loads((await self.request("POST", "/jobs", spec))[1])["id"]
+
+        status, content = await self.request("GET", f"/jobs/{key}/progress")
+
+        lines = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(200, status)
+        self.assertEqual(4, lines[-1]["done"])
+        self.assertEqual(20, lines[-1]["report"]["sessions"])
+        status, content = await self.request("GET", f"/jobs/{key}")
+        self.assertEqual(lines[-1], json.loads(content))
+
+    async def test_queue_reports_depth(self):
+        status, content = await self.request("GET", "/queue")
+
+        self.assertEqual(200, status)
+        self.assertEqual({"jobs": 0, "chunks": 0}, json.loads(content))
+
+    async def test_errors(self):
+        self.assertEqual(404, (await self.request("GET", "/jobs/missing"))[0])
+        self.assertEqual(404, (await self.request("GET", "/elsewhere"))[0])
+        self.assertEqual(
+            400, (await self.request("POST", "/jobs", {"strategy": "nowhere:X"}))[0]
+        )
+
+    async def test_rejects_strategies_outside_players(self):
+        for strategy in ("os:system", "players.martingale:Bet", "players:os.path"):
+            status, content = await self.request(
+                "POST", "/jobs", {"strategy": strategy}
+            )
+
+            self.assertEqual(400, status)
+            self.assertIn("error", json.loads(content))
+
+    async def test_finished_jobs_are_pruned(self):
+        spec = {"strategy": "players.martingale:Martingale", "samples": 5}
+        key = json.loads((await self.request("POST", "/jobs", spec))[1])["id"]
+        await asyncio.wrap_future(self.simulation.jobs[key].futures[-1])
+
+        self.assertEqual({"jobs": 0, "chunks": 0}, self.simulation.queueDepth())
+        self.assertEqual({}, self.simulation.jobs)
+        self.assertIn(key, self.simulation.finished)
+        status, content = await self.request("GET", f"/jobs/{key}/progress")
+        self.assertEqual(200, status)
+        self.assertEqual(5, json.loads(content)["report"]["sessions"])
+
+    async def test_report_of_one_session_is_valid_json(self):
+        spec = {"strategy": "players.martingale:Martingale", "samples": 1}
+        key = json.loads((await self.request("POST", "/jobs", spec))[1])["id"]
+
+        content = (await self.request("GET", f"/jobs/{key}/progress"))[1]
+
+        report = json.loads(content.splitlines()[-1])["report"]
+        self.assertIsNone(report["duration_half_width"])
+
+    def test_status_reports_failed_chunk(self):
+        failed: Future = Future()
+        failed.set_exception(RuntimeError("boom"))
+        job = Job(SimulationSpec(Martingale, samples=1), [failed])
+
+        status = SimulationServer.status("key", job)
+
+        self.assertIn("boom", status["error"])
+        self.assertNotIn("report", status)
@@ -2,6 +2,7 @@ from unittest import TestCase
 from table import Table
 from bet import Bet
 from outcome import Outcome
+from bin import Bin
 from players.seven_reds import SevenReds
 
 
@@ -34,3 +35,32 @@ class TestSevenReds(TestCase):
         expected_redCount_value = 7
 
         self.assertEqual(expected_redCount_value, self.seven_reds.redCount)
+
+    def test_winnersMask_reduces_redCount_when_redBit_is_set(self):
+        red_bin = Bin([Outcome("Red", 1), Outcome("1", 35)])
+        self.seven_reds.winnersMask(red_bin.mask)
+
+        expected_redCount_value = 6
+
+        self.assertEqual(expected_redCount_value, self.seven_reds.redCount)
+
+    def test_winnersMask_resets_redCount_when_redBit_is_not_set(self):
+        self.seven_reds.redCount = 1
+        black_bin = Bin([Outcome("Black", 1), Outcome("2", 35)])
+        self.seven_reds.winnersMask(black_bin.mask)
+
+        expected_redCount_value = 7
+
+        self.assertEqual(expected_redCount_value, self.seven_reds.redCount)
+
+    def test_restore_returns_to_snapshot_state(self):
+        self.seven_reds.redCount = 3
+        self.seven_reds.losscount = 2
+        snapshot = self.seven_reds.snapshot()
+        self.seven_reds.redCount = 7
+        self.seven_reds.losscount = 0
+
+        self.seven_reds.restore(snapshot)
+
+        self.assertEqual(3, self.seven_reds.redCount)
+        self.assertEqual(2, self.seven_reds.losscount)
@@ -0,0 +1,85 @@
+import json
+from unittest import TestCase
+
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+from players.random import PlayerRandom
+
+
+class TestSimulationSpec(TestCase):
+    def setUp(self):
+        self.wheel = buildWheel()
+        self.spec = SimulationSpec(
+            Martingale, stake=50, duration=20, limit=100, samples=6, seed=7
+        )
+
+    def test_build_configures_simulator(self):
+        simulator = self.spec.build(self.wheel)
+
+        self.assertIsInstance(simulator.player, Martingale)
+        self.assertEqual(50, simulator.initStake)
+        self.assertEqual(20, simulator.initDuration)
+        self.assertEqual(100, simulator.player.table.limit)
+        self.assertEqual(6, simulator.samples)
+
+    def test_build_passes_wheel_to_strategies_which_need_it(self):
+        simulator = SimulationSpec(Passenger57).build(self.wheel)
+
+        self.assertIs(self.wheel, simulator.player.wheel)
+
+    def test_run_results_do_not_depend_on_chunking(self):
+        whole = self.spec.run(self.wheel)
+        first = self.spec.run(self.wheel, 0, 2)
+        second = self.spec.run(self.wheel, 2, 4)
+        first.merge(second)
+
+        self.assertEqual(6, whole.sessions)
+        self.assertEqual(whole.sessions, first.sessions)
+        self.assertAlmostEqual(whole.maxima.mean(), first.maxima.mean())
+        self.assertAlmostEqual(whole.durations.stdev(), first.durations.stdev())
+
+    def test_run_is_reproducible_with_player_rng(self):
+        spec = SimulationSpec(PlayerRandom, samples=4, seed=3)
+
+        self.assertEqual(
+            spec.run(self.wheel).report()["maximum_mean"],
+            spec.run(self.wheel).report()["maximum_mean"],
+        )
+
+    def test_player_and_wheel_draw_independently(self):
+        spec = SimulationSpec(
+            PlayerRandom, stake=1000, duration=100, samples=1000, seed=1
+        )
+        shared = spec.sessions(self.wheel)
+        simulator = spec.build(self.wheel)
+        simulator.player.reseed(11)
+        self.wheel.rng.seed(22)
+        independent = (simulator.runSession() for _ in range(spec.samples))
+
+        def netPerRound(sessions):
+            rounds = [stakes for stakes in sessions if stakes]
+            return sum(stakes[-1] - 1000 for stakes in rounds) / sum(map(len, rounds))
+
+        self.assertNotEqual(spec.sessionSeed(0, "player"), spec.sessionSeed(0, "wheel"))
+        self.assertAlmostEqual(
+            netPerRound(stakes for _, stakes in shared),
+            netPerRound(independent),
+            delta=0.08,
+        )
+
+    def test_run_collects_raw_results(self):
+        results = []
+
+        statistics = self.spec.run(self.wheel, results=results)
+
+        self.assertEqual(6, len(results))
+        self.assertAlmostEqual(
+            statistics.maxima.mean(), sum(maximum for _, maximum in results) / 6
+        )
+
+    def test_asDict_round_trips_through_json(self):
+        values = json.loads(json.dumps(self.spec.asDict()))
+
+        self.assertEqual("players.martingale:Martingale", values["strategy"])
+        self.assertEqual(self.spec, SimulationSpec.fromDict(values))
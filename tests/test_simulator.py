@@ -1,13 +1,21 @@
+import shutil
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 
 from unittest.mock import Mock, patch
 
 from simulator import Simulator
+from checkpoint import Checkpoint
 from game import Game
 from table import Table
 from wheel import Wheel
 from invalid_bet import InvalidBet
+from bin_builder import BinBuilder
 from players.martingale import Martingale
+from players.passenger57 import Passenger57
+from players.random import PlayerRandom
+from players.seven_reds import SevenReds
 
 
 class TestSimulator(TestCase):
@@ -53,3 +61,220 @@ class TestSimulator(TestCase):
         cycle_mock = Mock(name="cycle_mock", side_effect=InvalidBet)
         with patch("game.Game.cycle", cycle_mock):
             self.simulator.session()
+
+
+class TestScheduledSession(TestCase):
+    def setUp(self):
+        self.table = Table()
+        self.wheel = Wheel()
+        BinBuilder().buildBins(self.wheel)
+        self.game = Game(self.wheel, self.table)
+
+    def test_scheduled_session_matches_object_session(self):
+        simulator = Simulator(self.game, Passenger57(self.table, self.wheel))
+
+        self.wheel.rng.seed(1)
+        expected_stake_values = simulator.session()
+        self.wheel.rng.seed(1)
+        actual_stake_values = simulator.scheduledSession()
+
+        self.assertEqual(expected_stake_values, actual_stake_values)
+
+    def test_scheduled_session_stops_when_player_stops_playing(self):
+        player = PlayerRandom(self.table, self.wheel)
+        simulator = Simulator(self.game, player)
+        simulator.initStake = 3
+
+        self.wheel.rng.seed(1)
+        player.rng.seed(1)
+        expected_stake_values = simulator.session()
+        self.wheel.rng.seed(1)
+        player.rng.seed(1)
+        actual_stake_values = simulator.scheduledSession()
+
+        self.assertEqual(expected_stake_values, actual_stake_values)
+        self.assertFalse(player.playing())
+
+    def test_fast_engine_uses_schedule_only_for_outcome_independent_players(self):
+        scheduled_mock = Mock(name="scheduled_mock", return_value=[1])
+        session_mock = Mock(name="session_mock", return_value=[1])
+        passenger = Simulator(self.game, Passenger57(self.table, self.wheel))
+        martingale = Simulator(self.game, Martingale(self.table))
+        passenger.engine = martingale.engine = "fast"
+
+        with patch("simulator.Simulator.scheduledSession", scheduled_mock):
+            with patch("simulator.Simulator.fastSession", session_mock):
+                passenger.runSession()
+                martingale.runSession()
+
+        scheduled_mock.assert_called_once()
+        session_mock.assert_called_once()
+
+
+class TestBranch(TestCase):
+    def setUp(self):
+        table = Table()
+        wheel = Wheel()
+        BinBuilder().buildBins(wheel)
+        self.simulator = Simulator(Game(wheel, table), Martingale(table))
+
+    def test_branch_replays_continuation_from_snapshot(self):
+        self.simulator.player.stake = self.simulator.initStake
+        self.simulator.player.roundsToGo = 20
+        snapshot = self.simulator.snapshot()
+
+        continuations = self.simulator.branch(snapshot, [1, 2, 1])
+
+        self.assertEqual(continuations[0], continuations[2])
+        self.assertNotEqual(continuations[0], continuations[1])
+
+    def test_session_result_unchanged_by_restore(self):
+        snapshot = self.simulator.snapshot()
+        expected_stake_values = self.simulator.session()
+
+        self.simulator.restore(snapshot)
+
+        self.assertEqual(expected_stake_values, self.simulator.session())
+
+
+class TestFastSession(TestCase):
+    def setUp(self):
+        table = Table()
+        self.wheel = Wheel()
+        BinBuilder().buildBins(self.wheel)
+        self.simulator = Simulator(Game(self.wheel, table), SevenReds(table))
+
+    def test_fast_session_matches_object_session(self):
+        self.wheel.rng.seed(1)
+        expected_stake_values = self.simulator.session()
+        self.wheel.rng.seed(1)
+        actual_stake_values = self.simulator.fastSession()
+
+        self.assertEqual(expected_stake_values, actual_stake_values)
+
+    def test_fast_session_ends_on_table_limit_like_object_session(self):
+        self.simulator.player = Martingale(self.simulator.player.table)
+        self.simulator.player.table.limit = 4
+        self.simulator.initStake = 1000
+
+        self.wheel.rng.seed(3)
+        expected_stake_values = self.simulator.session()
+        self.wheel.rng.seed(3)
+        actual_stake_values = self.simulator.fastSession()
+
+        self.assertEqual(expected_stake_values, actual_stake_values)
+        self.assertTrue(len(actual_stake_values) < self.simulator.initDuration)
+
+
+class TestGatherUntil(TestCase):
+    def setUp(self):
+        table = Table()
+        wheel = Wheel()
+        BinBuilder().buildBins(wheel)
+        wheel.rng.seed(1)
+        self.simulator = Simulator(Game(wheel, table), Passenger57(table, wheel))
+        self.simulator.samples = 10
+
+    def test_gather_until_stops_at_max_sessions(self):
+        statistics = self.simulator.gatherUntil(width=0.0, maxSessions=25)
+
+        self.assertEqual(25, statistics.sessions)
+        self.assertEqual(0, len(self.simulator.durations))
+
+    def test_gather_until_counts_sessions_which_never_start(self):
+        table = Table()
+        simulator = Simulator(Game(self.simulator.game.wheel, table), Martingale(table))
+        simulator.initStake = 0
+
+        statistics = simulator.gatherUntil(width=0.0, maxSessions=5)
+
+        self.assertEqual(5, statistics.sessions)
+        self.assertEqual(0, statistics.durations.mean())
+        self.assertEqual(0, statistics.maxima.mean())
+
+    def test_gather_until_stops_when_precise(self):
+        statistics = self.simulator.gatherUntil(relativeError=0.5)
+
+        self.assertEqual(10, statistics.sessions)
+        self.assertTrue(statistics.precise(relativeError=0.5))
+
+    def test_gather_until_needs_a_target(self):
+        with self.assertRaises(ValueError):
+            self.simulator.gatherUntil(maxSessions=25)
+
+    def test_gather_until_needs_samples(self):
+        self.simulator.samples = 0
+
+        with self.assertRaises(ValueError):
+            self.simulator.gatherUntil(relativeError=0.5)
+
+    def test_gather_for_fills_the_budget(self):
+        statistics = self.simulator.gatherFor(0.05)
+
+        self.assertTrue(statistics.sessions >= self.simulator.samples)
+        self.assertEqual(0, len(self.simulator.durations))
+        self.assertTrue(statistics.elapsed < 0.5)
+
+    def test_gather_for_probes_before_large_batches(self):
+        self.simulator.samples = 1_000_000
+
+        statistics = self.simulator.gatherFor(0.02)
+
+        self.assertTrue(statistics.sessions > 0)
+        self.assertTrue(statistics.elapsed < 0.5)
+
+    def test_gather_for_runs_nothing_with_no_budget(self):
+        statistics = self.simulator.gatherFor(0)
+
+        self.assertEqual(0, statistics.sessions)
+
+
+class TestGatherCheckpointed(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = Path(directory) / "gather.ckpt"
+
+    @staticmethod
+    def simulator(samples):
+        table = Table()
+        table.limit = 100
+        wheel = Wheel()
+        BinBuilder().buildBins(wheel)
+        wheel.rng.seed(11)
+        simulator = Simulator(Game(wheel, table), PlayerRandom(table, wheel))
+        simulator.player.rng.seed(12)
+        simulator.initDuration = 30
+        simulator.samples = samples
+        return simulator
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        checkpoint = Checkpoint(self.path, interval=4)
+        self.simulator(10).gatherCheckpointed(checkpoint)
+
+        resumed = self.simulator(25).gatherCheckpointed(checkpoint)
+        uninterrupted = self.simulator(25).gatherCheckpointed(
+            Checkpoint(self.path.with_name("other.ckpt"), interval=4)
+        )
+
+        self.assertEqual(25, resumed.sessions)
+        self.assertEqual(25, checkpoint.load(self.simulator(25).identity())[0])
+        self.assertEqual(uninterrupted.durations.state(), resumed.durations.state())
+        self.assertEqual(uninterrupted.maxima.state(), resumed.maxima.state())
+
+    def test_refuses_checkpoint_of_another_run(self):
+        checkpoint = Checkpoint(self.path, interval=4)
+        self.simulator(10).gatherCheckpointed(checkpoint)
+        other = self.simulator(10)
+        other.initStake = 50
+
+        with self.assertRaises(ValueError):
+            other.gatherCheckpointed(checkpoint)
+
+    def test_resume_false_starts_over(self):
+        checkpoint = Checkpoint(self.path, interval=4)
+        self.simulator(10).gatherCheckpointed(checkpoint)
+
+        statistics = self.simulator(6).gatherCheckpointed(checkpoint, resume=False)
+
+        self.assertEqual(6, statistics.sessions)
@@ -0,0 +1,80 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from sqlite_sink import SqliteSink
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+
+MARTINGALE = "players.martingale:Martingale"
+
+
+class TestSqliteSink(TestCase):
+    def setUp(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        self.sink = SqliteSink(directory / "results.db")
+        self.addCleanup(self.sink.close)
+        self.sink.batch = 7
+        self.wheel = buildWheel()
+
+    def test_records_every_session(self):
+        spec = SimulationSpec(Martingale, samples=30, seed=5)
+        results = []
+        expected = spec.run(self.wheel, results=results)
+
+        run, statistics = self.sink.record(spec, self.wheel)
+
+        rows = self.sink.find(MARTINGALE)
+        self.assertEqual(30, statistics.sessions)
+        self.assertAlmostEqual(expected.maxima.mean(), statistics.maxima.mean())
+        self.assertEqual(list(range(30)), [row[2] for row in rows])
+        self.assertEqual(results, [(row[3], row[4]) for row in rows])
+        self.assertEqual({run}, {row[0] for row in rows})
+        self.assertEqual(
+            (30, 300),
+            self.sink.connection.execute(
+                "SELECT sessions, table_limit FROM runs WHERE id = ?", (run,)
+            ).fetchone(),
+        )
+
+    def test_final_stake_of_each_session(self):
+        spec = SimulationSpec(Passenger57, samples=3, duration=10)
+        self.sink.record(spec, self.wheel)
+
+        finals = [row[5] for row in self.sink.find("players.passenger57:Passenger57")]
+
+        self.assertEqual(
+            [stakes[-1] for _, stakes in spec.sessions(self.wheel)], finals
+        )
+
+    def test_find_filters_by_limit_and_maximum(self):
+        for limit in (100, 300):
+            self.sink.record(
+                SimulationSpec(Martingale, samples=40, limit=limit), self.wheel
+            )
+        self.sink.record(SimulationSpec(Passenger57, samples=5), self.wheel)
+
+        rows = self.sink.find(MARTINGALE, limit=300, minimum=150)
+
+        runs = dict(self.sink.connection.execute("SELECT id, table_limit FROM runs"))
+        self.assertTrue(rows)
+        self.assertTrue(all(row[4] > 150 and runs[row[0]] == 300 for row in rows))
+
+    def test_uses_wal_and_indexes(self):
+        connection = self.sink.connection
+        plan = " ".join(
+            str(row)
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT session FROM runs JOIN sessions "
+                "ON sessions.run = runs.id "
+                "WHERE strategy = ? AND table_limit = ? AND maximum > ?",
+                (MARTINGALE, 300, 500),
+            )
+        )
+
+        self.assertEqual("wal", connection.execute("PRAGMA journal_mode").fetchone()[0])
+        self.assertIn("runs_parameters", plan)
+        self.assertIn("sessions_maximum", plan)
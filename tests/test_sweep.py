@@ -0,0 +1,80 @@
+import random
+from unittest import TestCase
+
+from simulation_spec import SimulationSpec
+from sweep import Sweep
+from worker_pool import WarmPool
+from players.martingale import Martingale
+from players.fibonacci import PlayerFibonacci
+
+
+class TestSweep(TestCase):
+    def setUp(self):
+        self.sweep = Sweep(
+            [Martingale, PlayerFibonacci],
+            stakes=range(50, 151, 10),
+            durations=[10, 20],
+            limits=[100, 300],
+        )
+        self.sweep.template = SimulationSpec(Martingale, samples=3, seed=5)
+
+    def test_grid_has_one_cell_per_combination(self):
+        cells = self.sweep.grid()
+
+        self.assertEqual(2 * 11 * 2 * 2, len(cells))
+        self.assertEqual(len(cells), len(set(cells)))
+        self.assertTrue(all(cell.samples == 3 for cell in cells))
+
+    def test_latin_hypercube_covers_each_axis_evenly(self):
+        cells = self.sweep.latinHypercube(4, random.Random(1))
+
+        self.assertEqual(4, len(cells))
+        self.assertEqual(2, sum(cell.strategy is Martingale for cell in cells))
+        self.assertEqual(2, sum(cell.limit == 100 for cell in cells))
+        stakes = sorted(cell.stake for cell in cells)
+        self.assertTrue(stakes[0] < 80 and stakes[-1] >= 130)
+
+    def test_random_design_draws_values_from_axes(self):
+        cells = self.sweep.randomDesign(5, random.Random(1))
+
+        self.assertEqual(5, len(cells))
+        self.assertTrue(all(cell.stake in self.sweep.stakes for cell in cells))
+
+    def test_run_emits_one_row_per_cell(self):
+        cells = self.sweep.grid()[:3]
+
+        rows = list(self.sweep.run(cells))
+
+        self.assertEqual(3, len(rows))
+        self.assertEqual("Martingale", rows[0]["strategy"])
+        self.assertEqual(3, rows[0]["sessions"])
+
+    def test_worker_pool_matches_single_process(self):
+        cells = self.sweep.grid()[:4]
+
+        serial = list(self.sweep.run(cells))
+        parallel = list(self.sweep.run(cells, workers=2))
+
+        for expected, actual in zip(serial, parallel):
+            self.assertEqual(expected["maximum_mean"], actual["maximum_mean"])
+            self.assertEqual(expected["duration_mean"], actual["duration_mean"])
+
+    def test_run_on_warm_pool(self):
+        cells = self.sweep.grid()[:3]
+
+        with WarmPool(workers=2, strategies=self.sweep.strategies) as pool:
+            rows = list(self.sweep.run(cells, pool=pool))
+
+        for expected, actual in zip(self.sweep.run(cells), rows):
+            self.assertEqual(expected["strategy"], actual["strategy"])
+            self.assertAlmostEqual(expected["maximum_mean"], actual["maximum_mean"])
+
+    def test_run_accepts_sessions_which_never_start(self):
+        sweep = Sweep([Martingale], stakes=[0, 100])
+        sweep.template = SimulationSpec(Martingale, samples=3)
+
+        rows = list(sweep.run(sweep.grid()))
+
+        self.assertEqual(0, rows[0]["duration_mean"])
+        self.assertEqual(0, rows[0]["maximum_mean"])
+        self.assertTrue(rows[1]["duration_mean"] > 0)
@@ -72,3 +72,16 @@ class TestTable(TestCase):
         expected_result_with_bets = f"Table({repr_string})"
 
         self.assertEqual(expected_result_with_bets, repr_result_with_bets)
+
+    def test_withinLimit_reports_table_limit(self):
+        self.table.placeBet(self.bet2)
+        self.assertTrue(self.table.withinLimit())
+
+        self.table.placeBet(self.bet1)
+        self.assertFalse(self.table.withinLimit())
+
+    def test_placeValidBet_refuses_bet_over_table_limit(self):
+        self.assertTrue(self.table.placeValidBet(self.bet2))
+        self.assertFalse(self.table.placeValidBet(self.bet1))
+
+        self.assertEqual([self.bet2], self.table.bets)
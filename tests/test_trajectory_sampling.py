@@ -0,0 +1,92 @@
+import shutil
+import tempfile
+from collections import Counter
+from unittest import TestCase
+
+from trajectory_sampling import EveryKth, Matching, Reservoir, TrajectorySampler
+from trajectory_store import TrajectoryReader, TrajectoryWriter
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestSamplers(TestCase):
+    def test_every_kth(self):
+        sampler = EveryKth(3)
+        for index in range(10):
+            sampler.offer(index, [index])
+
+        self.assertEqual([0, 3, 6, 9], sorted(sampler.captured))
+        with self.assertRaises(ValueError):
+            EveryKth(0)
+
+    def test_matching(self):
+        sampler = Matching(lambda stakes: max(stakes, default=0) > 300)
+        sampler.offer(0, [100, 310])
+        sampler.offer(1, [100, 200])
+        sampler.offer(2, [])
+
+        self.assertEqual([0], list(sampler.captured))
+        self.assertEqual([100, 310], list(sampler.captured[0]))
+
+    def test_reservoir_keeps_size_sessions(self):
+        sampler = Reservoir(5, seed=1)
+        for index in range(100):
+            sampler.offer(index, [index])
+
+        self.assertEqual(5, len(sampler.captured))
+        self.assertEqual(sorted(sampler.slots), sorted(sampler.captured))
+        for index, stakes in sampler.captured.items():
+            self.assertEqual([index], list(stakes))
+
+    def test_reservoir_is_uniform(self):
+        counts: Counter = Counter()
+        for seed in range(2000):
+            sampler = Reservoir(2, seed=seed)
+            for index in range(10):
+                sampler.offer(index, [])
+            counts.update(list(sampler.captured))
+
+        for index in range(10):
+            self.assertAlmostEqual(0.2, counts[index] / 2000, delta=0.04)
+
+    def test_base_sampler_keeps_nothing(self):
+        sampler = TrajectorySampler()
+        sampler.offer(0, [1])
+
+        self.assertEqual({}, sampler.captured)
+
+    def test_write_in_session_order(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        sampler = TrajectorySampler()
+        sampler.captured = {4: [40], 1: [10, 11]}
+
+        with TrajectoryWriter(directory) as writer:
+            self.assertEqual([1, 4], sampler.write(writer))
+
+        with TrajectoryReader(directory) as reader:
+            self.assertEqual([[10, 11], [40]], [view.tolist() for view in reader])
+
+
+class TestGatherSampled(TestCase):
+    def test_summarizes_every_session_and_keeps_the_sample(self):
+        spec = SimulationSpec(Martingale, samples=30, seed=2)
+        wheel = buildWheel()
+        wheel.rng.seed(2)
+        full = spec.build(wheel)
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with TrajectoryWriter(directory) as writer:
+            expected = full.gatherTrajectories(writer)
+        wheel.rng.seed(2)
+        sampler = EveryKth(10)
+
+        statistics = spec.build(wheel).gatherSampled(sampler)
+
+        self.assertEqual(30, statistics.sessions)
+        self.assertAlmostEqual(expected.maxima.mean(), statistics.maxima.mean())
+        with TrajectoryReader(directory) as reader:
+            for index in (0, 10, 20):
+                self.assertEqual(
+                    reader[index].tolist(), sampler.captured[index].tolist()
+                )
@@ -0,0 +1,100 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from trajectory_store import OFFSETS, STAKES, TrajectoryReader, TrajectoryWriter
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+
+
+class TestTrajectoryStore(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_ragged_sessions_round_trip(self):
+        sessions = [[100, 101, 99], [], [100], list(range(50))]
+        writer = TrajectoryWriter(self.directory)
+        writer.buffer = 4
+        with writer:
+            for stakes in sessions:
+                writer.append(stakes)
+
+        with TrajectoryReader(self.directory) as reader:
+            self.assertEqual(len(sessions), len(reader))
+            self.assertEqual(sessions, [view.tolist() for view in reader])
+            self.assertEqual([100], reader[-2].tolist())
+            self.assertEqual(50, reader.duration(3))
+            self.assertEqual(4 * 54, (self.directory / STAKES).stat().st_size)
+            with self.assertRaises(IndexError):
+                reader.bounds(4)
+
+    def test_views_share_the_map(self):
+        with TrajectoryWriter(self.directory) as writer:
+            writer.append([7, 8, 9])
+
+        with TrajectoryReader(self.directory) as reader:
+            view = reader[0]
+            self.assertEqual("i", view.format)
+            self.assertIs(reader.stakes.obj, view.obj)
+            view.release()
+
+    def test_empty_store(self):
+        with TrajectoryWriter(self.directory):
+            pass
+
+        with TrajectoryReader(self.directory) as reader:
+            self.assertEqual(0, len(reader))
+
+    def test_rejects_overflow_without_partial_writes(self):
+        with TrajectoryWriter(self.directory) as writer:
+            with self.assertRaises(OverflowError):
+                writer.append([1, 2**40])
+            writer.append([3])
+
+        with TrajectoryReader(self.directory) as reader:
+            self.assertEqual([[3]], [view.tolist() for view in reader])
+
+    def test_rejects_truncated_stakes(self):
+        with TrajectoryWriter(self.directory) as writer:
+            writer.append([1, 2, 3])
+        with (self.directory / STAKES).open("r+b") as file:
+            file.truncate(4)
+
+        with self.assertRaises(ValueError):
+            TrajectoryReader(self.directory)
+
+    def test_unclosed_writer_leaves_no_index(self):
+        writer = TrajectoryWriter(self.directory)
+        writer.append([1])
+
+        self.assertFalse((self.directory / OFFSETS).exists())
+        writer.close()
+        self.assertTrue((self.directory / OFFSETS).exists())
+
+
+class TestGatherTrajectories(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_stores_every_session(self):
+        spec = SimulationSpec(Martingale, samples=20, seed=4)
+        simulator = spec.build(buildWheel())
+        simulator.game.wheel.rng.seed(4)
+
+        with TrajectoryWriter(self.directory) as writer:
+            statistics = simulator.gatherTrajectories(writer)
+
+        with TrajectoryReader(self.directory) as reader:
+            self.assertEqual(20, len(reader))
+            self.assertEqual(20, statistics.sessions)
+            self.assertAlmostEqual(
+                statistics.durations.mean(),
+                sum(reader.duration(index) for index in range(20)) / 20,
+            )
+            self.assertAlmostEqual(
+                statistics.maxima.mean(),
+                sum(max(view, default=100) for view in reader) / 20,
+            )
@@ -54,3 +54,42 @@ class TestWheel(TestCase):
     def test_getOutcome_raises_error_for_invalid_name(self):
         with self.assertRaises(KeyError):
             self.wheel.getOutcome("Invalid name")
+
+    def test_restore_repeats_spins(self):
+        snapshot = self.wheel.snapshot()
+        first_spins = [self.wheel.choose() for _ in range(5)]
+
+        self.wheel.restore(snapshot)
+
+        self.assertEqual(first_spins, [self.wheel.choose() for _ in range(5)])
+
+    def test_addOutcome_interns_outcomes(self):
+        self.wheel.addOutcome(1, Outcome("Red", 1))
+        self.wheel.addOutcome(3, Outcome("Red", 1))
+
+        self.assertIs(Outcome.intern("Red", 1), self.wheel.getOutcome("Red"))
+        self.assertIn(Outcome.intern("Red", 1), self.wheel.get(3))
+
+    def test_clone_shares_bins_but_not_rng(self):
+        self.wheel.addOutcome(0, self.oc1)
+
+        clone = self.wheel.clone()
+
+        self.assertIs(self.wheel.bins, clone.bins)
+        self.assertIs(self.wheel.getOutcome("Red"), clone.getOutcome("Red"))
+        self.assertIsNot(self.wheel.rng, clone.rng)
+
+    def test_clone_precomputes_bin_masks(self):
+        self.wheel.addOutcome(0, self.oc1)
+
+        self.wheel.clone()
+
+        self.assertTrue(all("mask" in vars(bin) for bin in self.wheel.bins))
+
+    def test_addOutcome_keeps_rational_odds(self):
+        six_five = Outcome("Six Five", 6, 5)
+
+        self.wheel.addOutcome(1, six_five)
+
+        self.assertIn(six_five, self.wheel.bins[1])
+        self.assertEqual(5, self.wheel.getOutcome("Six Five").denominator)
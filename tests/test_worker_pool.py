@@ -0,0 +1,56 @@
+import multiprocessing
+from concurrent.futures import CancelledError
+from unittest import TestCase
+
+from worker_pool import WarmPool
+from simulation_spec import SimulationSpec, buildWheel
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+
+
+class TestWarmPool(TestCase):
+    def setUp(self):
+        self.pool = WarmPool(workers=2, strategies=[Martingale, Passenger57], chunk=4)
+        self.addCleanup(self.pool.shutdown, True)
+
+    def test_runs_many_jobs_on_the_same_workers(self):
+        specs = [
+            SimulationSpec(strategy, duration=20, samples=10, seed=seed)
+            for seed in range(3)
+            for strategy in (Martingale, Passenger57)
+        ]
+
+        results = [self.pool.run(spec) for spec in specs]
+
+        wheel = buildWheel()
+        for spec, statistics in zip(specs, results):
+            self.assertEqual(10, statistics.sessions)
+            self.assertAlmostEqual(
+                spec.run(wheel).maxima.mean(), statistics.maxima.mean()
+            )
+
+    def test_start_launches_every_worker(self):
+        self.pool.start()
+
+        self.assertGreaterEqual(len(multiprocessing.active_children()), 2)
+        self.assertEqual(
+            3, self.pool.run(SimulationSpec(Martingale, samples=3)).sessions
+        )
+
+    def test_cancelled_job_raises(self):
+        blocker = self.pool.submit(SimulationSpec(Passenger57, samples=40))
+        job = self.pool.submit(SimulationSpec(Martingale, samples=400))
+
+        job.cancel()
+
+        self.assertTrue(job.cancelled())
+        with self.assertRaises(CancelledError):
+            job.result()
+        self.assertEqual(40, blocker.result().sessions)
+
+    def test_context_manager_shuts_down(self):
+        with WarmPool(workers=1) as pool:
+            job = pool.submit(SimulationSpec(Martingale, samples=3))
+
+        self.assertTrue(job.done())
+        self.assertEqual(3, job.result().sessions)